@@ -5,7 +5,7 @@ Accounts App Admin
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .models import UserProfile, UserContentStats
 
 
 class UserProfileInline(admin.StackedInline):
@@ -36,3 +36,19 @@ class UserProfileAdmin(admin.ModelAdmin):
     search_fields = ('user__username', 'user__email', 'location')
     readonly_fields = ('created_at', 'updated_at')
 
+
+
+@admin.register(UserContentStats)
+class UserContentStatsAdmin(admin.ModelAdmin):
+    """UserContentStats admin"""
+    list_display = ('user', 'projects_count', 'skills_count', 'education_count',
+                    'certifications_count', 'services_count', 'updated_at')
+    search_fields = ('user__username',)
+    readonly_fields = ('updated_at',)
+    actions = ['rebuild_stats']
+
+    def rebuild_stats(self, request, queryset):
+        for user_id in queryset.values_list('user_id', flat=True):
+            UserContentStats.rebuild(user_id)
+        self.message_user(request, f'{queryset.count()} stats row(s) rebuilt.')
+    rebuild_stats.short_description = 'Rebuild selected counters'
@@ -6,6 +6,7 @@ Registration, Login, and Profile Management Forms
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.models import User
+from core.slugs import allocate_unique_value
 from .models import UserProfile
 
 
@@ -70,12 +71,7 @@ class UserRegistrationForm(UserCreationForm):
         # Generate unique username from email
         email = self.cleaned_data['email']
         base_username = email.split('@')[0]
-        username = base_username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}{counter}"
-            counter += 1
-        user.username = username
+        user.username = allocate_unique_value(User.objects.all(), 'username', base_username, separator='')
         user.email = email
         if commit:
             user.save()
@@ -0,0 +1,32 @@
+"""
+Management command to rebuild the materialized UserContentStats counters
+"""
+
+from django.core.management.base import BaseCommand
+from django.contrib.auth.models import User
+from accounts.models import UserContentStats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes dashboard content counters for every user (or one user)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Only rebuild counters for this username')
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by('pk')
+        if options['user']:
+            users = users.filter(username=options['user'])
+            if not users.exists():
+                self.stdout.write(self.style.ERROR(f"❌ No user named {options['user']}"))
+                return
+
+        rebuilt_count = 0
+        for user_id, username in users.values_list('pk', 'username').iterator():
+            try:
+                UserContentStats.rebuild(user_id)
+                rebuilt_count += 1
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'❌ Failed to rebuild stats for {username}: {str(e)}'))
+
+        self.stdout.write(self.style.SUCCESS(f'🎉 Rebuilt content stats for {rebuilt_count} user(s)!'))
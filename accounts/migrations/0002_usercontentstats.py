@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserContentStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('projects_count', models.PositiveIntegerField(default=0)),
+                ('skills_count', models.PositiveIntegerField(default=0)),
+                ('education_count', models.PositiveIntegerField(default=0)),
+                ('certifications_count', models.PositiveIntegerField(default=0)),
+                ('services_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='content_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Content Stats',
+                'verbose_name_plural': 'User Content Stats',
+            },
+        ),
+    ]
@@ -3,10 +3,14 @@ Accounts App Models
 Extends Django's User model for user authentication and profiles
 """
 
+from django.apps import apps
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
 
 
 class UserProfile(models.Model):
@@ -60,6 +64,76 @@ class UserProfile(models.Model):
         return self.user.first_name or self.user.username
 
 
+class UserContentStats(models.Model):
+    """
+    Materialized per-user content counters shown on the dashboard.
+
+    Kept current incrementally by post_save/post_delete signals; a missing
+    row is rebuilt from a single UNION ALL count query.
+    """
+
+    # counter field -> model label
+    COUNTED_MODELS = {
+        'projects_count': 'core.Project',
+        'skills_count': 'education.Skill',
+        'education_count': 'education.Education',
+        'certifications_count': 'education.Certification',
+        'services_count': 'services.Service',
+    }
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='content_stats')
+
+    projects_count = models.PositiveIntegerField(default=0)
+    skills_count = models.PositiveIntegerField(default=0)
+    education_count = models.PositiveIntegerField(default=0)
+    certifications_count = models.PositiveIntegerField(default=0)
+    services_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'User Content Stats'
+        verbose_name_plural = 'User Content Stats'
+
+    def __str__(self):
+        return f"{self.user.username}'s Content Stats"
+
+    @classmethod
+    def compute_counts(cls, user_id):
+        """Count every tracked model for a user in one UNION ALL query"""
+        parts = [
+            apps.get_model(label).objects.filter(user_id=user_id)
+            .order_by()
+            .values('user')
+            .annotate(total=Count('pk'))
+            .values_list(Value(field, output_field=CharField()), 'total')
+            for field, label in cls.COUNTED_MODELS.items()
+        ]
+        counts = dict.fromkeys(cls.COUNTED_MODELS, 0)
+        counts.update(parts[0].union(*parts[1:], all=True))
+        return counts
+
+    @classmethod
+    def rebuild(cls, user_id):
+        """Recompute and store a user's counters"""
+        stats, _ = cls.objects.update_or_create(user_id=user_id, defaults=cls.compute_counts(user_id))
+        return stats
+
+    @classmethod
+    def for_user(cls, user):
+        """Return the user's stats row, building it on first use"""
+        stats = cls.objects.filter(user=user).first()
+        return stats if stats is not None else cls.rebuild(user.pk)
+
+    @classmethod
+    def adjust(cls, user_id, field, delta):
+        """Atomically add ``delta`` to one counter, never below 0; returns False if there is no row"""
+        updated = cls.objects.filter(user_id=user_id).update(
+            **{field: Greatest(F(field) + delta, 0), 'updated_at': timezone.now()}
+        )
+        return bool(updated)
+
+
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Create UserProfile when User is created"""
@@ -73,3 +147,28 @@ def save_user_profile(sender, instance, **kwargs):
     if hasattr(instance, 'user_profile'):
         instance.user_profile.save()
 
+
+
+def _counted_model_receivers():
+    """Connect counter updates for every model in UserContentStats.COUNTED_MODELS"""
+
+    for field, label in UserContentStats.COUNTED_MODELS.items():
+
+        def content_created(sender, instance, created, field=field, **kwargs):
+            if created and instance.user_id is not None:
+                if not UserContentStats.adjust(instance.user_id, field, 1):
+                    UserContentStats.rebuild(instance.user_id)
+
+        def content_deleted(sender, instance, field=field, **kwargs):
+            # Only adjust existing rows: during a cascading user delete a
+            # rebuilt row would reference the user being removed
+            if instance.user_id is not None:
+                UserContentStats.adjust(instance.user_id, field, -1)
+
+        post_save.connect(content_created, sender=label, weak=False,
+                          dispatch_uid=f'content_stats_created_{field}')
+        post_delete.connect(content_deleted, sender=label, weak=False,
+                            dispatch_uid=f'content_stats_deleted_{field}')
+
+
+_counted_model_receivers()
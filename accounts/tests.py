@@ -0,0 +1,86 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from core.models import Project
+from core.testing import QueryBudgetTestCase
+from education.models import Certification, Skill
+from accounts.forms import UserRegistrationForm
+from accounts.models import UserContentStats
+
+
+class UserContentStatsTests(QueryBudgetTestCase):
+    """Dashboard counters are maintained incrementally and can be rebuilt"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+
+    def stats(self):
+        return UserContentStats.objects.get(user=self.user)
+
+    def test_counters_follow_creates_and_deletes(self):
+        project = Project.objects.create(user=self.user, title='Portfolio', description='x')
+        Project.objects.create(user=self.user, title='Blog', description='x')
+        Skill.objects.create(user=self.user, name='Python', category='backend', proficiency=90)
+        self.assertEqual(self.stats().projects_count, 2)
+        self.assertEqual(self.stats().skills_count, 1)
+
+        project.title = 'Renamed'
+        project.save()
+        project.delete()
+        self.assertEqual(self.stats().projects_count, 1)
+
+    def test_decrement_stops_at_zero(self):
+        UserContentStats.rebuild(self.user.pk)
+        # A delete that was never counted (e.g. rows created with bulk_create)
+        self.assertTrue(UserContentStats.adjust(self.user.pk, 'projects_count', -1))
+        self.assertEqual(self.stats().projects_count, 0)
+
+    def test_compute_counts_is_one_query(self):
+        Certification.objects.create(
+            user=self.user, name='AWS', issuing_organization='Amazon', issue_date=date(2020, 1, 1),
+        )
+        with self.assertNumQueries(1):
+            counts = UserContentStats.compute_counts(self.user.pk)
+        self.assertEqual(counts['certifications_count'], 1)
+        self.assertEqual(counts['services_count'], 0)
+
+    def test_rebuild_command_repairs_drift(self):
+        Project.objects.create(user=self.user, title='Portfolio', description='x')
+        UserContentStats.objects.filter(user=self.user).update(projects_count=7)
+        call_command('rebuild_content_stats', stdout=StringIO())
+        self.assertEqual(self.stats().projects_count, 1)
+
+    def test_user_delete_cascades(self):
+        Project.objects.create(user=self.user, title='Portfolio', description='x')
+        self.user.delete()
+        self.assertFalse(UserContentStats.objects.exists())
+
+    def test_dashboard_reads_counters(self):
+        Project.objects.create(user=self.user, title='Portfolio', description='x')
+        self.client.force_login(self.user)
+        response = self.client.get('/accounts/dashboard/')
+        self.assertEqual(response.context['projects_count'], 1)
+
+
+class GeneratedUsernameTests(TestCase):
+    """Registration derives a unique username from the email address"""
+
+    def register(self, email):
+        form = UserRegistrationForm(data={
+            'email': email, 'first_name': 'Jane', 'last_name': 'Doe',
+            'password1': 'Str0ng-pass-phrase', 'password2': 'Str0ng-pass-phrase',
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        return form.save().username
+
+    def test_collisions_get_a_numeric_suffix(self):
+        self.assertEqual(self.register('jane@example.com'), 'jane')
+        self.assertEqual(self.register('jane@example.org'), 'jane1')
+
+        User.objects.create_user('jane10', 'x@example.com')
+        self.assertEqual(self.register('Jane@example.net'), 'jane2')
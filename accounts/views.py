@@ -15,7 +15,7 @@ from .forms import (
     UserUpdateForm,
     UserProfileUpdateForm
 )
-from .models import UserProfile
+from .models import UserProfile, UserContentStats
 
 
 class UserRegisterView(CreateView):
@@ -70,30 +70,24 @@ class UserLogoutView(LogoutView):
 def dashboard(request):
     """User dashboard - central hub for managing content"""
     from core.models import Project
-    from education.models import Skill, Education, Certification
-    from services.models import Service
 
     # Ensure user has a profile (create if doesn't exist)
     user_profile, created = UserProfile.objects.get_or_create(user=request.user)
     if created:
         messages.info(request, 'Profile created! Please update your information in Settings.')
 
-    # Get user's content counts (all filtered by user)
-    user_projects = Project.objects.filter(user=request.user)
-    user_skills = Skill.objects.filter(user=request.user)
-    user_education = Education.objects.filter(user=request.user)
-    user_certifications = Certification.objects.filter(user=request.user)
-    user_services = Service.objects.filter(user=request.user)
+    # Content counts come from the materialized stats row (one query)
+    stats = UserContentStats.for_user(request.user)
 
     context = {
         'title': 'Dashboard',
         'user_profile': user_profile,
-        'projects_count': user_projects.count(),
-        'skills_count': user_skills.count(),
-        'education_count': user_education.count(),
-        'certifications_count': user_certifications.count(),
-        'services_count': user_services.count(),
-        'recent_projects': user_projects[:5],
+        'projects_count': stats.projects_count,
+        'skills_count': stats.skills_count,
+        'education_count': stats.education_count,
+        'certifications_count': stats.certifications_count,
+        'services_count': stats.services_count,
+        'recent_projects': Project.objects.filter(user=request.user)[:5],
     }
 
     return render(request, 'accounts/dashboard.html', context)
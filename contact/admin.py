@@ -5,11 +5,12 @@ Contact App Admin Configuration
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
-from .models import ContactMessage, Newsletter
+from core.exports import ExportActionsMixin
+from .models import ContactMessage, Newsletter, NewsletterIssue, OutboundEmail
 
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(ExportActionsMixin, admin.ModelAdmin):
     """Admin interface for Contact Messages"""
 
     list_display = [
@@ -47,6 +48,11 @@ class ContactMessageAdmin(admin.ModelAdmin):
         }),
     )
 
+    export_fields = [
+        'id', 'created_at', 'name', 'email', 'phone', 'company', 'subject', 'message',
+        'status', 'priority', 'ip_address', 'read_at', 'replied_at',
+    ]
+
     actions = [
         'mark_as_read', 'mark_as_replied', 'mark_as_archived',
         'set_priority_high', 'set_priority_urgent'
@@ -141,7 +147,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
 
 
 @admin.register(Newsletter)
-class NewsletterAdmin(admin.ModelAdmin):
+class NewsletterAdmin(ExportActionsMixin, admin.ModelAdmin):
     """Admin interface for Newsletter Subscriptions"""
 
     list_display = [
@@ -166,6 +172,11 @@ class NewsletterAdmin(admin.ModelAdmin):
         }),
     )
 
+    export_fields = [
+        'id', 'email', 'name', 'is_active', 'is_verified', 'frequency',
+        'subscribed_at', 'unsubscribed_at',
+    ]
+
     actions = ['activate_subscriptions', 'deactivate_subscriptions', 'mark_as_verified']
 
     def subscription_status(self, obj):
@@ -206,3 +217,59 @@ class NewsletterAdmin(admin.ModelAdmin):
     mark_as_verified.short_description = 'Mark as verified'
 
 
+@admin.register(NewsletterIssue)
+class NewsletterIssueAdmin(admin.ModelAdmin):
+    """Admin interface for Newsletter Issues (sent with manage.py send_newsletter)"""
+
+    list_display = ['subject', 'frequency', 'status', 'progress_display', 'created_at', 'finished_at']
+    list_filter = ['status', 'frequency', 'created_at']
+    search_fields = ['subject']
+    readonly_fields = [
+        'status', 'last_subscriber_id', 'in_flight_until_id', 'sent_count', 'failed_count',
+        'uncertain_count', 'last_error', 'created_at', 'started_at', 'finished_at'
+    ]
+
+    def progress_display(self, obj):
+        """Display delivery counters"""
+        return f'{obj.sent_count} sent / {obj.failed_count} failed / {obj.uncertain_count} uncertain'
+    progress_display.short_description = 'Progress'
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """Admin interface for the outbound mail queue"""
+
+    list_display = ['subject', 'recipients', 'status_badge', 'attempts', 'next_attempt_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['subject', 'to']
+    readonly_fields = ['attempts', 'locked_at', 'last_error', 'created_at', 'sent_at']
+    date_hierarchy = 'created_at'
+
+    actions = ['retry_now']
+
+    def recipients(self, obj):
+        """Display recipient list"""
+        return ', '.join(obj.to)
+    recipients.short_description = 'To'
+
+    def status_badge(self, obj):
+        """Display delivery status with color"""
+        colors = {
+            'queued': '#0dcaf0',
+            'sending': '#ffc107',
+            'sent': '#198754',
+            'failed': '#dc3545',
+        }
+        return format_html(
+            '<span style="background:{}; color:white; padding:3px 8px; border-radius:3px; font-size:11px;">{}</span>',
+            colors.get(obj.status, '#6c757d'), obj.get_status_display().upper()
+        )
+    status_badge.short_description = 'Status'
+
+    def retry_now(self, request, queryset):
+        """Requeue messages for immediate delivery"""
+        updated = queryset.exclude(status='sent').update(
+            status='queued', attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f'{updated} message(s) requeued.')
+    retry_now.short_description = 'Retry delivery now'
@@ -0,0 +1,113 @@
+"""
+Outbound Mail Worker
+Deliver queued OutboundEmail rows outside the request cycle
+
+Due rows are claimed in batches (FOR UPDATE SKIP LOCKED where the database
+supports it, so several workers can run side by side) and sent over a
+single reused mail connection. Failures are retried with exponential
+backoff until MAIL_OUTBOX_MAX_ATTEMPTS is reached.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .models import OutboundEmail
+
+
+class MailWorker:
+    """Send queued email in batches over one connection"""
+
+    def __init__(self, batch_size=None, max_attempts=None, log=print):
+        self.batch_size = batch_size or settings.MAIL_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.MAIL_OUTBOX_MAX_ATTEMPTS
+        self.log = log
+
+    def due(self):
+        """Queued rows whose retry time has come, plus rows abandoned mid-send"""
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.MAIL_OUTBOX_LEASE)
+        return OutboundEmail.objects.filter(
+            Q(status='queued', next_attempt_at__lte=now)
+            | Q(status='sending', locked_at__lt=stale)
+        ).order_by('next_attempt_at')
+
+    def claim_batch(self):
+        """Mark up to ``batch_size`` due rows as sending and return them"""
+        with transaction.atomic():
+            emails = list(
+                self.due().select_for_update(skip_locked=True)[:self.batch_size]
+            )
+            if emails:
+                OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                    status='sending', locked_at=timezone.now()
+                )
+        return emails
+
+    def deliver(self, emails):
+        """Send a claimed batch over one connection and record each outcome"""
+        sent, failed = [], []
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            failed = [(email, e) for email in emails]
+        else:
+            try:
+                for email in emails:
+                    try:
+                        email.to_message(connection=connection).send()
+                        sent.append(email)
+                    except Exception as e:
+                        failed.append((email, e))
+            finally:
+                connection.close()
+
+        now = timezone.now()
+        for email in sent:
+            email.status = 'sent'
+            email.sent_at = now
+            email.attempts += 1
+            email.last_error = ''
+        for email, error in failed:
+            email.attempts += 1
+            email.last_error = str(error) or error.__class__.__name__
+            if email.attempts >= self.max_attempts:
+                email.status = 'failed'
+            else:
+                email.status = 'queued'
+                email.next_attempt_at = now + email.retry_delay()
+
+        OutboundEmail.objects.bulk_update(
+            sent + [email for email, _ in failed],
+            ['status', 'sent_at', 'attempts', 'last_error', 'next_attempt_at'],
+        )
+        return len(sent), len(failed)
+
+    def run_once(self):
+        """Deliver every due message; returns (sent, failed) counts"""
+        total_sent = total_failed = 0
+        while True:
+            emails = self.claim_batch()
+            if not emails:
+                break
+            sent, failed = self.deliver(emails)
+            total_sent += sent
+            total_failed += failed
+            if failed and not sent:
+                break  # mail server is down; wait for the next poll
+
+        if total_sent or total_failed:
+            self.log(f'Mail worker: {total_sent} sent, {total_failed} failed')
+        return total_sent, total_failed
+
+    def run_forever(self, poll_interval=5):
+        """Keep delivering until interrupted"""
+        while True:
+            sent, failed = self.run_once()
+            if not sent:
+                time.sleep(poll_interval)
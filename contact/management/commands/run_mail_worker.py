@@ -0,0 +1,44 @@
+"""
+Management command to deliver queued outbound email
+Usage: python manage.py run_mail_worker [--once] [--batch-size N] [--poll S]
+"""
+
+from django.core.management.base import BaseCommand
+from contact.mail_worker import MailWorker
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued outbound email in batches over one SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Deliver the messages that are due and exit',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Messages sent per connection (default: MAIL_OUTBOX_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--poll',
+            type=int,
+            default=5,
+            help='Seconds to wait when the queue is empty',
+        )
+
+    def handle(self, *args, **options):
+        worker = MailWorker(batch_size=options['batch_size'], log=self.stdout.write)
+
+        if options['once']:
+            sent, failed = worker.run_once()
+            self.stdout.write(self.style.SUCCESS(f'✅ {sent} sent, {failed} failed'))
+            return
+
+        self.stdout.write(self.style.WARNING('Delivering queued email (Ctrl+C to stop)...'))
+        try:
+            worker.run_forever(poll_interval=options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Stopped.'))
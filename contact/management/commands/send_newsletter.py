@@ -0,0 +1,69 @@
+"""
+Management command to send a newsletter issue
+Usage: python manage.py send_newsletter ISSUE_ID [--batch-size N] [--chunk-size N] [--rate R]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from contact.models import NewsletterIssue
+from contact.newsletter import NewsletterDispatcher
+
+
+class Command(BaseCommand):
+    help = 'Send (or resume sending) a newsletter issue to its subscribers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('issue_id', type=int, help='NewsletterIssue id')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Messages per send_messages call (default: NEWSLETTER_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Subscribers fetched per query (default: NEWSLETTER_CHUNK_SIZE)',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=None,
+            help='Maximum messages per second, 0 for unlimited (default: NEWSLETTER_RATE)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            issue = NewsletterIssue.objects.get(pk=options['issue_id'])
+        except NewsletterIssue.DoesNotExist:
+            raise CommandError(f"Newsletter issue {options['issue_id']} does not exist")
+
+        if issue.status == 'sent':
+            self.stdout.write(self.style.WARNING(f'"{issue.subject}" has already been sent.'))
+            return
+
+        self.stdout.write(self.style.WARNING(f'Sending "{issue.subject}"...'))
+        dispatcher = NewsletterDispatcher(
+            issue,
+            chunk_size=options['chunk_size'],
+            batch_size=options['batch_size'],
+            rate=options['rate'],
+            log=self.stdout.write,
+        )
+
+        try:
+            stats = dispatcher.run()
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(
+                f'❌ Stopped after {dispatcher.stats.sent} message(s): {str(e)}\n'
+                'Run the command again to resume.'
+            ))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Sent {stats.sent}, failed {stats.failed}'))
+        if stats.uncertain:
+            self.stdout.write(f'Skipped {stats.uncertain} from an interrupted batch')
+        self.stdout.write(f'Throughput: {stats.throughput:.1f} msg/s over {stats.batches} batch(es)')
+        if stats.peak_memory_kb is not None:
+            self.stdout.write(f'Peak memory: {stats.peak_memory_kb / 1024:.1f} MiB')
+        self.stdout.write(f'Wall time: {stats.wall_time:.2f}s')
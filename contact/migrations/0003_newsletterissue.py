@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0002_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsletterIssue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField(help_text='Plain text; use {{ name }} and {{ email }} for the subscriber')),
+                ('frequency', models.CharField(blank=True, choices=[('weekly', 'Weekly'), ('monthly', 'Monthly'), ('quarterly', 'Quarterly')], help_text='Only send to subscribers with this frequency (blank: everyone)', max_length=20)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('sending', 'Sending'), ('sent', 'Sent')], default='draft', max_length=20)),
+                ('last_subscriber_id', models.BigIntegerField(default=0, editable=False, help_text='Every subscriber up to this id has been handled')),
+                ('in_flight_until_id', models.BigIntegerField(default=0, editable=False, help_text='Batch being sent when the checkpoint was written')),
+                ('sent_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('failed_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('uncertain_count', models.PositiveIntegerField(default=0, editable=False, help_text='Interrupted mid-send; skipped on resume')),
+                ('last_error', models.TextField(blank=True, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, editable=False, null=True)),
+            ],
+            options={
+                'verbose_name': 'Newsletter Issue',
+                'verbose_name_plural': 'Newsletter Issues',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_verified', True)), fields=['frequency', 'id'], name='newsletter_sendable_idx'),
+        ),
+    ]
@@ -3,8 +3,13 @@ Contact App Models
 Handles contact messages and inquiries
 """
 
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
 from django.core.validators import validate_email
+from django.core.mail import EmailMessage
+from django.utils import timezone
 
 
 class ContactMessage(models.Model):
@@ -139,6 +144,14 @@ class Newsletter(models.Model):
         verbose_name = "Newsletter Subscription"
         verbose_name_plural = "Newsletter Subscriptions"
         ordering = ['-subscribed_at']
+        indexes = [
+            # Keyset pagination over sendable subscribers (see contact.newsletter)
+            models.Index(
+                fields=['frequency', 'id'],
+                condition=models.Q(is_active=True, is_verified=True),
+                name='newsletter_sendable_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.email} ({'Active' if self.is_active else 'Inactive'})"
@@ -151,3 +164,141 @@ class Newsletter(models.Model):
         self.save(update_fields=['is_active', 'unsubscribed_at'])
 
 
+class NewsletterIssue(models.Model):
+    """
+    One newsletter issue and its delivery checkpoint.
+
+    ``subject`` and ``body`` are Django templates; ``{{ name }}`` and
+    ``{{ email }}`` are filled in per subscriber. Progress is checkpointed by
+    subscriber id so an interrupted dispatch resumes where it stopped.
+    """
+
+    STATUS_CHOICES = [
+        ('draft', 'Draft'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(help_text="Plain text; use {{ name }} and {{ email }} for the subscriber")
+    frequency = models.CharField(
+        max_length=20,
+        choices=[
+            ('weekly', 'Weekly'),
+            ('monthly', 'Monthly'),
+            ('quarterly', 'Quarterly'),
+        ],
+        blank=True,
+        help_text="Only send to subscribers with this frequency (blank: everyone)"
+    )
+
+    # Delivery progress
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    last_subscriber_id = models.BigIntegerField(
+        default=0, editable=False, help_text="Every subscriber up to this id has been handled"
+    )
+    in_flight_until_id = models.BigIntegerField(
+        default=0, editable=False, help_text="Batch being sent when the checkpoint was written"
+    )
+    sent_count = models.PositiveIntegerField(default=0, editable=False)
+    failed_count = models.PositiveIntegerField(default=0, editable=False)
+    uncertain_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Interrupted mid-send; skipped on resume"
+    )
+    last_error = models.TextField(blank=True, editable=False)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True, editable=False)
+    finished_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    class Meta:
+        verbose_name = "Newsletter Issue"
+        verbose_name_plural = "Newsletter Issues"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.subject} ({self.get_status_display()})"
+
+    def subscribers(self):
+        """Active, verified subscribers this issue goes to, in id order"""
+        queryset = Newsletter.objects.filter(is_active=True, is_verified=True)
+        if self.frequency:
+            queryset = queryset.filter(frequency=self.frequency)
+        return queryset.order_by('pk')
+
+
+class OutboundEmail(models.Model):
+    """
+    Persistent outbox for email sent outside the request cycle.
+
+    Views enqueue rows; ``manage.py run_mail_worker`` delivers them in
+    batches over one SMTP connection, retrying failures with backoff.
+    """
+
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    # Message
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True)
+    to = models.JSONField(default=list, help_text="Recipient addresses")
+    reply_to = models.JSONField(default=list, blank=True)
+    headers = models.JSONField(default=dict, blank=True)
+
+    # Delivery
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True, editable=False)
+    last_error = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Outbound Email"
+        verbose_name_plural = "Outbound Emails"
+        ordering = ['-created_at']
+        indexes = [
+            # The worker's "what is due" scan
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.get_status_display()})"
+
+    @classmethod
+    def enqueue(cls, subject, body, to, from_email=None, reply_to=None, headers=None):
+        """Queue a message for the mail worker"""
+        return cls.objects.create(
+            subject=subject,
+            body=body,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            to=list(to),
+            reply_to=list(reply_to or []),
+            headers=headers or {},
+        )
+
+    def to_message(self, connection=None):
+        """Build the EmailMessage to send over ``connection``"""
+        return EmailMessage(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email or settings.DEFAULT_FROM_EMAIL,
+            to=self.to,
+            reply_to=self.reply_to,
+            headers=self.headers,
+            connection=connection,
+        )
+
+    def retry_delay(self):
+        """Exponential backoff after ``attempts`` failures, capped"""
+        delay = settings.MAIL_OUTBOX_RETRY_DELAY * 2 ** max(self.attempts - 1, 0)
+        return timedelta(seconds=min(delay, settings.MAIL_OUTBOX_MAX_RETRY_DELAY))
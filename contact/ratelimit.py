@@ -0,0 +1,150 @@
+"""
+Contact App Rate Limiting
+Cache-backed sliding-window limits for the public POST endpoints
+
+Each (route, scope, value) pair keeps one counter per fixed window. The
+request rate is estimated from the current window plus the previous window
+weighted by how much of it still overlaps the sliding window, so counts
+never reset abruptly at a window boundary. Counters use ``cache.add`` and
+``cache.incr``, which are atomic on locmem, Memcached and Redis backends.
+Use a shared backend (Redis/Memcached) so limits apply across processes.
+"""
+
+import hashlib
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+# Monitoring counters kept per route
+STAT_NAMES = ('allowed', 'blocked')
+
+
+def get_client_ip(request):
+    """
+    Get client IP address.
+
+    X-Forwarded-For is set by the client, so it is only read behind
+    ``RATE_LIMIT_TRUSTED_PROXIES`` proxies, each of which appends the address
+    it received the request from: the entry that many hops from the right is
+    the one the outermost trusted proxy saw.
+    """
+    proxies = settings.RATE_LIMIT_TRUSTED_PROXIES
+    if proxies:
+        forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR')
+
+
+def get_rate_limit_cache():
+    """Return the cache backend holding rate-limit counters"""
+    return caches[settings.RATE_LIMIT_CACHE_ALIAS]
+
+
+def _counter_prefix(route, scope, value, window):
+    digest = hashlib.sha256(str(value).encode()).hexdigest()[:24]
+    return f'ratelimit:{route}:{scope}:{digest}:{window}'
+
+
+def _stat_key(route, name):
+    return f'ratelimit:stats:{route}:{name}'
+
+
+def _incr(cache, key, timeout):
+    """Atomically increment ``key``, creating it if missing or expired"""
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Expired between add() and incr()
+        cache.add(key, 1, timeout=timeout)
+        return 1
+
+
+def request_scopes(request):
+    """Values a request is limited by: client IP and submitted email"""
+    scopes = {'ip': get_client_ip(request)}
+    email = request.POST.get('email', '').strip().lower()
+    if email:
+        scopes['email'] = email
+    return scopes
+
+
+def check_rate_limit(route, scopes, now=None):
+    """
+    Count a hit for every scope of ``route``.
+
+    Returns the number of seconds to wait when any configured limit is
+    exceeded, otherwise None.
+    """
+    limits = settings.RATE_LIMITS.get(route, {})
+    cache = get_rate_limit_cache()
+    now = time.time() if now is None else now
+
+    hits = []
+    for scope, (limit, window) in limits.items():
+        value = scopes.get(scope)
+        if value is None:
+            continue
+        index, offset = divmod(now, window)
+        hits.append((limit, window, offset, _counter_prefix(route, scope, value, window), int(index)))
+
+    # Previous windows are only read, so fetch them in one round trip
+    previous = cache.get_many([f'{prefix}:{index - 1}' for *_, prefix, index in hits])
+
+    retry_after = None
+    for limit, window, offset, prefix, index in hits:
+        current = _incr(cache, f'{prefix}:{index}', timeout=2 * window)
+        overlap = 1 - offset / window
+        if previous.get(f'{prefix}:{index - 1}', 0) * overlap + current > limit:
+            retry_after = max(retry_after or 0, math.ceil(window - offset))
+
+    _incr(cache, _stat_key(route, 'blocked' if retry_after else 'allowed'), timeout=None)
+    return retry_after
+
+
+def get_rate_limit_stats():
+    """Allowed/blocked request counters per route"""
+    cache = get_rate_limit_cache()
+    keys = {
+        _stat_key(route, name): (route, name)
+        for route in settings.RATE_LIMITS
+        for name in STAT_NAMES
+    }
+    values = cache.get_many(keys)
+    stats = {route: dict.fromkeys(STAT_NAMES, 0) for route in settings.RATE_LIMITS}
+    for key, (route, name) in keys.items():
+        stats[route][name] = values.get(key, 0)
+    return stats
+
+
+def ratelimit(route):
+    """
+    Limit POSTs to a view by the ``settings.RATE_LIMITS[route]`` rules.
+
+    Rejected requests get a bare 429 before the form is even parsed into a
+    model, so a flood never reaches the database.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method == 'POST':
+                retry_after = check_rate_limit(route, request_scopes(request))
+                if retry_after is not None:
+                    response = HttpResponse(
+                        'Too many requests. Please try again later.',
+                        status=429,
+                        content_type='text/plain',
+                    )
+                    response['Retry-After'] = str(retry_after)
+                    return response
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
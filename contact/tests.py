@@ -1,3 +1,300 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import os
+import smtplib
+import tempfile
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.mail.backends import locmem
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from core.testing import TEST_STORAGES
+from contact.mail_worker import MailWorker
+from contact.models import ContactMessage, Newsletter, NewsletterIssue, OutboundEmail
+from contact.newsletter import NewsletterDispatcher
+from contact.ratelimit import check_rate_limit, get_rate_limit_stats
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """Mail backend whose server is always unreachable"""
+
+    def open(self):
+        raise ConnectionRefusedError('SMTP server unavailable')
+
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError('SMTP server unavailable')
+
+
+class RefusingEmailBackend(locmem.EmailBackend):
+    """In-memory mail backend whose server refuses one recipient"""
+
+    def send_messages(self, messages):
+        for message in messages:
+            if 'reader2@' in message.to[0]:
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b'No such user')})
+        return super().send_messages(messages)
+
+
+@override_settings(STORAGES=TEST_STORAGES, ADMIN_EMAIL='admin@example.com')
+class OutboundEmailTests(TestCase):
+    """Contact notifications go through the outbox and the mail worker"""
+
+    def setUp(self):
+        cache.clear()  # rate-limit counters
+
+    def post_contact(self):
+        return self.client.post(reverse('contactus'), {
+            'name': 'Bob',
+            'email': 'bob@example.com',
+            'subject': 'Project',
+            'message': 'Can you build me a site?',
+        })
+
+    def test_contact_post_queues_instead_of_sending(self):
+        response = self.post_contact()
+        self.assertRedirects(response, reverse('contactus'))
+        self.assertEqual(ContactMessage.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, 'queued')
+        self.assertEqual(email.to, ['admin@example.com'])
+        self.assertEqual(email.reply_to, ['bob@example.com'])
+
+    def test_worker_delivers_batch(self):
+        for i in range(3):
+            OutboundEmail.enqueue(f'Hello {i}', 'Body', ['a@example.com'])
+
+        sent, failed = MailWorker(batch_size=2, log=lambda message: None).run_once()
+
+        self.assertEqual((sent, failed), (3, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(OutboundEmail.objects.exclude(status='sent').exists())
+
+    @override_settings(EMAIL_BACKEND='contact.tests.FailingEmailBackend', MAIL_OUTBOX_RETRY_DELAY=60)
+    def test_failures_back_off_then_give_up(self):
+        email = OutboundEmail.enqueue('Hello', 'Body', ['a@example.com'])
+        worker = MailWorker(max_attempts=2, log=lambda message: None)
+
+        self.assertEqual(worker.run_once(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'queued')
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('SMTP server unavailable', email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=50))
+
+        # Not due yet
+        self.assertEqual(worker.run_once(), (0, 0))
+
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        worker.run_once()
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'failed')
+        self.assertEqual(email.attempts, 2)
+
+
+@override_settings(STORAGES=TEST_STORAGES, NEWSLETTER_RATE=0)
+class NewsletterDispatchTests(TestCase):
+    """Newsletter issues stream subscribers in chunks and resume from a checkpoint"""
+
+    def setUp(self):
+        Newsletter.objects.bulk_create([
+            Newsletter(email=f'reader{i}@example.com', name=f'Reader {i}', is_verified=True)
+            for i in range(7)
+        ] + [
+            Newsletter(email='unverified@example.com'),
+            Newsletter(email='gone@example.com', is_verified=True, is_active=False),
+        ])
+        self.issue = NewsletterIssue.objects.create(
+            subject='News for {{ name }}',
+            body='Hi {{ name }},\nThis went to {{ email }}.',
+        )
+
+    def dispatch(self, **kwargs):
+        return NewsletterDispatcher(self.issue, log=lambda message: None, **kwargs).run()
+
+    def test_sends_personalised_copies_once(self):
+        # 7 recipients: 3 subscriber queries, 3 send batches
+        stats = self.dispatch(chunk_size=3, batch_size=3)
+
+        self.assertEqual((stats.sent, stats.failed, stats.batches), (7, 0, 3))
+        self.assertEqual(len(mail.outbox), 7)
+        self.assertEqual(mail.outbox[0].subject, 'News for Reader 0')
+        self.assertEqual(mail.outbox[0].body, 'Hi Reader 0,\nThis went to reader0@example.com.')
+        self.assertNotIn('unverified@example.com', [m.to[0] for m in mail.outbox])
+
+        self.issue.refresh_from_db()
+        self.assertEqual((self.issue.status, self.issue.sent_count), ('sent', 7))
+
+        # A finished issue is never re-sent
+        self.dispatch()
+        self.assertEqual(len(mail.outbox), 7)
+
+    @override_settings(EMAIL_BACKEND='contact.tests.RefusingEmailBackend')
+    def test_refused_recipient_does_not_stop_the_batch(self):
+        stats = self.dispatch(batch_size=3)
+
+        self.assertEqual((stats.sent, stats.failed, stats.uncertain), (6, 1, 0))
+        self.assertNotIn('reader2@example.com', [m.to[0] for m in mail.outbox])
+        self.issue.refresh_from_db()
+        self.assertEqual((self.issue.status, self.issue.sent_count, self.issue.failed_count), ('sent', 6, 1))
+
+    def test_resume_skips_interrupted_batch(self):
+        ids = list(self.issue.subscribers().values_list('pk', flat=True))
+        # A previous run finished two subscribers and died while sending the next two
+        NewsletterIssue.objects.filter(pk=self.issue.pk).update(
+            status='sending', last_subscriber_id=ids[1], in_flight_until_id=ids[3], sent_count=2,
+        )
+        self.issue.refresh_from_db()
+
+        stats = self.dispatch(batch_size=2)
+
+        self.assertEqual((stats.sent, stats.uncertain), (3, 2))
+        self.assertEqual(
+            [m.to[0] for m in mail.outbox],
+            [f'reader{i}@example.com' for i in range(4, 7)],
+        )
+        self.issue.refresh_from_db()
+        self.assertEqual((self.issue.sent_count, self.issue.uncertain_count), (5, 2))
+
+
+@override_settings(
+    STORAGES=TEST_STORAGES,
+    RATE_LIMITS={'contact': {'ip': (2, 60), 'email': (1, 60)}, 'newsletter': {'ip': (2, 60)}},
+)
+class RateLimitTests(TestCase):
+    """Public POSTs are limited per IP and per email without touching the database"""
+
+    def setUp(self):
+        cache.clear()
+
+    def subscribe(self, email, ip='10.0.0.1'):
+        return self.client.post(
+            reverse('newsletter_subscribe'), {'email': email}, REMOTE_ADDR=ip,
+        )
+
+    def test_ip_limit_returns_cheap_429(self):
+        self.subscribe('a@example.com')
+        self.subscribe('b@example.com')
+        with self.assertNumQueries(0):
+            response = self.subscribe('c@example.com')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(Newsletter.objects.count(), 2)
+
+        # Other clients are unaffected
+        self.assertEqual(self.subscribe('c@example.com', ip='10.0.0.2').status_code, 302)
+
+    def test_spoofed_forwarded_for_does_not_reset_the_ip_limit(self):
+        for n, spoofed in enumerate(('1.1.1.1', '2.2.2.2', '3.3.3.3')):
+            response = self.client.post(
+                reverse('newsletter_subscribe'), {'email': f'{n}@example.com'},
+                REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=spoofed,
+            )
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(RATE_LIMIT_TRUSTED_PROXIES=1)
+    def test_forwarded_for_read_behind_trusted_proxies(self):
+        # The proxy appends the real peer; anything left of it is the client's
+        for n, spoofed in enumerate(('1.1.1.1', '2.2.2.2', '3.3.3.3')):
+            response = self.client.post(
+                reverse('newsletter_subscribe'), {'email': f'{n}@example.com'},
+                REMOTE_ADDR='172.16.0.1', HTTP_X_FORWARDED_FOR=f'{spoofed}, 10.0.0.1',
+            )
+        self.assertEqual(response.status_code, 429)
+        response = self.client.post(
+            reverse('newsletter_subscribe'), {'email': 'x@example.com'},
+            REMOTE_ADDR='172.16.0.1', HTTP_X_FORWARDED_FOR='10.0.0.2',
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_email_limit_spans_ips(self):
+        data = {'name': 'Bob', 'email': 'Bob@Example.com', 'subject': 'Hi', 'message': 'Hello there, Jane!'}
+        self.client.post(reverse('contactus'), data, REMOTE_ADDR='10.0.0.1')
+        response = self.client.post(
+            reverse('contactus'), {**data, 'email': 'bob@example.com '}, REMOTE_ADDR='10.0.0.2',
+        )
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+    def test_sliding_window_weights_previous_window(self):
+        for ip in ('10.0.0.8', '10.0.0.9'):
+            check_rate_limit('newsletter', {'ip': ip}, now=0)
+            check_rate_limit('newsletter', {'ip': ip}, now=1)
+        # Early in the next window most of the previous window still counts
+        self.assertIsNotNone(check_rate_limit('newsletter', {'ip': '10.0.0.8'}, now=61))
+        # Near its end the previous window has almost expired
+        self.assertIsNone(check_rate_limit('newsletter', {'ip': '10.0.0.9'}, now=118))
+
+    def test_counters_exposed_to_staff(self):
+        self.subscribe('a@example.com')
+        self.subscribe('b@example.com')
+        self.subscribe('c@example.com')
+        self.assertEqual(get_rate_limit_stats()['newsletter'], {'allowed': 2, 'blocked': 1})
+
+        url = reverse('rate_limit_stats')
+        self.assertEqual(self.client.get(url).status_code, 302)
+        User.objects.create_user('admin', 'admin@example.com', 'pass12345', is_staff=True)
+        self.client.login(username='admin', password='pass12345')
+        self.assertEqual(self.client.get(url).json()['newsletter']['blocked'], 1)
+
+
+@override_settings(STORAGES=TEST_STORAGES, EXPORT_CHUNK_SIZE=2)
+class StreamingExportTests(TestCase):
+    """Admin export actions and export_records stream filtered rows"""
+
+    def setUp(self):
+        for i, status in enumerate(['new', 'read', 'new', 'new', 'archived']):
+            ContactMessage.objects.create(
+                name=f'Sender {i}', email=f'sender{i}@example.com', subject='=HYPERLINK("x")',
+                message='Line one\nline two', status=status,
+            )
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pass12345')
+        self.client.force_login(self.admin)
+
+    def export(self, action, query=''):
+        url = reverse('admin:contact_contactmessage_changelist') + query
+        response = self.client.post(url, {
+            'action': action,
+            'select_across': '1',
+            'index': '0',
+            '_selected_action': ContactMessage.objects.values_list('pk', flat=True),
+        })
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content)
+
+    def test_csv_honours_admin_filters(self):
+        rows = list(csv.DictReader(io.StringIO(self.export('export_csv', '?status__exact=new').decode())))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row['status'] for row in rows}, {'new'})
+        self.assertEqual(rows[0]['message'], 'Line one\nline two')
+        # Formula-looking cells are neutralised for spreadsheet apps
+        self.assertEqual(rows[0]['subject'], '\'=HYPERLINK("x")')
+        self.assertNotIn('user_agent', rows[0])
+
+    def test_gzipped_jsonl(self):
+        lines = gzip.decompress(self.export('export_jsonl_gz')).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[0]['subject'], '=HYPERLINK("x")')
+
+    def test_management_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'messages.csv.gz')
+            call_command(
+                'export_records', 'contact.ContactMessage', '--format', 'csv.gz',
+                '--output', path, '--filter', 'status=new', '--fields', 'id,email',
+                stderr=io.StringIO(),
+            )
+            with gzip.open(path, 'rt') as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['id', 'email'])
+        self.assertEqual(len(rows), 4)
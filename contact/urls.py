@@ -12,6 +12,9 @@ urlpatterns = [
     # Newsletter
     path('newsletter/subscribe/', views.newsletter_subscribe, name='newsletter_subscribe'),
 
+    # Rate limiter counters (staff only)
+    path('ratelimit/stats/', views.rate_limit_stats, name='rate_limit_stats'),
+
     # Social media redirects
     path('social/facebook/', views.FacebookRedirectView.as_view(), name='fb'),
     path('social/instagram/', views.InstagramRedirectView.as_view(), name='inst'),
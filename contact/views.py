@@ -4,15 +4,19 @@ Contact App Views
 
 from django.shortcuts import render, redirect
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
 from django.views.generic import CreateView
 from django.views.generic.base import RedirectView
 from django.urls import reverse_lazy
-from django.core.mail import send_mail
+from django.db import transaction
 from django.conf import settings
-from .models import ContactMessage, Newsletter
+from .models import ContactMessage, Newsletter, OutboundEmail
 from .forms import ContactForm, NewsletterForm
+from .ratelimit import get_client_ip, get_rate_limit_stats, ratelimit
 
 
+@ratelimit('contact')
 def contact_pro(request):
     """Contact page view with form handling"""
 
@@ -26,13 +30,11 @@ def contact_pro(request):
             contact_message.ip_address = get_client_ip(request)
             contact_message.user_agent = request.META.get('HTTP_USER_AGENT', '')
 
-            contact_message.save()
-
-            # Send email notification to admin
-            try:
+            # Queue the admin notification with the message; the mail
+            # worker delivers it, so the POST never waits on SMTP
+            with transaction.atomic():
+                contact_message.save()
                 send_notification_email(contact_message)
-            except Exception as e:
-                print(f"Email error: {e}")
 
             messages.success(
                 request,
@@ -53,6 +55,7 @@ def contact_pro(request):
     return render(request, 'cont/contact.html', context)
 
 
+@ratelimit('newsletter')
 def newsletter_subscribe(request):
     """Newsletter subscription view"""
 
@@ -71,18 +74,14 @@ def newsletter_subscribe(request):
     return redirect(request.META.get('HTTP_REFERER', 'home'))
 
 
-def get_client_ip(request):
-    """Get client IP address"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+@staff_member_required
+def rate_limit_stats(request):
+    """Allowed/blocked POST counters per rate-limited route (for monitoring)"""
+    return JsonResponse(get_rate_limit_stats())
 
 
 def send_notification_email(contact_message):
-    """Send email notification to admin"""
+    """Queue an email notification to admin (see contact.mail_worker)"""
 
     subject = f'New Contact Message: {contact_message.subject}'
     message = f"""
@@ -103,12 +102,11 @@ def send_notification_email(contact_message):
     Received: {contact_message.created_at}
     """
 
-    send_mail(
+    return OutboundEmail.enqueue(
         subject,
         message,
-        settings.DEFAULT_FROM_EMAIL,
         [settings.ADMIN_EMAIL],
-        fail_silently=True,
+        reply_to=[contact_message.email],
     )
 
 
@@ -4,7 +4,11 @@ Core App Admin Configuration
 
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import Profile, Project, SocialLink, Testimonial
+from django.utils import timezone
+from django.db.models import Count
+from .models import Profile, Project, SocialLink, Technology, Testimonial, GitHubSyncCursor, ImageAsset
+from .cache import update_and_invalidate
+from .search import SearchIndexAdminMixin, reindex_queryset
 
 
 @admin.register(Profile)
@@ -53,7 +57,7 @@ class ProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
     """Admin interface for Projects"""
 
     list_display = [
@@ -119,35 +123,37 @@ class ProjectAdmin(admin.ModelAdmin):
 
     def technologies_preview(self, obj):
         """Show first 3 technologies"""
-        techs = obj.get_technologies_list()[:3]
-        preview = ', '.join(techs)
-        if len(obj.get_technologies_list()) > 3:
+        techs = obj.get_technologies_list()
+        preview = ', '.join(techs[:3])
+        if len(techs) > 3:
             preview += '...'
         return preview
     technologies_preview.short_description = 'Technologies'
 
     def make_featured(self, request, queryset):
         """Mark projects as featured"""
-        updated = queryset.update(is_featured=True)
-        self.message_user(request, f'{updated} project(s) marked as featured.')
+        pks = update_and_invalidate(queryset, is_featured=True)
+        self.message_user(request, f'{len(pks)} project(s) marked as featured.')
     make_featured.short_description = 'Mark as featured'
 
     def remove_featured(self, request, queryset):
         """Remove featured status"""
-        updated = queryset.update(is_featured=False)
-        self.message_user(request, f'{updated} project(s) removed from featured.')
+        pks = update_and_invalidate(queryset, is_featured=False)
+        self.message_user(request, f'{len(pks)} project(s) removed from featured.')
     remove_featured.short_description = 'Remove featured status'
 
     def activate_projects(self, request, queryset):
         """Activate selected projects"""
-        updated = queryset.update(is_active=True)
-        self.message_user(request, f'{updated} project(s) activated.')
+        pks = update_and_invalidate(queryset, is_active=True)
+        reindex_queryset(Project.objects.filter(pk__in=pks))
+        self.message_user(request, f'{len(pks)} project(s) activated.')
     activate_projects.short_description = 'Activate selected projects'
 
     def deactivate_projects(self, request, queryset):
         """Deactivate selected projects"""
-        updated = queryset.update(is_active=False)
-        self.message_user(request, f'{updated} project(s) deactivated.')
+        pks = update_and_invalidate(queryset, is_active=False)
+        reindex_queryset(Project.objects.filter(pk__in=pks))
+        self.message_user(request, f'{len(pks)} project(s) deactivated.')
     deactivate_projects.short_description = 'Deactivate selected projects'
 
 
@@ -237,6 +243,77 @@ class TestimonialAdmin(admin.ModelAdmin):
     rating_display.short_description = 'Rating'
 
 
+@admin.register(GitHubSyncCursor)
+class GitHubSyncCursorAdmin(admin.ModelAdmin):
+    """Admin interface for per-user GitHub sync progress"""
+
+    list_display = [
+        'github_username', 'user', 'repos_synced', 'requests_made', 'not_modified',
+        'last_success_at', 'next_sync_at', 'has_error'
+    ]
+    list_filter = ['last_success_at', 'next_sync_at']
+    search_fields = ['github_username', 'user__username']
+    readonly_fields = [
+        'user', 'github_username', 'last_synced_at', 'last_success_at', 'last_error',
+        'repos_synced', 'requests_made', 'not_modified'
+    ]
+
+    def has_error(self, obj):
+        """Show whether the last run failed"""
+        return bool(obj.last_error)
+    has_error.boolean = True
+    has_error.short_description = 'Error'
+
+
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    """Admin interface for normalized technology tags"""
+
+    list_display = ['name', 'slug', 'project_count']
+    search_fields = ['name', 'slug']
+    prepopulated_fields = {'slug': ('name',)}
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(project_count=Count('project_links'))
+
+    def project_count(self, obj):
+        """Number of projects tagged with this technology"""
+        return obj.project_count
+    project_count.short_description = 'Projects'
+    project_count.admin_order_field = 'project_count'
+
+
+@admin.register(ImageAsset)
+class ImageAssetAdmin(admin.ModelAdmin):
+    """Admin interface for processed image variants"""
+
+    list_display = ['source', 'user', 'status', 'size_display', 'variant_count', 'attempts', 'processed_at']
+    list_filter = ['status', 'processed_at']
+    search_fields = ['source', 'content_hash', 'user__username']
+    readonly_fields = [
+        'source', 'user', 'content_hash', 'status', 'attempts', 'next_attempt_at', 'locked_at', 'last_error',
+        'width', 'height', 'variants', 'blurhash', 'placeholder_color', 'created_at', 'processed_at'
+    ]
+    actions = ['reprocess']
+
+    def size_display(self, obj):
+        """Size of the largest variant"""
+        return f'{obj.width}×{obj.height}' if obj.width else '-'
+    size_display.short_description = 'Size'
+
+    def variant_count(self, obj):
+        return len(obj.variants)
+    variant_count.short_description = 'Variants'
+
+    def reprocess(self, request, queryset):
+        """Render the variants again on the next worker run"""
+        updated = queryset.update(
+            status='pending', attempts=0, next_attempt_at=timezone.now(), content_hash='', last_error=''
+        )
+        self.message_user(request, f'{updated} image(s) queued for processing.')
+    reprocess.short_description = 'Reprocess selected images'
+
+
 # Customize admin site header
 admin.site.site_header = "Portfolio Admin Panel"
 admin.site.site_title = "Portfolio Admin"
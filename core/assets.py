@@ -0,0 +1,422 @@
+"""
+Static Asset Pipeline
+Bundle, minify and self-host the CSS, JavaScript and fonts every page loads
+
+``manage.py build_assets`` writes into ASSET_BUILD_DIR, which is served
+under ``static/bundles/``:
+
+- ``site.css``: the ASSET_BUNDLES['css'] sources, minified, after the
+  @font-face rules of the self-hosted fonts and the FontAwesome rules of
+  the icons the project uses;
+- ``site.js``: the ASSET_BUNDLES['js'] sources (already minified vendor
+  builds), concatenated;
+- ``critical.css``: the rules of ``site.css`` that the markup of
+  ASSET_CRITICAL_TEMPLATES can match, inlined in <head> so the page shell
+  paints before ``site.css`` arrives;
+- ``fonts/``: the FontAwesome webfonts (assets/fontawesome/webfonts/) and
+  ASSET_FONTS (assets/fonts/), subsetted to the glyphs in use when
+  fontTools is installed and copied whole otherwise;
+- ``assets.json``: what the build produced, read by {% asset_styles %}
+  and {% asset_scripts %}. Icons and fonts whose files are missing keep
+  loading from their CDNs.
+
+``collectstatic`` then fingerprints the bundles and writes their gzip and
+Brotli variants (CompressedManifestStaticFilesStorage; Brotli needs the
+``brotli`` package), which WhiteNoise serves by Accept-Encoding.
+"""
+
+import gzip
+import json
+import posixpath
+import re
+import shutil
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.template.loader import get_template
+
+try:
+    import brotli
+except ImportError:  # only used to report sizes; collectstatic skips .br too
+    brotli = None
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # fonts are self-hosted whole
+    font_subset = None
+
+MANIFEST_NAME = 'assets.json'
+CRITICAL_NAME = 'critical.css'
+FONTS_DIR = 'fonts'
+
+# Google Fonts' "latin" subset: what text fonts are cut down to
+LATIN_RANGE = (
+    'U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+0304,U+0308,'
+    'U+0329,U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD'
+)
+
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/)', re.S)
+_CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+_ICON_RULE = re.compile(r'\.(fa-[\w-]+)::?before')
+_ICON_CONTENT = re.compile(r'^content:"(\\[0-9a-fA-F]{1,6}|.)"$')
+_PSEUDO = re.compile(r'::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?')
+_ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+_TYPE_SELECTOR = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+_WORD = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+_ICON_CLASS = re.compile(r'\bfa-[a-z0-9-]+')
+
+
+# ==============================================================================
+# CSS
+# ==============================================================================
+
+def _minify_code(css):
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}')
+
+
+def minify_css(css):
+    """Drop comments (except /*! licences */) and redundant whitespace"""
+    items = []  # [is_code, text]; strings and licences are kept verbatim
+    for i, part in enumerate(_CSS_TOKENS.split(css)):
+        if i % 2 and part.startswith('/*') and not part.startswith('/*!'):
+            continue
+        if i % 2 == 0 and items and items[-1][0]:
+            items[-1][1] += part
+        else:
+            items.append([i % 2 == 0, part])
+
+    out = []
+    for n, (is_code, text) in enumerate(items):
+        if is_code:
+            text = _minify_code(text)
+            if n and items[n - 1][1].startswith('/*'):
+                text = text.lstrip()
+            if n + 1 < len(items) and items[n + 1][1].startswith('/*'):
+                text = text.rstrip()
+        out.append(text)
+    return ''.join(out).strip()
+
+
+def _rebase_urls(css, source, target_dir):
+    """Rewrite relative url()s of static file ``source`` for a file in ``target_dir``"""
+
+    def rebase(match):
+        url = match.group(2)
+        if url.startswith(('data:', '#', '/')) or '://' in url:
+            return match.group(0)
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(source), url))
+        return f'url({posixpath.relpath(path, target_dir)})'
+
+    return _CSS_URL.sub(rebase, css)
+
+
+def split_rules(css):
+    """
+    Top-level ``(prelude, body)`` pairs of a minified stylesheet.
+
+    At-rule statements such as @charset have a ``None`` body; the body of
+    a block at-rule (@media, @supports) is its raw nested stylesheet.
+    """
+    rules = []
+    depth = start = body_start = 0
+    prelude = ''
+    i = 0
+    while i < len(css):
+        char = css[i]
+        if char in '"\'':
+            i += 1
+            while css[i] != char:
+                i += 2 if css[i] == '\\' else 1
+        elif css.startswith('/*', i):
+            i = css.index('*/', i) + 1
+            if depth == 0:
+                start = i + 1
+        elif char == '{':
+            if depth == 0:
+                prelude, body_start = css[start:i].strip(), i + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[body_start:i]))
+                start = i + 1
+        elif char == ';' and depth == 0:
+            rules.append((css[start:i].strip(), None))
+            start = i + 1
+        i += 1
+    return rules
+
+
+def _split_selectors(prelude):
+    """Split a selector list on the commas outside :is(...)/:not(...)"""
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+@dataclass
+class Markup:
+    """Class names, ids and tag names found in template sources"""
+
+    classes: set = field(default_factory=set)
+    ids: set = field(default_factory=set)
+    tags: set = field(default_factory=lambda: {'html', 'body'})
+
+    @classmethod
+    def from_templates(cls, sources):
+        markup = cls()
+        for source in sources:
+            # {{ ... }} parts of a class attribute are unknown until render
+            source = re.sub(r'\{\{.*?\}\}', ' ', source)
+            for value in re.findall(r'\bclass="([^"]*)"', source):
+                markup.classes.update(_WORD.findall(re.sub(r'\{%.*?%\}', ' ', value)))
+            markup.ids.update(re.findall(r'\bid="([\w-]+)"', source))
+            markup.tags.update(tag.lower() for tag in re.findall(r'<([a-zA-Z][a-zA-Z0-9]*)', source))
+        return markup
+
+    def matches(self, selector):
+        """Whether ``selector`` can match this markup, pseudo-classes and attributes aside"""
+        selector = _ATTRIBUTE.sub('', _PSEUDO.sub('', selector))
+        return (
+            all(name in self.classes for name in re.findall(r'\.([\w-]+)', selector))
+            and all(name in self.ids for name in re.findall(r'#([\w-]+)', selector))
+            and all(name.lower() in self.tags for name in _TYPE_SELECTOR.findall(selector))
+        )
+
+
+def critical_css(css, markup):
+    """The rules of a minified stylesheet that ``markup`` can match"""
+    out = []
+    for prelude, body in split_rules(css):
+        if body is None:
+            continue  # @charset/@import have no place in an inline <style>
+        if prelude.startswith(('@media', '@supports')):
+            inner = critical_css(body, markup)
+            if inner:
+                out.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@') or 'url(' in body:
+            continue  # @font-face, @keyframes; relative URLs break once inlined
+        else:
+            selectors = [s for s in _split_selectors(prelude) if markup.matches(s)]
+            if selectors:
+                out.append(f'{",".join(selectors)}{{{body}}}')
+    # An inline <style> must not close early
+    return ''.join(out).replace('</', '<\\/')
+
+
+# ==============================================================================
+# FONTS AND ICONS
+# ==============================================================================
+
+def _codepoints(unicode_range):
+    """Code points of a CSS unicode-range such as ``U+0000-00FF,U+2122``"""
+    points = set()
+    for part in unicode_range.split(','):
+        low, _, high = part.strip()[2:].partition('-')
+        points.update(range(int(low, 16), int(high or low, 16) + 1))
+    return points
+
+
+def _subset_font(source, target, unicodes):
+    """Write ``source`` to ``target`` as WOFF2 with only the ``unicodes`` glyphs"""
+    if font_subset is None:
+        shutil.copyfile(source, target)
+        return
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']  # keep kerning and ligatures
+    font = font_subset.load_font(str(source), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    font_subset.save_font(font, str(target), options)
+
+
+def _project_files(pattern):
+    """Files matching ``pattern`` in the project's own apps and template dirs"""
+    roots = [Path(d) for conf in settings.TEMPLATES for d in conf.get('DIRS', ())]
+    roots += [
+        Path(app.path) for app in apps.get_app_configs()
+        if Path(app.path).is_relative_to(settings.BASE_DIR)
+    ]
+    for root in roots:
+        yield from root.rglob(pattern)
+
+
+def used_icon_words():
+    """
+    Words that may name a FontAwesome icon: ``fa-*`` classes in Python code
+    and icon_class fields, and every word of every template (templates build
+    names such as ``fa-{% if ... %}check-circle{% endif %}``).
+    """
+    words = set()
+    for path in _project_files('*.html'):
+        words.update(_WORD.findall(path.read_text(encoding='utf-8', errors='ignore')))
+    for path in _project_files('*.py'):
+        words.update(_ICON_CLASS.findall(path.read_text(encoding='utf-8', errors='ignore')))
+    for model in apps.get_models():
+        if any(f.name == 'icon_class' for f in model._meta.get_fields()):
+            for value in model.objects.values_list('icon_class', flat=True).distinct():
+                words.update(_ICON_CLASS.findall(value or ''))
+    return words
+
+
+def build_icon_css(css, words, fonts_source, fonts_target):
+    """
+    FontAwesome's stylesheet cut down to the icons in ``words``, with its
+    webfonts self-hosted in ``fonts_target``.
+
+    Returns None, leaving the CDN in use, when a webfont is missing.
+    """
+    css = minify_css(css)
+    rules = re.findall(r'/\*!.*?\*/', css, re.S)[:1]  # the licence notice
+    unicodes, fonts = set(), []
+    for prelude, body in split_rules(css):
+        if body is None:
+            continue
+        if prelude == '@font-face':
+            match = re.search(r'url\(\.\./webfonts/([\w.-]+\.woff2)\)', body)
+            if match is None:
+                continue
+            fonts.append(match.group(1))
+            body = re.sub(r'src:[^;]*', f'src:url({FONTS_DIR}/{match.group(1)}) format("woff2")', body)
+        elif settings.ASSET_SUBSET_ICONS:
+            icons = [_ICON_RULE.fullmatch(s) for s in _split_selectors(prelude)]
+            if all(icons):  # .fa-github:before{content:"\f09b"}
+                icons = [m for m in icons if m.group(1) in words or m.group(1)[3:] in words]
+                if not icons:
+                    continue
+                prelude = ','.join(m.group(0) for m in icons)
+                glyph = _ICON_CONTENT.match(body)
+                if glyph:
+                    char = glyph.group(1)
+                    unicodes.add(int(char[1:], 16) if char.startswith('\\') else ord(char))
+        rules.append(f'{prelude}{{{body}}}')
+
+    if not all((fonts_source / name).exists() for name in fonts):
+        return None
+    for name in set(fonts):
+        if settings.ASSET_SUBSET_ICONS:
+            _subset_font(fonts_source / name, fonts_target / name, unicodes)
+        else:
+            shutil.copyfile(fonts_source / name, fonts_target / name)
+    return ''.join(rules)
+
+
+def build_font_css(fonts, fonts_source, fonts_target):
+    """@font-face rules for ASSET_FONTS, or None while a font file is missing"""
+    if not fonts or not all((fonts_source / font['file']).exists() for font in fonts):
+        return None
+    rules = []
+    for font in fonts:
+        _subset_font(fonts_source / font['file'], fonts_target / font['file'], _codepoints(LATIN_RANGE))
+        rules.append(
+            f'@font-face{{font-family:"{font["family"]}";font-style:{font.get("style", "normal")};'
+            f'font-weight:{font["weight"]};font-display:swap;'
+            f'src:url({FONTS_DIR}/{font["file"]}) format("woff2");unicode-range:{LATIN_RANGE}}}'
+        )
+    return ''.join(rules)
+
+
+# ==============================================================================
+# BUILD
+# ==============================================================================
+
+def _read_static(path):
+    source = finders.find(path)
+    if source is None:
+        raise FileNotFoundError(f'Static file {path!r} not found')
+    return Path(source).read_text(encoding='utf-8')
+
+
+def _sizes(name, data):
+    return {
+        'name': name,
+        'bytes': len(data),
+        'gzip': len(gzip.compress(data, 9)),
+        'brotli': len(brotli.compress(data)) if brotli else None,
+    }
+
+
+def build_assets(build_dir=None):
+    """Build every bundle into ``build_dir`` (default ASSET_BUILD_DIR); returns a size report"""
+    build_dir = Path(build_dir or settings.ASSET_BUILD_DIR)
+    fonts_target = build_dir / FONTS_DIR
+    shutil.rmtree(fonts_target, ignore_errors=True)
+    fonts_target.mkdir(parents=True)
+    prefix = 'bundles'
+
+    fontawesome = Path(settings.ASSETS_DIR) / 'fontawesome'
+    icons = build_icon_css(
+        (fontawesome / 'css' / 'all.css').read_text(encoding='utf-8'),
+        used_icon_words(), fontawesome / 'webfonts', fonts_target,
+    )
+    fonts = build_font_css(settings.ASSET_FONTS, Path(settings.ASSETS_DIR) / 'fonts', fonts_target)
+
+    sources = settings.ASSET_BUNDLES['css']
+    parts = [minify_css(_rebase_urls(_read_static(path), path, prefix)) for path in sources]
+    # Only one @charset is allowed, and only first
+    parts = [re.sub(r'@charset "[^"]*";', '', part) for part in parts]
+    site_css = '@charset "UTF-8";' + (fonts or '') + (icons or '') + ''.join(parts)
+
+    markup = Markup.from_templates(
+        get_template(name).template.source for name in settings.ASSET_CRITICAL_TEMPLATES
+    )
+    critical = critical_css(site_css, markup)
+
+    # Vendor builds are minified already; ';' guards against a missing final semicolon.
+    # Their source maps are not shipped, and collectstatic fails on missing ones
+    site_js = '\n;'.join(
+        re.sub(r'^//# sourceMappingURL=.*$', '', _read_static(path), flags=re.M).strip()
+        for path in settings.ASSET_BUNDLES['js']
+    )
+
+    outputs = {'site.css': site_css, 'site.js': site_js, CRITICAL_NAME: critical}
+    for name, text in outputs.items():
+        (build_dir / name).write_text(text, encoding='utf-8')
+    (build_dir / MANIFEST_NAME).write_text(json.dumps({
+        'css': f'{prefix}/site.css',
+        'js': f'{prefix}/site.js',
+        'icons': icons is not None,
+        'fonts': fonts is not None,
+    }), encoding='utf-8')
+
+    report = [_sizes(name, text.encode()) for name, text in outputs.items()]
+    report += [_sizes(f'{FONTS_DIR}/{path.name}', path.read_bytes()) for path in sorted(fonts_target.iterdir())]
+    return report
+
+
+# ==============================================================================
+# TEMPLATES
+# ==============================================================================
+
+@lru_cache(maxsize=4)
+def _read_manifest(path, mtime_ns):
+    manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    manifest['critical'] = (Path(path).parent / CRITICAL_NAME).read_text(encoding='utf-8')
+    return manifest
+
+
+def load_manifest():
+    """The last build's manifest with its critical CSS, or None before the first build"""
+    path = Path(settings.ASSET_BUILD_DIR) / MANIFEST_NAME
+    try:
+        mtime_ns = path.stat().st_mtime_ns  # a rebuild is picked up without a restart
+    except FileNotFoundError:
+        return None
+    return _read_manifest(str(path), mtime_ns)
@@ -0,0 +1,218 @@
+"""
+Core App Caching
+Versioned per-user portfolio cache
+
+Each user has a content version counter. Cached bundle keys embed that
+version, so invalidation is a single atomic increment: stale bundles are
+never read again and simply expire from the backend.
+
+The ``a``-prefixed functions are the async counterparts used by the ASGI
+views (see ASYNC_VIEWS); they share keys with the sync ones.
+"""
+
+import asyncio
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from .models import Profile, Project, SocialLink, Testimonial
+from .routers import use_primary
+
+# Bump when the snapshot layout changes so old bundles are ignored after deploy
+SNAPSHOT_SCHEMA = 2
+
+
+def get_portfolio_cache():
+    """Return the cache backend used for portfolio data"""
+    return caches[settings.PORTFOLIO_CACHE_ALIAS]
+
+
+def _version_key(user_id):
+    return f'portfolio:{user_id}:version'
+
+
+def _written_key(user_id):
+    return f'portfolio:{user_id}:written'
+
+
+def _modified_key(user_id):
+    return f'portfolio:{user_id}:modified'
+
+
+def _bundle_key(user_id, name, version):
+    return f'portfolio:{user_id}:{name}:s{SNAPSHOT_SCHEMA}:v{version}'
+
+
+def get_content_version(user_id):
+    """Get the current content version for a user (starts at 1)"""
+    cache = get_portfolio_cache()
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        # add() is a no-op if another process initialised the counter first
+        cache.add(_version_key(user_id), 1, timeout=None)
+        version = cache.get(_version_key(user_id), 1)
+    return version
+
+
+async def aget_content_version(user_id):
+    """Async get_content_version, for the ASGI views"""
+    cache = get_portfolio_cache()
+    version = await cache.aget(_version_key(user_id))
+    if version is None:
+        await cache.aadd(_version_key(user_id), 1, timeout=None)
+        version = await cache.aget(_version_key(user_id), 1)
+    return version
+
+
+def bump_content_version(user_id):
+    """Invalidate every cached bundle for a user by incrementing the version"""
+    if user_id is None:
+        return None
+
+    cache = get_portfolio_cache()
+    if settings.REPLICA_DATABASES:
+        # Set first: whoever sees the new version also sees this (see fresh_reads)
+        cache.set(_written_key(user_id), True, timeout=settings.REPLICA_PIN_SECONDS)
+    # Deletes and queryset.update() leave no updated_at behind (see core.public)
+    cache.set(_modified_key(user_id), timezone.now(), timeout=None)
+    try:
+        return cache.incr(_version_key(user_id))
+    except ValueError:
+        # Counter missing (evicted or never read): start above the default
+        cache.add(_version_key(user_id), 2, timeout=None)
+        return cache.get(_version_key(user_id))
+
+
+def get_content_modified(user_id):
+    """When the user's content version was last bumped, or None"""
+    return get_portfolio_cache().get(_modified_key(user_id))
+
+
+async def aget_content_modified(user_id):
+    """Async get_content_modified"""
+    return await get_portfolio_cache().aget(_modified_key(user_id))
+
+
+def fresh_reads(user_id):
+    """
+    Context for building a user's cache entries.
+
+    Right after a content change replicas may still serve the old rows,
+    which would then be cached under the new version; read from the
+    primary until REPLICA_PIN_SECONDS have passed.
+    """
+    if settings.REPLICA_DATABASES and get_portfolio_cache().get(_written_key(user_id)):
+        return use_primary()
+    return nullcontext()
+
+
+async def afresh_reads(user_id):
+    """Async fresh_reads: ``with await afresh_reads(user_id): ...``"""
+    if settings.REPLICA_DATABASES and await get_portfolio_cache().aget(_written_key(user_id)):
+        return use_primary()
+    return nullcontext()
+
+
+def bump_content_versions(user_ids):
+    """Invalidate cached bundles for several users (e.g. after queryset.update())"""
+    for user_id in set(user_ids):
+        bump_content_version(user_id)
+
+
+def update_and_invalidate(queryset, **values):
+    """
+    ``queryset.update(**values)``, invalidating every affected owner's bundles.
+
+    The rows are read first: the queryset may filter on a field being
+    changed (an admin changelist filtered on is_featured=No) and would match
+    nothing afterwards. Returns the primary keys of the updated rows.
+    """
+    rows = list(queryset.values_list('pk', 'user_id'))
+    if not rows:
+        return []
+    pks, user_ids = zip(*rows)
+    queryset.model._default_manager.filter(pk__in=pks).update(**values)
+    bump_content_versions(user_ids)
+    return list(pks)
+
+
+async def alist(queryset):
+    """Evaluate a queryset with the async ORM"""
+    return [obj async for obj in queryset.aiterator()]
+
+
+def portfolio_querysets(user):
+    """The homepage data: active profile, featured projects, social links, testimonials"""
+    return (
+        Profile.objects.filter(user=user, is_active=True),
+        Project.objects.filter(user=user, is_active=True, is_featured=True)[:6],
+        SocialLink.objects.filter(user=user, is_active=True),
+        Testimonial.objects.filter(user=user, is_active=True)[:3],
+    )
+
+
+def build_portfolio_snapshot(user):
+    """Load the per-user homepage data in one bundle"""
+    profiles, projects, social_links, testimonials = portfolio_querysets(user)
+    return {
+        'profile': profiles.first(),
+        'featured_projects': list(projects),
+        'social_links': list(social_links),
+        'testimonials': list(testimonials),
+    }
+
+
+async def abuild_portfolio_snapshot(user):
+    """Async build_portfolio_snapshot: the four queries are issued together"""
+    profiles, projects, social_links, testimonials = portfolio_querysets(user)
+    profile, projects, social_links, testimonials = await asyncio.gather(
+        profiles.afirst(), alist(projects), alist(social_links), alist(testimonials),
+    )
+    return {
+        'profile': profile,
+        'featured_projects': projects,
+        'social_links': social_links,
+        'testimonials': testimonials,
+    }
+
+
+def get_user_bundle(user, name, build):
+    """
+    Return the cached bundle ``name`` for a user, calling ``build(user)`` on a miss.
+
+    Every bundle is keyed on the user's content version, so any content
+    change invalidates all of that user's bundles at once.
+    """
+    cache = get_portfolio_cache()
+    key = _bundle_key(user.pk, name, get_content_version(user.pk))
+
+    bundle = cache.get(key)
+    if bundle is None:
+        with fresh_reads(user.pk):
+            bundle = build(user)
+        cache.set(key, bundle, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+    return bundle
+
+
+async def aget_user_bundle(user, name, abuild):
+    """Async get_user_bundle; ``abuild(user)`` is a coroutine function"""
+    cache = get_portfolio_cache()
+    key = _bundle_key(user.pk, name, await aget_content_version(user.pk))
+
+    bundle = await cache.aget(key)
+    if bundle is None:
+        with await afresh_reads(user.pk):
+            bundle = await abuild(user)
+        await cache.aset(key, bundle, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+    return bundle
+
+
+def get_portfolio_snapshot(user):
+    """Return the cached portfolio snapshot for a user, building it on a miss"""
+    return get_user_bundle(user, 'snapshot', build_portfolio_snapshot)
+
+
+async def aget_portfolio_snapshot(user):
+    """Async get_portfolio_snapshot"""
+    return await aget_user_bundle(user, 'snapshot', abuild_portfolio_snapshot)
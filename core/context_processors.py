@@ -4,7 +4,7 @@ Add global context variables to all templates
 """
 
 from django.conf import settings
-from .models import Profile, SocialLink
+from .middleware import get_portfolio
 
 
 def site_settings(request):
@@ -23,15 +23,29 @@ def site_settings(request):
 def profile_context(request):
     """Add user-specific profile to all templates"""
 
-    if request.user.is_authenticated:
-        profile = Profile.objects.filter(user=request.user, is_active=True).first()
-        social_links = SocialLink.objects.filter(user=request.user, is_active=True)
-    else:
-        profile = None
-        social_links = []
+    # Shares the request-scoped loader with the views, so nothing is fetched twice
+    portfolio = get_portfolio(request)
 
     return {
-        'site_profile': profile,
-        'social_links': social_links,
+        'site_profile': portfolio.profile,
+        'social_links': portfolio.social_links,
     }
 
+
+# First path segment -> navbar section (public /u/<username>/ pages included)
+NAV_SECTIONS = ('projects', 'services', 'skills', 'about', 'contact')
+
+
+def navigation(request):
+    """Add the navbar section the current page belongs to"""
+
+    segments = request.path.strip('/').split('/')
+    if segments[0] == 'u' and len(segments) >= 2:
+        segments = segments[2:]
+    first = segments[0] if segments else ''
+    if first == '':
+        section = 'home'
+    else:
+        section = first if first in NAV_SECTIONS else ''
+
+    return {'nav_section': section}
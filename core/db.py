@@ -0,0 +1,51 @@
+"""
+Database Profiles
+Per-connection tuning for the database selected with DB_ENGINE
+
+SQLite (single server): every new connection switches to WAL so readers
+never block on the writer, relaxes fsyncs to ``synchronous=NORMAL`` (safe
+in WAL mode: a power loss can only drop the last transactions, never
+corrupt the file), memory-maps the database, waits for locks instead of
+failing with "database is locked" and enlarges the page cache. The
+values live in SQLITE_PRAGMAS.
+
+PostgreSQL needs no per-connection setup: connections are persistent
+(CONN_MAX_AGE) and health-checked before reuse (CONN_HEALTH_CHECKS), and
+``.iterator()`` reads (exports, index rebuilds, gc_media) stream through
+server-side cursors unless DB_PGBOUNCER disables them.
+"""
+
+from django.conf import settings
+
+
+def configure_connection(sender, connection, **kwargs):
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection"""
+    if connection.vendor != 'sqlite':
+        return
+    cursor = connection.connection.cursor()
+    try:
+        for pragma, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+    finally:
+        cursor.close()
+
+
+def describe_database(connection):
+    """One-line summary of a connection's profile, for benchmarks and logs"""
+    settings_dict = connection.settings_dict
+    summary = f'{connection.vendor}, CONN_MAX_AGE={settings_dict["CONN_MAX_AGE"]}'
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            values = []
+            for pragma in ('journal_mode', 'synchronous', 'mmap_size', 'busy_timeout', 'cache_size'):
+                cursor.execute(f'PRAGMA {pragma}')
+                row = cursor.fetchone()  # no row for mmap_size on an in-memory database
+                if row:
+                    values.append(f'{pragma}={row[0]}')
+        summary += ', ' + ', '.join(values)
+    elif connection.vendor == 'postgresql':
+        summary += (
+            f', CONN_HEALTH_CHECKS={settings_dict["CONN_HEALTH_CHECKS"]}'
+            f', server-side cursors={"off" if settings_dict["DISABLE_SERVER_SIDE_CURSORS"] else "on"}'
+        )
+    return summary
@@ -0,0 +1,136 @@
+"""
+Multi-user GitHub Sync Scheduler
+Keep every portfolio with a GitHub username in sync from one long-lived process
+
+Users come from UserProfile.github_username. Due users are fanned out over a
+worker pool; all workers share one pooled HTTP session and one token bucket,
+so the combined request rate stays inside the GitHub quota. Progress is
+persisted per user in GitHubSyncCursor.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import F, Q
+from django.utils import timezone
+from core.github_utils import GitHubAPI, TokenBucket, build_session
+from core.models import GitHubSyncCursor
+
+
+class GitHubSyncScheduler:
+    """Sync all users with a GitHub username on a fixed interval"""
+
+    def __init__(self, workers=4, request_workers=GitHubAPI.MAX_WORKERS, interval=3600,
+                 retry_delay=300, auto_activate=False, rate_limiter=None, log=print):
+        self.workers = workers
+        self.request_workers = request_workers
+        self.interval = timedelta(seconds=interval)
+        self.retry_delay = timedelta(seconds=retry_delay)
+        self.auto_activate = auto_activate
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.session = build_session(settings.GITHUB_TOKEN, pool_size=workers * request_workers)
+        self.log = log
+
+    def due_users(self):
+        """Users with a GitHub username whose cursor is missing or due"""
+        now = timezone.now()
+        return (
+            User.objects.filter(is_active=True, user_profile__github_username__gt='')
+            .filter(
+                Q(github_sync_cursor__isnull=True)
+                | Q(github_sync_cursor__next_sync_at__isnull=True)
+                | Q(github_sync_cursor__next_sync_at__lte=now)
+            )
+            .select_related('user_profile')
+            .order_by(F('github_sync_cursor__next_sync_at').asc(nulls_first=True))
+        )
+
+    def sync_user(self, user):
+        """Sync one user's repositories and advance their cursor"""
+        api = GitHubAPI(
+            user=user,
+            session=self.session,
+            max_workers=self.request_workers,
+            rate_limiter=self.rate_limiter,
+        )
+        cursor, _ = GitHubSyncCursor.objects.get_or_create(
+            user=user, defaults={'github_username': api.username}
+        )
+        started = timezone.now()
+
+        try:
+            projects = api.sync_all_repos(auto_activate=self.auto_activate)
+            error = '\n'.join(api.stats.errors)
+        except Exception as e:
+            projects = []
+            error = str(e)
+
+        cursor.github_username = api.username
+        cursor.last_synced_at = started
+        cursor.last_error = error
+        cursor.repos_synced = len(projects)
+        cursor.requests_made = api.stats.requests_made
+        cursor.not_modified = api.stats.not_modified
+        if error:
+            cursor.next_sync_at = started + self.retry_delay
+        else:
+            cursor.last_success_at = started
+            cursor.next_sync_at = started + self.interval
+        cursor.save()
+        return cursor
+
+    def _sync_user_safely(self, user):
+        """sync_user, logging instead of raising so one user cannot stop the rest"""
+        try:
+            return self.sync_user(user)
+        except Exception as e:
+            self.log(f'Sync of {user.username} failed: {e}')
+            return None
+
+    def _sync_user_in_worker(self, user):
+        try:
+            return self._sync_user_safely(user)
+        finally:
+            # Worker threads own their database connection
+            connection.close()
+
+    def run_once(self):
+        """Sync every due user once; returns the updated cursors"""
+        users = list(self.due_users())
+        if not users:
+            return []
+
+        started = time.perf_counter()
+        if self.workers == 1:
+            results = [self._sync_user_safely(user) for user in users]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(self._sync_user_in_worker, users))
+
+        cursors = [cursor for cursor in results if cursor is not None]
+        failed = len(results) - len(cursors) + sum(1 for cursor in cursors if cursor.last_error)
+        requests_made = sum(cursor.requests_made for cursor in cursors)
+        not_modified = sum(cursor.not_modified for cursor in cursors)
+        self.log(
+            f'Synced {len(results)} user(s), {failed} failed: '
+            f'{requests_made} requests ({not_modified} not modified) '
+            f'in {time.perf_counter() - started:.2f}s'
+        )
+        return cursors
+
+    def run_forever(self, poll_interval=60):
+        """Keep syncing due users until interrupted"""
+        while True:
+            try:
+                cursors = self.run_once()
+            except Exception as e:
+                # e.g. the database went away while listing due users
+                self.log(f'Sync run failed: {e}')
+                connection.close()  # reconnect on the next run
+                cursors = []
+            if not cursors:
+                time.sleep(poll_interval)
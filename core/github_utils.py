@@ -1,46 +1,267 @@
 """
 GitHub Integration Utilities
 Fetch and sync GitHub repositories
+
+Requests go through one pooled session and are conditional: ETag and
+Last-Modified validators from previous responses are stored in
+GitHubResponseCache, so unchanged resources come back as 304 Not Modified
+and do not count against the GitHub rate limit.
 """
 
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
-from core.models import Project
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+from accounts.models import UserContentStats
+from core.cache import bump_content_versions
+from core.models import Project, GitHubResponseCache
+from core.search import index_objects
+from core.technologies import sync_technologies
+from core.slugs import next_free_value
+
+
+@dataclass
+class SyncStats:
+    """Counters for one sync run"""
+
+    requests_made: int = 0
+    not_modified: int = 0
+    skipped: int = 0
+    created: int = 0
+    updated: int = 0
+    errors: list = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_request(self, status_code):
+        with self._lock:
+            self.requests_made += 1
+            if status_code == 304:
+                self.not_modified += 1
+
+    def record_skip(self, count=1):
+        with self._lock:
+            self.skipped += count
+
+    def record_error(self, message):
+        with self._lock:
+            self.errors.append(message)
+
+    def record_writes(self, created=0, updated=0):
+        with self._lock:
+            self.created += created
+            self.updated += updated
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+
+    @property
+    def wall_time(self):
+        end = self.finished_at or time.perf_counter()
+        return end - self.started_at
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every sync worker.
+
+    Tokens refill at the GitHub hourly quota rate. Rate-limit response
+    headers correct the local estimate, and an exhausted quota blocks all
+    workers until GitHub's reset time.
+    """
+
+    def __init__(self, rate=5000 / 3600, capacity=50):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def release(self):
+        """Return a token for a request that did not count against the quota"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    def update_from_headers(self, headers):
+        """Apply X-RateLimit-Remaining / X-RateLimit-Reset from a response"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+
+        with self._lock:
+            remaining = int(remaining)
+            self.tokens = min(self.tokens, remaining)
+            reset = headers.get('X-RateLimit-Reset')
+            if remaining == 0 and reset:
+                self.blocked_until = time.monotonic() + max(0, int(reset) - time.time())
+
+
+def build_session(token='', pool_size=10):
+    """Create a pooled HTTP session for the GitHub API"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=2)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept'] = 'application/vnd.github+json'
+    if token:
+        session.headers['Authorization'] = f'token {token}'
+    return session
 
 
 class GitHubAPI:
     """GitHub API integration"""
 
     BASE_URL = 'https://api.github.com'
+    MAX_WORKERS = 8
+    TIMEOUT = 10
+
+    def __init__(self, username=None, token=None, base_url=None, session=None, max_workers=None,
+                 user=None, rate_limiter=None):
+        # Synced projects belong to ``user``; its UserProfile supplies the username
+        self.user = user
+        if username is None:
+            username = user.user_profile.github_username if user else settings.GITHUB_USERNAME
+        self.username = username
+        self.token = token if token is not None else settings.GITHUB_TOKEN
+        self.base_url = (base_url or getattr(settings, 'GITHUB_API_URL', '') or self.BASE_URL).rstrip('/')
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.session = session or build_session(self.token, pool_size=self.max_workers)
+        self.rate_limiter = rate_limiter
+        self.stats = SyncStats()
+
+        # url -> GitHubResponseCache (loaded once per run, written back in bulk)
+        self._cache = {}
+        self._dirty = {}
+        self._cache_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Conditional request plumbing
+    # ------------------------------------------------------------------
+
+    def load_response_cache(self):
+        """Load stored validators for this user's resources in one query"""
+        prefixes = (
+            f'{self.base_url}/users/{self.username}/',
+            f'{self.base_url}/repos/{self.username}/',
+        )
+        entries = GitHubResponseCache.objects.filter(
+            Q(url__startswith=prefixes[0]) | Q(url__startswith=prefixes[1])
+        )
+        self._cache = {entry.url: entry for entry in entries}
+
+    def save_response_cache(self):
+        """Upsert the validators and payloads of every 200 response"""
+        if not self._dirty:
+            return
+        GitHubResponseCache.objects.bulk_create(
+            list(self._dirty.values()),
+            update_conflicts=True,
+            unique_fields=['url'],
+            update_fields=['etag', 'last_modified', 'payload', 'next_url', 'fetched_at'],
+        )
+        self._dirty = {}
+
+    def _get(self, url, params=None):
+        """
+        Conditional GET returning (payload, next_url).
+
+        A 304 response is answered from the stored payload.
+        Raises requests.RequestException on failure.
+        """
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+
+        cached = self._cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(url, headers=headers, timeout=self.TIMEOUT)
+        self.stats.record_request(response.status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response.headers)
+            if response.status_code == 304:
+                # Conditional hits are free on GitHub
+                self.rate_limiter.release()
+
+        if response.status_code == 304 and cached is not None:
+            return cached.payload, cached.next_url
+
+        response.raise_for_status()
+        payload = response.json()
+        next_url = response.links.get('next', {}).get('url', '')
+
+        entry = GitHubResponseCache(
+            url=url,
+            etag=response.headers.get('ETag', ''),
+            last_modified=response.headers.get('Last-Modified', ''),
+            payload=payload,
+            next_url=next_url,
+        )
+        with self._cache_lock:
+            self._cache[url] = entry
+            self._dirty[url] = entry
+        return payload, next_url
 
-    def __init__(self):
-        self.username = settings.GITHUB_USERNAME
-        self.token = settings.GITHUB_TOKEN
-        self.headers = {}
-
-        if self.token:
-            self.headers['Authorization'] = f'token {self.token}'
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
 
     def get_user_repos(self, sort='updated', per_page=100):
-        """Get all user repositories"""
+        """Get all user repositories, following pagination links"""
 
         if not self.username:
             return []
 
-        url = f'{self.BASE_URL}/users/{self.username}/repos'
+        url = f'{self.base_url}/users/{self.username}/repos'
         params = {
             'sort': sort,
             'per_page': per_page,
             'type': 'owner'
         }
 
+        repos = []
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+            while url:
+                page, url = self._get(url, params)
+                params = None  # the next link already carries the query string
+                repos.extend(page)
         except requests.RequestException as e:
             print(f"Error fetching GitHub repos: {e}")
-            return []
+            self.stats.record_error(f"Error fetching GitHub repos: {e}")
+        return repos
 
     def get_repo_details(self, repo_name):
         """Get detailed information about a repository"""
@@ -48,14 +269,13 @@ class GitHubAPI:
         if not self.username:
             return None
 
-        url = f'{self.BASE_URL}/repos/{self.username}/{repo_name}'
+        url = f'{self.base_url}/repos/{self.username}/{repo_name}'
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get(url)[0]
         except requests.RequestException as e:
             print(f"Error fetching repo details: {e}")
+            self.stats.record_error(f"Error fetching repo details: {e}")
             return None
 
     def get_repo_languages(self, repo_name):
@@ -64,83 +284,241 @@ class GitHubAPI:
         if not self.username:
             return {}
 
-        url = f'{self.BASE_URL}/repos/{self.username}/{repo_name}/languages'
+        url = f'{self.base_url}/repos/{self.username}/{repo_name}/languages'
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get(url)[0]
         except requests.RequestException as e:
             print(f"Error fetching repo languages: {e}")
+            self.stats.record_error(f"Error fetching repo languages: {e}")
             return {}
 
-    def sync_repository_to_project(self, repo_data):
-        """Sync a GitHub repository to a Project instance"""
+    def _is_unchanged(self, repo):
+        """True if the stored details still match the repo listing entry"""
+        details_url = f'{self.base_url}/repos/{self.username}/{repo["name"]}'
+        details = self._cache.get(details_url)
+        languages = self._cache.get(f'{details_url}/languages')
+        if details is None or languages is None:
+            return False
+        return (
+            details.payload.get('updated_at') == repo.get('updated_at')
+            and details.payload.get('pushed_at') == repo.get('pushed_at')
+        )
+
+    def _fetch_repo_extras(self, repo):
+        """Fetch details and languages for one repository"""
+        details = self.get_repo_details(repo['name'])
+        languages = self.get_repo_languages(repo['name'])
+        merged = {**repo, **(details or {})}
+        merged['languages'] = languages or {}
+        return merged
+
+    def fetch_repos_with_extras(self, repos):
+        """
+        Enrich repositories with details and languages.
+
+        Repos whose listing entry is unchanged since the last run reuse the
+        stored payloads without any request; the rest are fetched concurrently
+        on a bounded thread pool.
+        """
+        enriched = {}
+        to_fetch = []
+        for repo in repos:
+            if self._is_unchanged(repo):
+                details_url = f'{self.base_url}/repos/{self.username}/{repo["name"]}'
+                merged = {**repo, **self._cache[details_url].payload}
+                merged['languages'] = self._cache[f'{details_url}/languages'].payload
+                enriched[repo['name']] = merged
+                self.stats.record_skip(2)
+            else:
+                to_fetch.append(repo)
+
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for merged in executor.map(self._fetch_repo_extras, to_fetch):
+                    enriched[merged['name']] = merged
+
+        # Preserve the listing order
+        return [enriched[repo['name']] for repo in repos]
+
+    # ------------------------------------------------------------------
+    # Project sync
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def project_fields_from_repo(repo_data):
+        """Map a repository payload to Project field values"""
 
-        # Extract data
         repo_name = repo_data.get('name', '')
-        description = repo_data.get('description', '')
-        html_url = repo_data.get('html_url', '')
-        homepage = repo_data.get('homepage', '')
-        stars = repo_data.get('stargazers_count', 0)
-        forks = repo_data.get('forks_count', 0)
-        language = repo_data.get('language', '')
+        description = repo_data.get('description', '') or ''
+        language = repo_data.get('language', '') or ''
         topics = repo_data.get('topics', [])
-        created_at = repo_data.get('created_at', '')
-        updated_at = repo_data.get('updated_at', '')
+        languages = repo_data.get('languages', {})
+
+        # Topics win, then languages by bytes of code, then the primary language
+        if topics:
+            technologies = ', '.join(topics)
+        elif languages:
+            technologies = ', '.join(sorted(languages, key=languages.get, reverse=True))
+        else:
+            technologies = language
+
+        return {
+            'title': repo_name.replace('-', ' ').replace('_', ' ').title(),
+            'description': description or f"GitHub repository: {repo_name}",
+            'short_description': description[:200],
+            'github_url': repo_data.get('html_url', ''),
+            'live_url': repo_data.get('homepage', '') or '',
+            'technologies': technologies,
+            'github_stars': repo_data.get('stargazers_count', 0),
+            'github_forks': repo_data.get('forks_count', 0),
+            'github_language': language,
+        }
+
+    @staticmethod
+    def apply_repo_changes(project, fields):
+        """
+        Copy synced values onto an existing project.
+
+        Returns the names of the fields that actually changed.
+        """
+        updates = {
+            'github_url': fields['github_url'],
+            'live_url': fields['live_url'] or project.live_url,
+            'github_stars': fields['github_stars'],
+            'github_forks': fields['github_forks'],
+            'github_language': fields['github_language'],
+        }
+        # Update technologies if not manually set
+        if not project.technologies or project.technologies == fields['github_language']:
+            updates['technologies'] = fields['technologies']
+
+        changed = []
+        for name, value in updates.items():
+            if getattr(project, name) != value:
+                setattr(project, name, value)
+                changed.append(name)
+        return changed
+
+    def sync_repository_to_project(self, repo_data):
+        """Sync a GitHub repository to a Project instance"""
+
+        fields = self.project_fields_from_repo(repo_data)
 
         # Get or create project
         project, created = Project.objects.get_or_create(
-            github_repo_name=repo_name,
-            defaults={
-                'title': repo_name.replace('-', ' ').replace('_', ' ').title(),
-                'description': description or f"GitHub repository: {repo_name}",
-                'short_description': description[:200] if description else '',
-                'github_url': html_url,
-                'live_url': homepage or '',
-                'technologies': ', '.join(topics) if topics else language,
-                'github_stars': stars,
-                'github_forks': forks,
-                'github_language': language,
-                'status': 'completed',
-            }
+            user=self.user,
+            github_repo_name=repo_data.get('name', ''),
+            defaults={**fields, 'status': 'completed'}
         )
 
         # Update if not created
-        if not created:
-            project.github_url = html_url
-            project.live_url = homepage or project.live_url
-            project.github_stars = stars
-            project.github_forks = forks
-            project.github_language = language
-
-            # Update technologies if not manually set
-            if not project.technologies or project.technologies == language:
-                project.technologies = ', '.join(topics) if topics else language
-
+        if not created and self.apply_repo_changes(project, fields):
             project.save()
 
         return project
 
-    def sync_all_repos(self, auto_activate=False):
-        """Sync all GitHub repositories to projects"""
+    def bulk_sync_repositories(self, repos, auto_activate=False):
+        """
+        Sync repositories to projects with a constant number of queries.
+
+        Existing projects are loaded in one query and diffed in memory; new
+        projects get their slugs allocated in memory and are inserted with
+        bulk_create, and only rows whose synced values changed are written
+        with bulk_update, all inside one transaction.
+        """
+        names = [repo.get('name', '') for repo in repos]
+        existing = {
+            project.github_repo_name: project
+            for project in Project.objects.filter(user=self.user, github_repo_name__in=names)
+        }
 
-        repos = self.get_user_repos()
+        now = timezone.now()
+        to_create, to_update, update_fields = [], [], {'updated_at'}
+        retagged = []
         synced_projects = []
+        taken_slugs = None
 
         for repo in repos:
-            # Skip forks if desired
-            if repo.get('fork', False):
-                continue
+            fields = self.project_fields_from_repo(repo)
+            project = existing.get(repo.get('name', ''))
+
+            if project is None:
+                if taken_slugs is None:
+                    taken_slugs = set(
+                        Project.objects.filter(user=self.user).values_list('slug', flat=True)
+                    )
+                project = Project(
+                    user=self.user,
+                    github_repo_name=repo.get('name', ''),
+                    status='completed',
+                    **fields
+                )
+                project.slug = next_free_value(slugify(project.title), taken_slugs)
+                taken_slugs.add(project.slug)
+                to_create.append(project)
+            else:
+                changed = self.apply_repo_changes(project, fields)
+                if auto_activate and not project.is_active:
+                    project.is_active = True
+                    changed.append('is_active')
+                if changed:
+                    project.updated_at = now
+                    update_fields.update(changed)
+                    to_update.append(project)
+                if 'technologies' in changed:
+                    retagged.append(project)
 
-            project = self.sync_repository_to_project(repo)
+            synced_projects.append(project)
 
-            if auto_activate and not project.is_active:
-                project.is_active = True
-                project.save()
+        with transaction.atomic():
+            if to_create:
+                Project.objects.bulk_create(to_create)
+            if to_update:
+                Project.objects.bulk_update(to_update, sorted(update_fields))
+            # bulk operations skip post_save: update the search index and
+            # technology tags with the rows
+            index_objects(to_create + to_update)
+            sync_technologies(to_create + retagged)
+
+        # ...and invalidate cached portfolios and keep the dashboard counters current
+        bump_content_versions(project.user_id for project in to_create + to_update)
+        for user_id, created in Counter(project.user_id for project in to_create).items():
+            if user_id is not None and not UserContentStats.adjust(user_id, 'projects_count', created):
+                UserContentStats.rebuild(user_id)
+
+        self.stats.record_writes(created=len(to_create), updated=len(to_update))
+        return synced_projects
 
-            synced_projects.append(project)
+    def sync_all_repos(self, auto_activate=False, batch=True):
+        """
+        Sync all GitHub repositories to projects
+
+        With ``batch`` (the default) rows are written with bulk_create and
+        bulk_update; otherwise each repository is saved individually.
+        """
+
+        self.stats = SyncStats()
+        self.load_response_cache()
+
+        repos = [repo for repo in self.get_user_repos() if not repo.get('fork', False)]
+        repos = self.fetch_repos_with_extras(repos)
 
+        if batch:
+            synced_projects = self.bulk_sync_repositories(repos, auto_activate=auto_activate)
+        else:
+            synced_projects = []
+            for repo in repos:
+                project = self.sync_repository_to_project(repo)
+
+                if auto_activate and not project.is_active:
+                    project.is_active = True
+                    project.save()
+
+                synced_projects.append(project)
+
+        self.save_response_cache()
+        self.stats.finish()
         return synced_projects
 
 
@@ -156,4 +534,3 @@ def sync_github_projects():
 
     print(f"Synced {len(projects)} projects from GitHub")
     return projects
-
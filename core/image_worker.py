@@ -0,0 +1,92 @@
+"""
+Image Worker
+Render queued ImageAsset variants outside the request cycle
+
+Pending rows are claimed in batches (FOR UPDATE SKIP LOCKED where the
+database supports it, so several workers can run side by side). Rows left
+in "processing" by a crashed worker are picked up again after
+IMAGE_WORKER_LEASE seconds. A failure is retried with exponential backoff;
+a file that keeps failing is marked failed after IMAGE_WORKER_MAX_ATTEMPTS
+tries and keeps being served as uploaded.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .images import process_asset
+from .models import ImageAsset
+
+
+class ImageWorker:
+    """Process queued images in batches"""
+
+    def __init__(self, batch_size=None, max_attempts=None, log=print):
+        self.batch_size = batch_size or settings.IMAGE_WORKER_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.IMAGE_WORKER_MAX_ATTEMPTS
+        self.log = log
+
+    def due(self):
+        """Pending rows whose retry time has come, plus rows abandoned mid-processing"""
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.IMAGE_WORKER_LEASE)
+        return ImageAsset.objects.filter(
+            Q(status='pending', next_attempt_at__lte=now)
+            | Q(status='processing', locked_at__lt=stale)
+        ).order_by('created_at')
+
+    def claim_batch(self):
+        """Mark up to ``batch_size`` due rows as processing and return them"""
+        with transaction.atomic():
+            assets = list(self.due().select_for_update(skip_locked=True)[:self.batch_size])
+            if assets:
+                ImageAsset.objects.filter(pk__in=[asset.pk for asset in assets]).update(
+                    status='processing', locked_at=timezone.now()
+                )
+        return assets
+
+    def process(self, assets):
+        """Process a claimed batch; returns (rendered, skipped, failed) counts"""
+        rendered = skipped = failed = 0
+        for asset in assets:
+            asset.attempts += 1
+            try:
+                if process_asset(asset):
+                    rendered += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                failed += 1
+                asset.last_error = str(e) or e.__class__.__name__
+                if asset.attempts >= self.max_attempts:
+                    asset.status = 'failed'
+                else:
+                    asset.status = 'pending'
+                    asset.next_attempt_at = timezone.now() + asset.retry_delay()
+                asset.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+        return rendered, skipped, failed
+
+    def run_once(self):
+        """Process every queued image; returns (rendered, skipped, failed) counts"""
+        totals = [0, 0, 0]
+        while True:
+            assets = self.claim_batch()
+            if not assets:
+                break
+            counts = self.process(assets)
+            for i, count in enumerate(counts):
+                totals[i] += count
+
+        if any(totals):
+            self.log('Image worker: {} rendered, {} unchanged, {} failed'.format(*totals))
+        return tuple(totals)
+
+    def run_forever(self, poll_interval=5):
+        """Keep processing until interrupted"""
+        while True:
+            rendered, skipped, failed = self.run_once()
+            if not (rendered or skipped):
+                time.sleep(poll_interval)
@@ -0,0 +1,265 @@
+"""
+Responsive Images
+Resized WebP / JPEG variants and blurhash placeholders for uploaded images
+
+Saving a model with an image field queues an ImageAsset for each uploaded
+file (one INSERT, nothing is decoded in the request). The image worker
+(core.image_worker / manage.py process_images) then:
+
+- hashes the original and skips all work when the hash is unchanged, or
+  copies the variants of another asset with the same content;
+- decodes once, resizes to every IMAGE_VARIANT_WIDTHS width below the
+  original and writes WebP plus JPEG (PNG when transparent) copies named
+  after the content hash, so identical uploads share files;
+- computes a blurhash and the average colour as a placeholder.
+
+The ``responsive_image`` template tag turns an ImageField into a
+<picture> with srcset, falling back to the original until it is ready.
+"""
+
+import hashlib
+import io
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image, ImageOps
+from .cache import bump_content_version
+from .models import ImageAsset
+
+# model label -> image field names
+IMAGE_FIELDS = {
+    'core.Profile': ['profile_picture'],
+    'core.Project': ['thumbnail', 'featured_image'],
+    'core.Testimonial': ['avatar'],
+    'services.Service': ['image'],
+    'education.Education': ['logo'],
+    'education.Certification': ['logo'],
+    'accounts.UserProfile': ['avatar'],
+}
+
+# Fallback format by whether the image has transparency
+FALLBACK_FORMATS = {False: ('JPEG', 'jpg'), True: ('PNG', 'png')}
+
+BLURHASH_COMPONENTS = (4, 3)
+_BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def enqueue_images(instance):
+    """Queue processing for every uploaded image of ``instance``"""
+    names = [
+        getattr(instance, name).name
+        for name in IMAGE_FIELDS.get(instance._meta.label, [])
+        if getattr(instance, name)
+    ]
+    if names:
+        # Already-known files are left alone; a new upload gets a new name
+        ImageAsset.objects.bulk_create(
+            [ImageAsset(source=name, user_id=instance.user_id) for name in names],
+            ignore_conflicts=True,
+        )
+
+
+# ----------------------------------------------------------------------
+# Blurhash (https://blurha.sh)
+# ----------------------------------------------------------------------
+
+def _base83(value, length):
+    return ''.join(_BASE83[value // 83 ** (length - i - 1) % 83] for i in range(length))
+
+
+def _srgb_to_linear(value):
+    value /= 255
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value):
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(image, components=BLURHASH_COMPONENTS):
+    """
+    Encode an RGB image as a blurhash.
+
+    Returns ``(hash, average colour as #rrggbb)``. The image is shrunk to
+    32x32 first; the placeholder carries no more detail than that.
+    """
+    cx, cy = components
+    small = image.convert('RGB').resize((32, 32), Image.BILINEAR)
+    width, height = small.size
+    pixels = [tuple(_srgb_to_linear(c) for c in pixel) for pixel in small.getdata()]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(cx)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(cy)]
+
+    factors = []
+    for j in range(cy):
+        for i in range(cx):
+            scale = (1 if i == j == 0 else 2) / (width * height)
+            r = g = b = 0.0
+            for y in range(height):
+                row, cos_j = y * width, cos_y[j][y]
+                for x in range(width):
+                    basis = cos_x[i][x] * cos_j
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    average = tuple(_linear_to_srgb(c) for c in dc)
+
+    encoded = _base83((cx - 1) + (cy - 1) * 9, 1)
+    if ac:
+        quantised_max = max(0, min(82, int(max(abs(c) for f in ac for c in f) * 166 - 0.5)))
+        max_value = (quantised_max + 1) / 166
+    else:
+        quantised_max, max_value = 0, 1
+    encoded += _base83(quantised_max, 1)
+    encoded += _base83((average[0] << 16) + (average[1] << 8) + average[2], 4)
+
+    def quantise(value):
+        scaled = math.copysign(abs(value / max_value) ** 0.5, value)
+        return max(0, min(18, int(math.floor(scaled * 9 + 9.5))))
+
+    for r, g, b in ac:
+        encoded += _base83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+
+    return encoded, '#{:02x}{:02x}{:02x}'.format(*average)
+
+
+# ----------------------------------------------------------------------
+# Processing
+# ----------------------------------------------------------------------
+
+def file_hash(storage, name):
+    digest = hashlib.sha256()
+    with storage.open(name, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def variant_widths(width):
+    """Target widths for an image ``width`` pixels wide (never upscaled)"""
+    widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < width]
+    if width <= max(settings.IMAGE_VARIANT_WIDTHS):
+        widths.append(width)
+    return sorted(widths) or [width]
+
+
+def _save_variant(storage, image, digest, width, fmt, ext, **options):
+    name = f'{settings.IMAGE_VARIANT_DIR}/{digest[:2]}/{digest[:24]}-{width}.{ext}'
+    if not storage.exists(name):  # content-addressed: same hash, same bytes
+        buffer = io.BytesIO()
+        image.save(buffer, fmt, **options)
+        name = storage.save(name, ContentFile(buffer.getvalue()))
+    return name
+
+
+def render_variants(storage, source, digest):
+    """Decode ``source`` once and write every variant; returns the asset fields"""
+    with storage.open(source, 'rb') as f:
+        image = Image.open(f)
+        image.draft('RGB', (max(settings.IMAGE_VARIANT_WIDTHS),) * 2)  # JPEG: decode at reduced scale
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    transparent = image.mode in ('RGBA', 'LA') or 'transparency' in image.info
+    image = image.convert('RGBA' if transparent else 'RGB')
+    fallback, fallback_ext = FALLBACK_FORMATS[transparent]
+
+    variants = []
+    resized = image
+    # Largest first, each step resized from the previous one
+    for width in reversed(variant_widths(image.width)):
+        height = max(1, round(image.height * width / image.width))
+        if resized.width != width:
+            resized = resized.resize((width, height), Image.LANCZOS)
+        variants.append({
+            'width': width, 'height': height, 'format': 'webp',
+            'name': _save_variant(storage, resized, digest, width, 'WEBP', 'webp',
+                                  quality=settings.IMAGE_WEBP_QUALITY, method=4),
+        })
+        variants.append({
+            'width': width, 'height': height, 'format': fallback_ext,
+            'name': _save_variant(storage, resized, digest, width, fallback, fallback_ext,
+                                  quality=settings.IMAGE_JPEG_QUALITY, optimize=True),
+        })
+
+    hash_value, color = blurhash(resized)
+    largest = variants[0]
+    variants.sort(key=lambda v: (v['format'], v['width']))
+    return {
+        'width': largest['width'],
+        'height': largest['height'],
+        'variants': variants,
+        'blurhash': hash_value,
+        'placeholder_color': color,
+    }
+
+
+def process_asset(asset, storage=None):
+    """
+    Fill in an ImageAsset; returns True if images were rendered.
+
+    Unchanged content (same hash as last time, or as another finished
+    asset) is not decoded again.
+    """
+    storage = storage or default_storage
+    digest = file_hash(storage, asset.source)
+
+    if digest == asset.content_hash and asset.variants:
+        fields, rendered = {}, False
+    else:
+        donor = ImageAsset.objects.filter(content_hash=digest, status='ready').exclude(pk=asset.pk).first()
+        if donor is not None:
+            fields = {name: getattr(donor, name) for name in
+                      ('width', 'height', 'variants', 'blurhash', 'placeholder_color')}
+            rendered = False
+        else:
+            fields, rendered = render_variants(storage, asset.source, digest), True
+
+    for name, value in fields.items():
+        setattr(asset, name, value)
+    asset.content_hash = digest
+    asset.status = 'ready'
+    asset.last_error = ''
+    asset.processed_at = timezone.now()
+    asset.save()
+
+    cache.delete(_variants_key(asset.source))
+    # Cached pages of the owner still point at the original
+    bump_content_version(asset.user_id)
+    return rendered
+
+
+# ----------------------------------------------------------------------
+# Lookup
+# ----------------------------------------------------------------------
+
+def _variants_key(source):
+    return 'image:' + hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+def get_image_asset(source):
+    """
+    Ready variant data for a stored file name, or None.
+
+    Looked up once and cached; files not processed yet are cached as
+    missing for IMAGE_PENDING_CACHE_TIMEOUT seconds.
+    """
+    key = _variants_key(source)
+    data = cache.get(key)
+    if data is None:
+        data = ImageAsset.objects.filter(source=source, status='ready').values(
+            'width', 'height', 'variants', 'blurhash', 'placeholder_color'
+        ).first() or {}
+        cache.set(key, data, timeout=None if data else settings.IMAGE_PENDING_CACHE_TIMEOUT)
+    return data or None
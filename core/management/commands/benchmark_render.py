@@ -0,0 +1,84 @@
+"""
+Management command to measure template render CPU per page
+Usage: python manage.py benchmark_render [--user USERNAME] [--requests N] [--pages home,projects]
+
+Every page is requested with {% portfolio_cache %} fragments disabled and
+then enabled, with warm data caches in both runs, so the difference is the
+render work the fragments save. Run with DEBUG=False to measure the cached
+template loader used in production.
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.urls import reverse
+
+# Public /u/<username>/ pages are served from the full-page cache and barely render
+DEFAULT_PAGES = ('home', 'projects', 'about', 'skills', 'services')
+
+
+class Command(BaseCommand):
+    help = 'Compare per-request render CPU time with and without template fragment caching'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            help='Username to log in as (default: the user with the most projects)',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per page and mode',
+        )
+        parser.add_argument(
+            '--pages',
+            default=','.join(DEFAULT_PAGES),
+            help='Comma-separated URL names to measure',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"❌ User {options['user']!r} not found")
+        else:
+            user = User.objects.annotate(project_count=Count('projects')).order_by('-project_count', 'pk').first()
+            if user is None:
+                raise CommandError('❌ No users; create one first (python manage.py create_test_user)')
+
+        host = next((host for host in settings.ALLOWED_HOSTS if '*' not in host), 'localhost').lstrip('.')
+        client = Client(HTTP_HOST=host)
+        client.force_login(user)
+
+        loader = 'cached' if not settings.DEBUG else 'uncached (DEBUG)'
+        self.stdout.write(f'User: {user.username}, {options["requests"]} request(s) per page, {loader} template loader\n')
+        self.stdout.write(f'{"page":<14}{"no fragments":>14}{"fragments":>12}{"saved":>8}')
+
+        for name in filter(None, (page.strip() for page in options['pages'].split(','))):
+            url = reverse(name)
+            with override_settings(FRAGMENT_CACHE_ENABLED=False):
+                uncached = self.measure(client, url, options['requests'])
+            cached = self.measure(client, url, options['requests'])
+
+            self.stdout.write(
+                f'{name:<14}{uncached * 1000:>11.2f} ms{cached * 1000:>9.2f} ms'
+                f'{(1 - cached / uncached) * 100 if uncached else 0:>7.0f}%'
+            )
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark complete'))
+
+    def measure(self, client, url, count):
+        """Mean CPU seconds per request, after a warm-up request"""
+        # secure: production settings redirect plain HTTP
+        response = client.get(url, secure=True)
+        if response.status_code != 200:
+            raise CommandError(f'❌ {url} returned {response.status_code}')
+        started = time.process_time()
+        for _ in range(count):
+            client.get(url, secure=True)
+        return (time.process_time() - started) / count
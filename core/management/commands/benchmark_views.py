@@ -0,0 +1,163 @@
+"""
+Management command to measure the main pages against the configured database
+Usage: python manage.py benchmark_views [--user USERNAME] [--requests N] [--concurrency N]
+       [--cold] [--writer] [--pages home,skills]
+
+Run it once per database profile to compare them, e.g.
+    DB_ENGINE=sqlite SQLITE_JOURNAL_MODE=DELETE python manage.py benchmark_views --concurrency 4 --writer
+    DB_ENGINE=sqlite python manage.py benchmark_views --concurrency 4 --writer
+    DB_ENGINE=postgresql python manage.py benchmark_views --concurrency 4 --writer
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from core.cache import bump_content_version
+from core.db import describe_database
+from core.models import Profile
+
+DEFAULT_PAGES = ('home', 'about', 'projects', 'skills', 'services', 'public_home')
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Command(BaseCommand):
+    help = 'Measure requests/s and latency of the main pages against the configured database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            help='Username to log in as (default: the user with the most projects)',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per page',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Threads issuing requests, each with its own database connection',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=10,
+            help='Unmeasured requests per page first',
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help="Invalidate the user's cached content before every request, so each one hits the database",
+        )
+        parser.add_argument(
+            '--writer',
+            action='store_true',
+            help='Keep writing to the database from another thread meanwhile (admin / contact form traffic)',
+        )
+        parser.add_argument(
+            '--pages',
+            default=','.join(DEFAULT_PAGES),
+            help='Comma-separated URL names to measure',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"❌ User {options['user']!r} not found")
+        else:
+            user = User.objects.annotate(project_count=Count('projects')).order_by('-project_count', 'pk').first()
+            if user is None:
+                raise CommandError('❌ No users; create one first (python manage.py create_test_user)')
+
+        self.user = user
+        self.cold = options['cold']
+        self.host = next((host for host in settings.ALLOWED_HOSTS if '*' not in host), 'localhost').lstrip('.')
+
+        self.stdout.write(f'Database: {describe_database(connection)}')
+        self.stdout.write(f'User: {user.username}, {options["concurrency"]} thread(s), '
+                          f'{options["requests"]} request(s) per page{", cold cache" if self.cold else ""}'
+                          f'{", concurrent writer" if options["writer"] else ""}\n')
+        self.stdout.write(f'{"page":<14}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"errors":>8}')
+
+        stop = threading.Event()
+        writer = None
+        if options['writer']:
+            writer = threading.Thread(target=self.write_loop, args=(stop,), daemon=True)
+            writer.start()
+
+        try:
+            for name in filter(None, (page.strip() for page in options['pages'].split(','))):
+                url = reverse(name, kwargs={'username': user.username} if name.startswith('public_') else None)
+                self.run_requests(url, options['warmup'], 1)
+                latencies, errors, elapsed = self.run_requests(url, options['requests'], options['concurrency'])
+                self.stdout.write(
+                    f'{name:<14}{len(latencies) / elapsed:>10.1f}'
+                    f'{percentile(latencies, 0.5) * 1000:>10.2f}{percentile(latencies, 0.99) * 1000:>10.2f}'
+                    f'{errors:>8}'
+                )
+        finally:
+            stop.set()
+            if writer is not None:
+                writer.join()
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark complete'))
+
+    def run_requests(self, url, count, concurrency):
+        """Issue ``count`` GETs of ``url``; returns (latencies, errors, wall time)"""
+        latencies, errors = [], []
+        per_thread = [count // concurrency + (i < count % concurrency) for i in range(concurrency)]
+
+        started = time.perf_counter()
+        if concurrency == 1:
+            self.client_loop(url, count, latencies, errors)
+        else:
+            threads = [
+                threading.Thread(target=self.client_loop, args=(url, n, latencies, errors, True))
+                for n in per_thread
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return latencies, len(errors), time.perf_counter() - started
+
+    def client_loop(self, url, count, latencies, errors, own_connection=False):
+        client = Client(HTTP_HOST=self.host)
+        client.force_login(self.user)
+        try:
+            for _ in range(count):
+                if self.cold:
+                    bump_content_version(self.user.pk)
+                started = time.perf_counter()
+                response = client.get(url, secure=True)  # production settings redirect plain HTTP
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+        finally:
+            if own_connection:
+                connections.close_all()
+
+    def write_loop(self, stop):
+        """Small writes, as the admin and contact form would make them"""
+        try:
+            while not stop.is_set():
+                Profile.objects.filter(user=self.user).update(updated_at=timezone.now())
+                stop.wait(0.01)
+        finally:
+            connections.close_all()
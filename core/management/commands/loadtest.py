@@ -0,0 +1,312 @@
+"""
+Management command to load the site over HTTP, WSGI and ASGI deployments side by side
+Usage: python manage.py loadtest [--url http://127.0.0.1:8000] [--compare] [--workers N] [--threads N]
+       [--concurrency N] [--duration SECONDS] [--user USERNAME] [--pages home,public_home]
+
+--compare starts gunicorn (resumeproject.wsgi, sync views) and uvicorn
+(resumeproject.asgi, async views) with the same number of worker processes,
+one after the other, and loads both the same way. Without it, the server at
+--url is loaded as it is, e.g.
+    uvicorn resumeproject.asgi:application --workers 2 --port 8000
+    python manage.py loadtest --url http://127.0.0.1:8000 --concurrency 64
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+from core.management.commands.benchmark_views import percentile
+
+DEFAULT_PAGES = (
+    'home', 'about', 'skills', 'services',
+    'public_home', 'public_about', 'public_skills', 'public_services',
+)
+
+# Both servers run from BASE_DIR with the current environment plus these
+SERVERS = {
+    'wsgi': {
+        'command': ['gunicorn', 'resumeproject.wsgi:application', '--workers', '{workers}',
+                    '--threads', '{threads}', '--bind', '127.0.0.1:{port}', '--log-level', 'warning'],
+        'env': {'ASYNC_VIEWS': 'False'},
+    },
+    'asgi': {
+        'command': ['uvicorn', 'resumeproject.asgi:application', '--workers', '{workers}',
+                    '--host', '127.0.0.1', '--port', '{port}', '--log-level', 'warning', '--no-access-log'],
+        'env': {'ASYNC_VIEWS': 'True'},
+    },
+}
+
+READY_TIMEOUT = 30
+CONNECTION_ERRORS = (OSError, asyncio.IncompleteReadError, ValueError)
+
+
+async def fetch(reader, writer, request):
+    """
+    Send one request on a keep-alive connection and read the whole response.
+
+    Returns (status, keep_alive).
+    """
+    writer.write(request)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError('Connection closed by the server')
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip().lower()
+
+    keep_alive = headers.get('connection') != 'close'
+    if 'content-length' in headers:
+        await reader.readexactly(int(headers['content-length']))
+    elif headers.get('transfer-encoding') == 'chunked':
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.read()
+        keep_alive = False
+    return int(status_line.split()[1]), keep_alive
+
+
+async def connection_loop(host, port, request, deadline, latencies, errors):
+    """One client: request after request on a single connection until ``deadline``"""
+    writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            started = time.perf_counter()
+            status, keep_alive = await fetch(reader, writer, request)
+        except CONNECTION_ERRORS:
+            errors.append('connection')
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.01)
+            continue
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            errors.append(status)
+        if not keep_alive:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(host, port, request, concurrency, duration):
+    """``concurrency`` clients for ``duration`` seconds; returns (latencies, errors, wall time)"""
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        connection_loop(host, port, request, started + duration, latencies, errors)
+        for _ in range(concurrency)
+    ))
+    return latencies, errors, time.perf_counter() - started
+
+
+def build_request(host, path, cookie=None):
+    lines = [f'GET {path} HTTP/1.1', f'Host: {host}', 'Accept: text/html', 'Connection: keep-alive']
+    if cookie:
+        lines.append(f'Cookie: {cookie}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = 'Load the site over HTTP with concurrent keep-alive clients, optionally WSGI against ASGI'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Running server to load (ignored with --compare)',
+        )
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help='Start gunicorn (WSGI) and uvicorn (ASGI) in turn and load both',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=2,
+            help='Worker processes per server (--compare)',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='Threads per gunicorn worker (--compare)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Concurrent client connections',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10,
+            help='Seconds of load per page',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=float,
+            default=2,
+            help='Unmeasured seconds of load per page first',
+        )
+        parser.add_argument(
+            '--user',
+            help='Username to log in as and whose public pages to load (default: the user with the most projects)',
+        )
+        parser.add_argument(
+            '--pages',
+            default=','.join(DEFAULT_PAGES),
+            help='Comma-separated URL names to measure',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"❌ User {options['user']!r} not found")
+        else:
+            user = User.objects.annotate(project_count=Count('projects')).order_by('-project_count', 'pk').first()
+            if user is None:
+                raise CommandError('❌ No users; create one first (python manage.py create_test_user)')
+
+        # A session stored in the database, shared with the servers under test
+        client = Client()
+        client.force_login(user)
+        cookie = f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}'
+
+        self.pages = []
+        for name in filter(None, (page.strip() for page in options['pages'].split(','))):
+            public = name.startswith('public_')
+            url = reverse(name, kwargs={'username': user.username} if public else None)
+            self.pages.append((name, url, None if public else cookie))
+
+        self.stdout.write(f'User: {user.username}, {options["concurrency"]} connection(s), '
+                          f'{options["duration"]:g}s per page\n')
+
+        if not options['compare']:
+            url = urlsplit(options['url'])
+            if url.scheme != 'http' or not url.hostname:
+                raise CommandError(f"❌ Only plain http:// URLs are supported, got {options['url']!r}")
+            self.load_server(url.hostname, url.port or 80, options)
+            self.stdout.write(self.style.SUCCESS('✅ Load test complete'))
+            return
+
+        results = {}
+        for kind, server in SERVERS.items():
+            if shutil.which(server['command'][0]) is None:
+                raise CommandError(f"❌ {server['command'][0]} is not installed (pip install {server['command'][0]})")
+        for kind, server in SERVERS.items():
+            port = free_port()
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f'{kind.upper()}: {server["command"][0]}, {options["workers"]} worker(s)'
+            ))
+            with ServerProcess(server, port, options):
+                results[kind] = self.load_server('127.0.0.1', port, options)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('ASGI against WSGI'))
+        self.stdout.write(f'{"page":<16}{"req/s":>10}{"p99":>10}')
+        for name, _, _ in self.pages:
+            wsgi, asgi = results['wsgi'][name], results['asgi'][name]
+            self.stdout.write(
+                f'{name:<16}{asgi["rps"] / wsgi["rps"]:>9.2f}x'
+                f'{asgi["p99"] / wsgi["p99"]:>9.2f}x'
+            )
+        self.stdout.write(self.style.SUCCESS('✅ Load test complete'))
+
+    def load_server(self, host, port, options):
+        """Load each page in turn; prints and returns {page: {rps, p50, p99, errors}}"""
+        results = {}
+        self.stdout.write(f'{"page":<16}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"errors":>8}')
+        for name, path, cookie in self.pages:
+            request = build_request(host, path, cookie)
+            if options['warmup']:
+                asyncio.run(run_load(host, port, request, options['concurrency'], options['warmup']))
+            latencies, errors, elapsed = asyncio.run(
+                run_load(host, port, request, options['concurrency'], options['duration'])
+            )
+            if not latencies:
+                raise CommandError(f'❌ No responses from {host}:{port} for {path} ({len(errors)} error(s))')
+            results[name] = {
+                'rps': len(latencies) / elapsed,
+                'p50': percentile(latencies, 0.5),
+                'p99': percentile(latencies, 0.99),
+                'errors': len(errors),
+            }
+            self.stdout.write(
+                f'{name:<16}{results[name]["rps"]:>10.1f}'
+                f'{results[name]["p50"] * 1000:>10.2f}{results[name]["p99"] * 1000:>10.2f}'
+                f'{len(errors):>8}'
+            )
+        return results
+
+
+class ServerProcess:
+    """Run a server for the duration of a ``with`` block, once it answers"""
+
+    def __init__(self, server, port, options):
+        self.command = [part.format(port=port, **options) for part in server['command']]
+        # Plain HTTP on loopback: no HTTPS redirect, and the loopback host allowed
+        self.env = {**os.environ, 'SECURE_SSL_REDIRECT': 'False', **server['env']}
+        self.port = port
+
+    def __enter__(self):
+        self.log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            self.command, cwd=settings.BASE_DIR, env=self.env,
+            stdout=subprocess.DEVNULL, stderr=self.log,
+        )
+        deadline = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                socket.create_connection(('127.0.0.1', self.port), timeout=1).close()
+                return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise CommandError(f"❌ {' '.join(self.command)} did not start:\n{self.output()}")
+
+    def __exit__(self, *exc_info):
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+    def output(self):
+        self.log.seek(0)
+        return self.log.read().decode(errors='replace')[-2000:]
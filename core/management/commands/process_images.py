@@ -0,0 +1,58 @@
+"""
+Management command to render queued responsive image variants
+Usage: python manage.py process_images [--once] [--batch-size N] [--poll S] [--enqueue-existing]
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from core.image_worker import ImageWorker
+from core.images import IMAGE_FIELDS, enqueue_images
+
+
+class Command(BaseCommand):
+    help = 'Generate resized WebP/JPEG variants and blurhash placeholders for uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the queued images and exit',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Images claimed per batch (default: IMAGE_WORKER_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--poll',
+            type=int,
+            default=5,
+            help='Seconds to wait when the queue is empty',
+        )
+        parser.add_argument(
+            '--enqueue-existing',
+            action='store_true',
+            help='Queue every image already uploaded before starting',
+        )
+
+    def handle(self, *args, **options):
+        if options['enqueue_existing']:
+            for label in IMAGE_FIELDS:
+                for instance in apps.get_model(label).objects.iterator():
+                    enqueue_images(instance)
+
+        worker = ImageWorker(batch_size=options['batch_size'], log=self.stdout.write)
+
+        if options['once']:
+            rendered, skipped, failed = worker.run_once()
+            self.stdout.write(self.style.SUCCESS(
+                f'✅ {rendered} rendered, {skipped} unchanged, {failed} failed'
+            ))
+            return
+
+        self.stdout.write(self.style.WARNING('Processing queued images (Ctrl+C to stop)...'))
+        try:
+            worker.run_forever(poll_interval=options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Stopped.'))
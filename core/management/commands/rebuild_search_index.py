@@ -0,0 +1,23 @@
+"""
+Management command to rebuild the full-text search index
+Usage: python manage.py rebuild_search_index
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from core.models import SearchDocument
+from core.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Recreate every search document from projects, services, skills and certifications'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING('Rebuilding search index...'))
+        started = time.perf_counter()
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Indexed {SearchDocument.objects.count()} document(s) '
+            f'in {time.perf_counter() - started:.2f}s'
+        ))
@@ -0,0 +1,22 @@
+"""
+Management command to rebuild the normalized technology tags
+Usage: python manage.py rebuild_technologies
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from core.technologies import rebuild_technologies
+
+
+class Command(BaseCommand):
+    help = 'Re-sync technology tags from Project.technologies and drop unused technologies'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING('Rebuilding technology tags...'))
+        started = time.perf_counter()
+        synced, removed = rebuild_technologies()
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Synced {synced} project(s), removed {removed} unused technolog(ies) '
+            f'in {time.perf_counter() - started:.2f}s'
+        ))
@@ -1,10 +1,11 @@
 """
 Management command to sync GitHub repositories
-Usage: python manage.py sync_github
+Usage: python manage.py sync_github [--activate] [--request-workers N] [--per-row]
+       python manage.py sync_github --all-users --workers N [--interval S] [--once]
 """
 
-from django.core.management.base import BaseCommand
-from core.github_utils import sync_github_projects
+from django.core.management.base import BaseCommand, CommandError
+from core.github_utils import GitHubAPI
 
 
 class Command(BaseCommand):
@@ -16,14 +17,62 @@ class Command(BaseCommand):
             action='store_true',
             help='Automatically activate synced projects',
         )
+        parser.add_argument(
+            '--request-workers',
+            type=int,
+            default=GitHubAPI.MAX_WORKERS,
+            help='Concurrent requests for per-repository details and languages',
+        )
+        parser.add_argument(
+            '--per-row',
+            action='store_true',
+            help='Save each project individually instead of bulk upserting',
+        )
+        parser.add_argument(
+            '--all-users',
+            action='store_true',
+            help='Continuously sync every user with a GitHub username in their profile',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Users synced in parallel (with --all-users, default: 4)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=3600,
+            help='Seconds between syncs of the same user (with --all-users)',
+        )
+        parser.add_argument(
+            '--poll',
+            type=int,
+            default=60,
+            help='Seconds to wait when no user is due (with --all-users)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Sync the users that are due and exit (with --all-users)',
+        )
 
     def handle(self, *args, **options):
+        if options['all_users']:
+            return self.handle_all_users(options)
+        if options['workers'] is not None:
+            raise CommandError(
+                '❌ --workers sets how many users are synced in parallel and needs --all-users; '
+                'use --request-workers for concurrent requests'
+            )
+
         self.stdout.write(self.style.WARNING('Syncing GitHub repositories...'))
 
         try:
-            from core.github_utils import GitHubAPI
-            api = GitHubAPI()
-            projects = api.sync_all_repos(auto_activate=options.get('activate', False))
+            api = GitHubAPI(max_workers=options['request_workers'])
+            projects = api.sync_all_repos(
+                auto_activate=options.get('activate', False),
+                batch=not options['per_row'],
+            )
 
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully synced {len(projects)} projects from GitHub')
@@ -34,8 +83,50 @@ class Command(BaseCommand):
                 stars = f'⭐ {project.github_stars}' if project.github_stars else ''
                 self.stdout.write(f'  {status} {project.title} {stars}')
 
+            stats = api.stats
+            self.stdout.write(
+                f'\nRequests made: {stats.requests_made} '
+                f'(304 Not Modified: {stats.not_modified}, '
+                f'skipped as unchanged: {stats.skipped})'
+            )
+            if not options['per_row']:
+                self.stdout.write(f'Projects created: {stats.created}, updated: {stats.updated}')
+            self.stdout.write(f'Wall time: {stats.wall_time:.2f}s')
+
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'Error syncing GitHub projects: {str(e)}')
             )
 
+    def handle_all_users(self, options):
+        """Run the multi-user scheduler"""
+        from core.github_scheduler import GitHubSyncScheduler
+
+        if options['workers'] is None:
+            options['workers'] = 4
+
+        scheduler = GitHubSyncScheduler(
+            workers=options['workers'],
+            request_workers=options['request_workers'],
+            interval=options['interval'],
+            auto_activate=options['activate'],
+            log=self.stdout.write,
+        )
+
+        if options['once']:
+            cursors = scheduler.run_once()
+            for cursor in cursors:
+                if cursor.last_error:
+                    self.stdout.write(self.style.ERROR(f'  ✗ {cursor}: {cursor.last_error}'))
+                else:
+                    self.stdout.write(f'  ✓ {cursor}: {cursor.repos_synced} repos')
+            return
+
+        self.stdout.write(self.style.WARNING(
+            f'Syncing all users every {options["interval"]}s with {options["workers"]} workers '
+            '(Ctrl+C to stop)...'
+        ))
+        try:
+            scheduler.run_forever(poll_interval=options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Stopped.'))
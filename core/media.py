@@ -0,0 +1,273 @@
+"""
+Media Serving
+Production view for uploaded files (resumes, images)
+
+Every request is checked against the rows that reference the file: uploads
+of a user whose profile is not public (``is_profile_public``) are only
+served to that user and to staff, and files no row references are not
+served at all. Owners are cached per name, visibility per content version.
+
+Downloads support conditional GET (ETag / Last-Modified) and single byte
+ranges (206 / 416), so interrupted resume downloads and PDF viewers resume
+instead of starting over. The body is a FileResponse: under gunicorn it
+goes through ``wsgi.file_wrapper``, i.e. ``sendfile()`` without copying
+through Python. With MEDIA_ACCEL_MODE set, Django only checks access and
+the web server streams the file, so a slow client never holds a worker:
+
+    # MEDIA_ACCEL_MODE=nginx, MEDIA_ACCEL_PREFIX=/protected-media/
+    location /protected-media/ {
+        internal;
+        alias /srv/app/media/;
+    }
+
+    # MEDIA_ACCEL_MODE=sendfile (Apache mod_xsendfile, lighttpd)
+    XSendFile On
+    XSendFilePath /srv/app/media
+
+Content-addressed names (see core.storage) never change their bytes, so
+they are sent with a year-long ``Cache-Control: immutable``; other files
+are revalidated.
+"""
+
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import SuspiciousFileOperation
+from django.db.models import IntegerField, Value
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views.decorators.http import require_safe
+from .media_gc import file_fields
+from .models import ImageAsset
+from .public import is_public_owner
+from .storage import content_hash_from_name, is_immutable_media, variant_source_hash
+
+# Read size when Django streams the file itself (no wsgi.file_wrapper)
+STREAM_BLOCK_SIZE = 256 * 1024
+
+BYTE_RANGE = re.compile(r'^bytes=(?P<start>\d*)-(?P<end>\d*)$')
+
+
+# ----------------------------------------------------------------------
+# Access
+# ----------------------------------------------------------------------
+
+def _owners_key(name):
+    return 'media:owners:' + hashlib.sha256(name.encode()).hexdigest()[:32]
+
+
+def _referencing_owners(name):
+    """Owner ids of every row referencing ``name`` (None for site-wide rows), in one query"""
+    parts = []
+    for model, field in file_fields():
+        rows = model._default_manager.filter(**{field.attname: name}).order_by()
+        if any(f.name == 'user' for f in model._meta.concrete_fields):
+            parts.append(rows.values_list('user_id', flat=True))
+        else:
+            parts.append(rows.values_list(Value(None, output_field=IntegerField()), flat=True))
+
+    source_hash = variant_source_hash(name)
+    if source_hash:
+        parts.append(
+            ImageAsset.objects.filter(content_hash__startswith=source_hash).order_by()
+            .values_list('user_id', flat=True)
+        )
+    return set(parts[0].union(*parts[1:]))
+
+
+def media_owner_ids(name):
+    """
+    Users whose rows reference the stored file ``name``.
+
+    ``None`` stands for rows without an owner (site-wide uploads); an empty
+    set means nothing references the file. Cached for
+    MEDIA_ACCESS_CACHE_TIMEOUT seconds: a new upload gets a new name, so
+    only removed references are seen late.
+    """
+    key = _owners_key(name)
+    owners = cache.get(key)
+    if owners is None:
+        owners = list(_referencing_owners(name))
+        cache.set(key, owners, timeout=settings.MEDIA_ACCESS_CACHE_TIMEOUT)
+    return set(owners)
+
+
+def media_visibility(request, name):
+    """'public', 'private' (only this viewer may see it) or None if the file is not served"""
+    owners = media_owner_ids(name)
+    if not owners:
+        return None
+    # Public files are decided without touching the session (no Vary: Cookie)
+    if None in owners or any(is_public_owner(owner) for owner in owners):
+        return 'public'
+    user = request.user
+    if user.is_staff or (user.is_authenticated and user.pk in owners):
+        return 'private'
+    return None
+
+
+# ----------------------------------------------------------------------
+# Ranges
+# ----------------------------------------------------------------------
+
+class FileRange:
+    """
+    The ``length`` bytes of an open file starting at its current position.
+
+    Exposes ``fileno()`` so a WSGI file wrapper can still sendfile() it;
+    gunicorn sends exactly Content-Length bytes from the current offset.
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Resolve a Range header against a file of ``size`` bytes.
+
+    Returns an inclusive ``(start, end)``, None to send the whole file
+    (no header, a unit other than bytes, several ranges or an invalid
+    one) or ``'unsatisfiable'``.
+    """
+    match = BYTE_RANGE.match(header.strip()) if header else None
+    if match is None or size == 0:
+        return None
+
+    start, end = match['start'], match['end']
+    if not start:
+        if not end:
+            return None
+        suffix = int(end)  # bytes=-500: the last 500 bytes
+        if suffix == 0:
+            return 'unsatisfiable'
+        return max(0, size - suffix), size - 1
+
+    start = int(start)
+    if end and int(end) < start:
+        return None
+    if start >= size:
+        return 'unsatisfiable'
+    end = min(int(end), size - 1) if end else size - 1
+    return start, end
+
+
+def _range_applies(request, etag, last_modified):
+    """If-Range: only resume a download whose file has not changed since"""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+# ----------------------------------------------------------------------
+# View
+# ----------------------------------------------------------------------
+
+def _accel_response(name, path, content_type):
+    """Empty response telling the web server to send the file itself"""
+    response = HttpResponse(content_type=content_type)
+    if settings.MEDIA_ACCEL_MODE == 'nginx':
+        response['X-Accel-Redirect'] = quote(settings.MEDIA_ACCEL_PREFIX.rstrip('/') + '/' + name)
+    else:
+        response['X-Sendfile'] = path
+    return response
+
+
+def _file_response(request, path, info, content_type, etag, last_modified):
+    """200 or 206 streamed from disk, 416 for a range past the end"""
+    byte_range = None
+    if _range_applies(request, etag, last_modified):
+        byte_range = parse_range(request.headers.get('Range'), info.st_size)
+
+    if byte_range == 'unsatisfiable':
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{info.st_size}'
+        return response
+
+    start, end = byte_range or (0, info.st_size - 1)
+    length = end - start + 1
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+    else:
+        f = open(path, 'rb')
+        f.seek(start)
+        response = FileResponse(FileRange(f, length), content_type=content_type)
+        response.block_size = STREAM_BLOCK_SIZE
+    response['Content-Length'] = length
+    if byte_range:
+        response.status_code = 206
+        response['Content-Range'] = f'bytes {start}-{end}/{info.st_size}'
+    return response
+
+
+@require_safe
+def serve_media(request, path, document_root=None):
+    """Serve an uploaded file after checking who may see it"""
+    name = posixpath.normpath(path).lstrip('/')
+    try:
+        full_path = safe_join(document_root or settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404('Invalid media path')
+
+    visibility = media_visibility(request, name)
+    try:
+        info = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        info = None
+    if visibility is None or info is None or not stat.S_ISREG(info.st_mode):
+        raise Http404('Media file not found')
+
+    last_modified = int(info.st_mtime)
+    # Hashed names are their own strong validator
+    content_hash = content_hash_from_name(name)
+    etag = quote_etag(content_hash or f'{info.st_mtime_ns:x}-{info.st_size:x}')
+
+    # Headers shared by 200, 206 and 304 responses
+    headers = HttpResponse()
+    headers['ETag'] = etag
+    headers['Last-Modified'] = http_date(last_modified)
+    headers['Accept-Ranges'] = 'bytes'
+    cache_control = {'public': True} if visibility == 'public' else {'private': True}
+    if is_immutable_media(name):
+        patch_cache_control(headers, max_age=settings.MEDIA_IMMUTABLE_MAX_AGE, immutable=True, **cache_control)
+    else:
+        patch_cache_control(headers, no_cache=True, **cache_control)
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=last_modified, response=headers)
+    if conditional is not headers:
+        return conditional
+
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    if settings.MEDIA_ACCEL_MODE:
+        response = _accel_response(name, full_path, content_type)
+    else:
+        response = _file_response(request, full_path, info, content_type, etag, last_modified)
+    for header in ('ETag', 'Last-Modified', 'Accept-Ranges', 'Cache-Control'):
+        response[header] = headers[header]
+    return response
@@ -0,0 +1,177 @@
+"""
+Media Garbage Collection
+Remove uploaded files and blobs that no database row references
+
+References are streamed from every FileField/ImageField column. ImageAsset
+rows whose original is no longer referenced are deleted, and the variant
+lists of the remaining ones are added. Then the upload directories are
+walked once: unreferenced files go, then blobs (core.storage) whose hash no
+remaining name uses and that no hard link still points at. Files and rows
+younger than the grace period are left alone, since their row may not be
+committed yet.
+"""
+
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import FileField
+from .models import ImageAsset
+from .storage import BLOB_DIR, TMP_DIR, content_hash_from_name
+
+
+def file_fields():
+    """(model, field) for every FileField/ImageField in the project"""
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, FileField):
+                yield model, field
+
+
+def file_references(chunk_size=2000):
+    """Stream every stored file name referenced from a FileField/ImageField"""
+    for model, field in file_fields():
+        names = (
+            model._default_manager.exclude(**{field.attname: ''})
+            .exclude(**{f'{field.attname}__isnull': True})
+            .values_list(field.attname, flat=True)
+        )
+        yield from names.iterator(chunk_size=chunk_size)
+
+
+def stale_image_assets(sources, cutoff, chunk_size=2000):
+    """Ids of ImageAsset rows created before ``cutoff`` whose original is not in ``sources``"""
+    rows = (
+        ImageAsset.objects.filter(created_at__lte=datetime.fromtimestamp(cutoff, tz=timezone.utc))
+        .values_list('pk', 'source')
+    )
+    return [pk for pk, source in rows.iterator(chunk_size=chunk_size) if source not in sources]
+
+
+def variant_references(exclude=(), chunk_size=2000):
+    """Stream the variant file names of every ImageAsset not in ``exclude``"""
+    rows = ImageAsset.objects.exclude(pk__in=exclude).values_list('variants', flat=True)
+    for variants in rows.iterator(chunk_size=chunk_size):
+        for variant in variants:
+            yield variant['name']
+
+
+def media_roots():
+    """Top-level media directories that only hold uploads and generated files"""
+    roots = {settings.IMAGE_VARIANT_DIR}
+    for _, field in file_fields():
+        if isinstance(field.upload_to, str) and field.upload_to.strip('/'):
+            roots.add(field.upload_to.strip('/').split('/')[0])
+    return sorted(roots)
+
+
+def walk_files(path):
+    """Yield a DirEntry for every file below ``path``"""
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
+
+def prune_empty_dirs(path):
+    """Remove empty directories below ``path`` (left behind by sharding)"""
+    for directory, subdirs, files in os.walk(path, topdown=False):
+        if directory != path and not files and not os.listdir(directory):
+            os.rmdir(directory)
+
+
+def changed_at(info):
+    """
+    When a file was last written or linked.
+
+    A deduplicated upload is a new hard link to an existing blob and keeps the
+    blob's old mtime; linking only updates the inode's ctime.
+    """
+    return max(info.st_mtime, info.st_ctime)
+
+
+@dataclass
+class GCStats:
+    """Counters for one gc_media run"""
+
+    referenced: int = 0
+    assets_removed: int = 0
+    files_scanned: int = 0
+    files_removed: int = 0
+    blobs_scanned: int = 0
+    blobs_removed: int = 0
+    bytes_freed: int = 0
+    # Bytes that would be stored again without deduplication
+    bytes_shared: int = 0
+
+
+def collect_garbage(storage, grace=None, dry_run=False, log=print):
+    """Delete unreferenced media files and blobs; returns GCStats"""
+    grace = settings.MEDIA_GC_GRACE if grace is None else grace
+    cutoff = time.time() - grace
+    stats = GCStats()
+
+    referenced = set(file_references())
+    # Replaced or deleted images: their variants are orphans too
+    stale = stale_image_assets(referenced, cutoff)
+    stats.assets_removed = len(stale)
+    if stale:
+        log(f'remove {len(stale)} image asset row(s)')
+    if not dry_run:
+        for start in range(0, len(stale), 500):
+            ImageAsset.objects.filter(pk__in=stale[start:start + 500]).delete()
+    referenced.update(variant_references(exclude=stale if dry_run else ()))
+    # Reference count per blob: how many referenced names share its content
+    blob_refs = Counter(filter(None, map(content_hash_from_name, referenced)))
+    stats.referenced = len(referenced)
+
+    for root in media_roots():
+        for entry in walk_files(storage.path(root)):
+            stats.files_scanned += 1
+            name = os.path.relpath(entry.path, storage.location).replace(os.sep, '/')
+            info = entry.stat(follow_symlinks=False)
+            if name in referenced or changed_at(info) > cutoff:
+                continue
+            log(f'remove {name}')
+            if info.st_nlink == 1:
+                stats.bytes_freed += info.st_size  # otherwise the blob still holds the data
+            if not dry_run:
+                os.unlink(entry.path)
+            stats.files_removed += 1
+
+    for entry in walk_files(storage.path(BLOB_DIR)):
+        stats.blobs_scanned += 1
+        info = entry.stat(follow_symlinks=False)
+        refs = blob_refs.get(entry.name, 0)
+        if refs:
+            stats.bytes_shared += info.st_size * (refs - 1)
+            continue
+        # A link left by a name inside the grace period keeps the blob alive
+        # (a dry run has not removed the unreferenced names, so ignore links).
+        # Not ctime: removing the names above has just updated it
+        if info.st_mtime > cutoff or (info.st_nlink > 1 and not dry_run):
+            continue
+        log(f'remove blob {entry.name}')
+        stats.bytes_freed += info.st_size
+        if not dry_run:
+            os.unlink(entry.path)
+        stats.blobs_removed += 1
+
+    if not dry_run:
+        # Spool files left behind by interrupted uploads
+        for entry in walk_files(storage.path(TMP_DIR)):
+            if entry.stat().st_mtime <= cutoff:
+                os.unlink(entry.path)
+        for root in media_roots() + [BLOB_DIR]:
+            prune_empty_dirs(storage.path(root))
+
+    return stats
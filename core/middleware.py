@@ -0,0 +1,205 @@
+"""
+Core App Middleware
+Attach a request-scoped portfolio loader as ``request.portfolio`` and
+route read-only views to database replicas
+
+Every middleware here runs natively under both WSGI and ASGI, so an ASGI
+deployment does not hop threads per middleware.
+"""
+
+from functools import cached_property
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+from .cache import aget_portfolio_snapshot, get_portfolio_snapshot
+from .routers import allow_replica_reads, begin_request, end_request
+from .shortcuts import aget_user
+
+# Set after a write; while present the client reads from the primary
+PRIMARY_PIN_COOKIE = 'primary_pin'
+
+
+class PortfolioLoader:
+    """
+    Lazily load the current user's portfolio data at most once per request.
+
+    Views and context processors share the same instance, so a page that
+    renders the profile in both the view and the navbar pays for it once.
+    Public pages pass ``user`` to load the portfolio owner instead of the
+    visitor.
+    """
+
+    def __init__(self, request, user=None):
+        self.request = request
+        if user is not None:
+            self.user = user
+
+    @cached_property
+    def user(self):
+        user = getattr(self.request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return user
+        return None
+
+    @staticmethod
+    def empty_snapshot():
+        return {
+            'profile': None,
+            'featured_projects': [],
+            'social_links': [],
+            'testimonials': [],
+        }
+
+    @cached_property
+    def snapshot(self):
+        if self.user is None:
+            return self.empty_snapshot()
+        return get_portfolio_snapshot(self.user)
+
+    async def aload(self):
+        """
+        Load the user and the snapshot with the async APIs (async views).
+
+        The properties used while rendering then need no query.
+        """
+        if 'user' not in self.__dict__:
+            user = await aget_user(self.request)
+            self.user = user if user.is_authenticated else None
+        if 'snapshot' not in self.__dict__:
+            if self.user is None:
+                self.snapshot = self.empty_snapshot()
+            else:
+                self.snapshot = await aget_portfolio_snapshot(self.user)
+        return self
+
+    @property
+    def profile(self):
+        return self.snapshot['profile']
+
+    @property
+    def featured_projects(self):
+        return self.snapshot['featured_projects']
+
+    @property
+    def social_links(self):
+        return self.snapshot['social_links']
+
+    @property
+    def testimonials(self):
+        return self.snapshot['testimonials']
+
+
+class PortfolioMiddleware:
+    """Expose ``request.portfolio`` (must run after AuthenticationMiddleware)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        request.portfolio = PortfolioLoader(request)
+        return self.get_response(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let views marked with ``replica_reads`` read from replicas (core.routers).
+
+    Must run before SessionMiddleware, so session writes count as writes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Django would otherwise call the sync hook through a thread
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = begin_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            state = end_request(token)
+        return self.pin_writer(response, state)
+
+    async def __acall__(self, request):
+        token = begin_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            state = end_request(token)
+        return self.pin_writer(response, state)
+
+    def pin_writer(self, response, state):
+        """Keep a client that wrote on the primary until replicas caught up"""
+        if state.wrote and settings.REPLICA_DATABASES:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE, '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            getattr(view_func, 'replica_reads', False)
+            and request.method in ('GET', 'HEAD')
+            and PRIMARY_PIN_COOKIE not in request.COOKIES
+        ):
+            allow_replica_reads()
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        ReplicaRoutingMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also runs natively under ASGI.
+
+    WhiteNoise's middleware is sync-only, so under ASGI Django would call
+    every request below it through async_to_sync. Finding a static file is
+    a dict lookup (unless WHITENOISE_AUTOREFRESH) and needs no thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+def get_portfolio(request):
+    """Return the request's loader, creating one if the middleware is not installed"""
+    portfolio = getattr(request, 'portfolio', None)
+    if portfolio is None:
+        portfolio = request.portfolio = PortfolioLoader(request)
+    return portfolio
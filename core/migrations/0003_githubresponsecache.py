@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_profile_options_profile_user_project_user_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubResponseCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.CharField(help_text='Full request URL', max_length=500, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=200)),
+                ('last_modified', models.CharField(blank=True, max_length=100)),
+                ('payload', models.JSONField(default=dict, help_text='Last 200 response body')),
+                ('next_url', models.CharField(blank=True, help_text='Pagination link from the last 200 response', max_length=500)),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'GitHub Response Cache',
+                'verbose_name_plural': 'GitHub Response Cache',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_githubresponsecache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubSyncCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('github_username', models.CharField(help_text='Username synced in the last run', max_length=100)),
+                ('next_sync_at', models.DateTimeField(blank=True, help_text='When the user is due again', null=True)),
+                ('last_synced_at', models.DateTimeField(blank=True, null=True)),
+                ('last_success_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('repos_synced', models.PositiveIntegerField(default=0)),
+                ('requests_made', models.PositiveIntegerField(default=0)),
+                ('not_modified', models.PositiveIntegerField(default=0)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='github_sync_cursor', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'GitHub Sync Cursor',
+                'verbose_name_plural': 'GitHub Sync Cursors',
+                'ordering': ['next_sync_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_technologies(apps, schema_editor):
+    """Split every existing Project.technologies value into technology links"""
+    Project = apps.get_model('core', 'Project')
+    Technology = apps.get_model('core', 'Technology')
+    ProjectTechnology = apps.get_model('core', 'ProjectTechnology')
+
+    technology_ids = {}
+    links = []
+    for project_id, value in Project.objects.values_list('pk', 'technologies').iterator():
+        seen = set()
+        for name in (tech.strip() for tech in (value or '').split(',')):
+            slug = slugify(name.replace('+', ' plus ').replace('#', ' sharp '))[:120]
+            if not slug or slug in seen:
+                continue
+            seen.add(slug)
+            if slug not in technology_ids:
+                technology_ids[slug] = Technology.objects.create(name=name[:100], slug=slug).pk
+            links.append(ProjectTechnology(
+                project_id=project_id, technology_id=technology_ids[slug], position=len(seen) - 1,
+            ))
+    ProjectTechnology.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_searchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=120, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Technology',
+                'verbose_name_plural': 'Technologies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectTechnology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='technology_links', to='core.project')),
+                ('technology', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_links', to='core.technology')),
+            ],
+            options={
+                'verbose_name': 'Project Technology',
+                'verbose_name_plural': 'Project Technologies',
+                'ordering': ['project', 'position'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technology_tags',
+            field=models.ManyToManyField(blank=True, related_name='projects', through='core.ProjectTechnology', to='core.technology'),
+        ),
+        migrations.AddIndex(
+            model_name='projecttechnology',
+            index=models.Index(fields=['technology', 'project'], name='projecttechnology_tech_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='projecttechnology',
+            constraint=models.UniqueConstraint(fields=('project', 'technology'), name='projecttechnology_uniq'),
+        ),
+        migrations.RunPython(populate_technologies, migrations.RunPython.noop),
+    ]
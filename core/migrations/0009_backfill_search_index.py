@@ -0,0 +1,68 @@
+# Generated by Django 5.0.6 on 2026-10-17 01:10
+
+from django.db import migrations
+from django.urls import reverse
+
+
+def _filter_tokens(user_id, is_active):
+    if not user_id:
+        return ''
+    return f'u{user_id} a{user_id}' if is_active else f'u{user_id}'
+
+
+def _documents(apps):
+    """(kind, instance, title, body, url) for every searchable row, as core.search builds them"""
+    for project in apps.get_model('core', 'Project').objects.order_by('pk').iterator():
+        yield 'project', project, project.title, [
+            project.short_description, project.description, project.technologies, project.github_language,
+        ], reverse('project_detail', kwargs={'slug': project.slug})
+    for service in apps.get_model('services', 'Service').objects.order_by('pk').iterator():
+        yield 'service', service, service.title, [
+            service.short_description, service.description, service.features,
+        ], reverse('service_detail', kwargs={'slug': service.slug})
+    for skill in apps.get_model('education', 'Skill').objects.order_by('pk').iterator():
+        yield 'skill', skill, skill.name, [
+            skill.get_category_display(), skill.description,
+        ], reverse('skills') + f'#skill-{skill.pk}'
+    for certification in apps.get_model('education', 'Certification').objects.order_by('pk').iterator():
+        yield 'certification', certification, certification.name, [
+            certification.issuing_organization, certification.credential_id, certification.description,
+        ], reverse('skills') + f'#certification-{certification.pk}'
+
+
+def backfill_search_index(apps, schema_editor):
+    """Index the content that existed before core/0006 added the search index"""
+    SearchDocument = apps.get_model('core', 'SearchDocument')
+    documents = [
+        SearchDocument(
+            kind=kind,
+            object_id=instance.pk,
+            user_id=instance.user_id,
+            is_active=instance.is_active,
+            filters=_filter_tokens(instance.user_id, instance.is_active),
+            title=title,
+            body=' '.join(filter(None, body)),
+            url=url,
+        )
+        for kind, instance, title, body, url in _documents(apps)
+    ]
+    SearchDocument.objects.bulk_create(
+        documents,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=['user', 'title', 'body', 'url', 'is_active', 'filters', 'updated_at'],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_imageasset'),
+        ('education', '0003_user_active_indexes'),
+        ('services', '0004_service_rendered_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-17 01:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_backfill_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageasset',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -3,11 +3,26 @@ Core App Models
 Handles portfolio profile, projects, social links, and testimonials
 """
 
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import URLValidator, MinValueValidator, MaxValueValidator
-from django.utils.text import slugify
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.text import slugify
+from .slugs import UniqueSlugMixin
+
+
+def parse_technologies(value):
+    """Split a comma separated technologies string into a tuple of names"""
+    return tuple(tech.strip() for tech in (value or '').split(',') if tech.strip())
+
+
+def technology_slug(name):
+    """Case-insensitive key for a technology name ("C++" -> "c-plus-plus")"""
+    return slugify(name.replace('+', ' plus ').replace('#', ' sharp '))
 
 
 class Profile(models.Model):
@@ -76,7 +91,7 @@ class Profile(models.Model):
         return f"{self.full_name} ({self.user.username})"
 
 
-class Project(models.Model):
+class Project(UniqueSlugMixin, models.Model):
     """Portfolio Projects"""
 
     PROJECT_STATUS = [
@@ -132,6 +147,13 @@ class Project(models.Model):
         max_length=500,
         help_text="Technologies used (comma separated)"
     )
+    # Normalized copy of ``technologies``, kept in sync by core.technologies
+    technology_tags = models.ManyToManyField(
+        'Technology',
+        through='ProjectTechnology',
+        related_name='projects',
+        blank=True,
+    )
 
     # Status
     status = models.CharField(
@@ -172,27 +194,70 @@ class Project(models.Model):
         verbose_name_plural = "Projects"
         ordering = ['order', '-created_at']
         unique_together = [['user', 'slug']]
+        indexes = [
+            models.Index(
+                fields=['user', 'order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='project_user_active_idx',
+            ),
+            models.Index(
+                fields=['user', 'order', '-created_at'],
+                condition=models.Q(is_active=True, is_featured=True),
+                name='project_user_featured_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.user.username})"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Project.objects.filter(user=self.user, slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        return super().save(*args, **kwargs)
-
     def get_absolute_url(self):
         return reverse('project_detail', kwargs={'slug': self.slug})
 
     def get_technologies_list(self):
-        """Return technologies as a list"""
-        return [tech.strip() for tech in self.technologies.split(',') if tech.strip()]
+        """Return technologies as a tuple, parsed once per field value"""
+        cached = self.__dict__.get('_technologies_cache')
+        if cached is None or cached[0] != self.technologies:
+            cached = (self.technologies, parse_technologies(self.technologies))
+            self._technologies_cache = cached
+        return cached[1]
+
+
+class Technology(models.Model):
+    """A technology tag shared by every project that uses it"""
+
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=120, unique=True)
+
+    class Meta:
+        verbose_name = "Technology"
+        verbose_name_plural = "Technologies"
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class ProjectTechnology(models.Model):
+    """Project <-> Technology link, in the order the project lists them"""
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='technology_links')
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name='project_links')
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Project Technology"
+        verbose_name_plural = "Project Technologies"
+        ordering = ['project', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'technology'], name='projecttechnology_uniq'),
+        ]
+        indexes = [
+            # "Projects by technology" walks this index from the technology side
+            models.Index(fields=['technology', 'project'], name='projecttechnology_tech_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} - {self.technology_id}"
 
 
 class SocialLink(models.Model):
@@ -226,6 +291,13 @@ class SocialLink(models.Model):
         verbose_name = "Social Link"
         verbose_name_plural = "Social Links"
         ordering = ['order', 'platform']
+        indexes = [
+            models.Index(
+                fields=['user', 'order', 'platform'],
+                condition=models.Q(is_active=True),
+                name='sociallink_user_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.get_platform_display()}"
@@ -275,8 +347,160 @@ class Testimonial(models.Model):
         verbose_name = "Testimonial"
         verbose_name_plural = "Testimonials"
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(
+                fields=['user', 'order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='testimonial_user_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.company} ({self.user.username})"
 
 
+class GitHubResponseCache(models.Model):
+    """Stored GitHub API responses used for conditional (ETag) requests"""
+
+    url = models.CharField(max_length=500, unique=True, help_text="Full request URL")
+    etag = models.CharField(max_length=200, blank=True)
+    last_modified = models.CharField(max_length=100, blank=True)
+    payload = models.JSONField(default=dict, help_text="Last 200 response body")
+    next_url = models.CharField(
+        max_length=500,
+        blank=True,
+        help_text="Pagination link from the last 200 response"
+    )
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "GitHub Response Cache"
+        verbose_name_plural = "GitHub Response Cache"
+
+    def __str__(self):
+        return self.url
+
+
+class GitHubSyncCursor(models.Model):
+    """Per-user GitHub sync progress, used by the multi-user scheduler"""
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='github_sync_cursor')
+    github_username = models.CharField(max_length=100, help_text="Username synced in the last run")
+
+    next_sync_at = models.DateTimeField(blank=True, null=True, help_text="When the user is due again")
+    last_synced_at = models.DateTimeField(blank=True, null=True)
+    last_success_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    # Last run counters
+    repos_synced = models.PositiveIntegerField(default=0)
+    requests_made = models.PositiveIntegerField(default=0)
+    not_modified = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "GitHub Sync Cursor"
+        verbose_name_plural = "GitHub Sync Cursors"
+        ordering = ['next_sync_at']
+
+    def __str__(self):
+        return f"{self.github_username} ({self.user.username})"
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized text of one searchable object (see core.search).
+
+    The full-text index itself lives outside the ORM: an FTS5 table kept in
+    sync by triggers on SQLite, a generated tsvector column with a GIN
+    index on PostgreSQL. Both are created by migration 0006.
+    """
+
+    KIND_CHOICES = [
+        ('project', 'Project'),
+        ('service', 'Service'),
+        ('skill', 'Skill'),
+        ('certification', 'Certification'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='search_documents', null=True, blank=True)
+
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=500, blank=True)
+    is_active = models.BooleanField(default=True)
+    # Owner/state tokens ("u42 a42") indexed alongside the text, so
+    # per-user searches are intersected inside the full-text index
+    filters = models.CharField(max_length=100, blank=True, editable=False)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='searchdocument_kind_object_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
+
+
+class ImageAsset(models.Model):
+    """
+    Responsive variants of one uploaded image (see core.images).
+
+    Rows are queued when a model with an image field is saved and filled in
+    by the image worker: resized WebP + JPEG/PNG copies stored under
+    content-hashed names, the original size and a blurhash placeholder.
+    """
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+
+    # Storage name of the original upload
+    source = models.CharField(max_length=255, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='image_assets', null=True, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    # Size of the largest variant
+    width = models.PositiveIntegerField(blank=True, null=True)
+    height = models.PositiveIntegerField(blank=True, null=True)
+    # [{"width": 320, "height": 180, "format": "webp", "name": "variants/ab/abcd...-320.webp"}, ...]
+    variants = models.JSONField(default=list, blank=True)
+    blurhash = models.CharField(max_length=64, blank=True)
+    placeholder_color = models.CharField(max_length=7, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Image Asset"
+        verbose_name_plural = "Image Assets"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status__in=['pending', 'processing']),
+                name='imageasset_queue_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.source} ({self.get_status_display()})"
+
+    def retry_delay(self):
+        """Exponential backoff after ``attempts`` failures, capped"""
+        delay = settings.IMAGE_WORKER_RETRY_DELAY * 2 ** max(self.attempts - 1, 0)
+        return timedelta(seconds=min(delay, settings.IMAGE_WORKER_MAX_RETRY_DELAY))
@@ -0,0 +1,247 @@
+"""
+Public Portfolio Pages
+Serve ``/u/<username>/`` pages from a full-page cache
+
+A username resolves to its owner through a small cached lookup, and the
+rendered HTML is cached under the owner's content version (see core.cache).
+ETags are derived from that version, so a revalidating visitor gets a 304
+and a first-time visitor a cache hit without a single database query.
+
+``apublic_page`` is the async counterpart for ASGI deployments (see
+ASYNC_VIEWS); both share the same cache entries.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.db.models import Max
+from django.http import Http404, HttpResponse
+from django.shortcuts import render
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+from .cache import (
+    SNAPSHOT_SCHEMA, _bundle_key, afresh_reads, aget_content_modified, fresh_reads, get_content_modified,
+    get_content_version, get_portfolio_cache,
+)
+from .middleware import PortfolioLoader
+from .routers import replica_reads, use_primary
+
+# Models whose updated_at feeds the Last-Modified header
+LAST_MODIFIED_MODELS = (
+    'core.Profile',
+    'core.Project',
+    'education.Skill',
+    'education.Education',
+    'education.Certification',
+    'services.Service',
+)
+
+
+def _owner_key(username):
+    return f'portfolio:owner:{username}'
+
+
+def get_public_owner_id(username):
+    """Return the user id behind a public portfolio, or None if it is missing or private"""
+    cache = get_portfolio_cache()
+    owner = cache.get(_owner_key(username))
+    if owner is None:
+        with use_primary():  # cached for an hour: never from a lagging replica
+            user = (
+                User.objects.filter(username=username, is_active=True)
+                .select_related('user_profile')
+                .first()
+            )
+        is_public = (
+            user is not None
+            and hasattr(user, 'user_profile')
+            and user.user_profile.is_profile_public
+        )
+        # Misses are cached too, so probing unknown usernames stays cheap
+        owner = {'id': user.pk if is_public else None}
+        cache.set(_owner_key(username), owner, timeout=settings.PUBLIC_OWNER_CACHE_TIMEOUT)
+    return owner['id']
+
+
+def is_public_owner(user_id):
+    """Whether a user's portfolio, and so their uploads, may be shown to anyone"""
+    cache = get_portfolio_cache()
+    # Keyed on the content version: a visibility change bumps it (core.signals)
+    key = _bundle_key(user_id, 'is_public', get_content_version(user_id))
+    is_public = cache.get(key)
+    if is_public is None:
+        with fresh_reads(user_id):
+            is_public = User.objects.filter(
+                pk=user_id, is_active=True, user_profile__is_profile_public=True
+            ).exists()
+        cache.set(key, is_public, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+    return is_public
+
+
+def forget_public_owner(username):
+    """Drop the cached lookup after a username or visibility change"""
+    get_portfolio_cache().delete(_owner_key(username))
+
+
+def _last_modified_query(user_id):
+    parts = [
+        apps.get_model(label).objects.filter(user_id=user_id)
+        .order_by()
+        .values('user')
+        .annotate(latest=Max('updated_at'))
+        .values_list('latest', flat=True)
+        for label in LAST_MODIFIED_MODELS
+    ]
+    return parts[0].union(*parts[1:], all=True)
+
+
+def content_last_modified(user_id):
+    """
+    Latest change to a user's content.
+
+    The newest ``updated_at`` (one UNION ALL query) misses deleted rows and
+    ``queryset.update()``, so the time of the last version bump counts too.
+    """
+    candidates = [*_last_modified_query(user_id), get_content_modified(user_id)]
+    return max(filter(None, candidates), default=None)
+
+
+async def acontent_last_modified(user_id):
+    """Async content_last_modified"""
+    candidates = [latest async for latest in _last_modified_query(user_id)]
+    candidates.append(await aget_content_modified(user_id))
+    return max(filter(None, candidates), default=None)
+
+
+def render_public_page(request, template_name, context):
+    """Render a page that is shared by every visitor of a public portfolio"""
+    return render(request, template_name, {
+        **context,
+        # The HTML is cached for everyone: never bake in viewer-specific state
+        'user': AnonymousUser(),
+        'messages': (),
+        'portfolio_owner': request.portfolio.user,
+    })
+
+
+# Rendering may reach the ORM, which must not run on the event loop
+arender_public_page = sync_to_async(render_public_page)
+
+
+def _page_etag(owner_id, name, version):
+    return quote_etag(f'{owner_id}-{name}-s{SNAPSHOT_SCHEMA}-v{version}')
+
+
+def _cache_page(response, latest):
+    return {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'last_modified': int(latest.timestamp()) if latest else None,
+    }
+
+
+def _lookup_page(username, name):
+    """
+    Resolve a public page request to (owner_id, etag, cache key, cached page).
+
+    The page is None on a cache miss. Three cache reads: the async views make
+    them in a single thread hop rather than one each.
+    """
+    owner_id = get_public_owner_id(username)
+    if owner_id is None:
+        raise Http404('No public portfolio for this user')
+
+    version = get_content_version(owner_id)
+    key = _bundle_key(owner_id, f'page:{name}', version)
+    return owner_id, _page_etag(owner_id, name, version), key, get_portfolio_cache().get(key)
+
+
+alookup_page = sync_to_async(_lookup_page)
+
+
+def _page_response(request, etag, page):
+    """The cached page, or a 304 when the visitor's copy is still current"""
+    response = get_conditional_response(
+        request, etag=etag, last_modified=page['last_modified']
+    )
+    if response is None:
+        response = HttpResponse(page['content'], content_type=page['content_type'])
+
+    response['ETag'] = etag
+    if page['last_modified'] is not None:
+        response['Last-Modified'] = http_date(page['last_modified'])
+    patch_cache_control(response, public=True, max_age=settings.PUBLIC_PAGE_MAX_AGE)
+    return response
+
+
+def public_page(name):
+    """
+    Serve the decorated view as the cached public page ``name``.
+
+    The view is called as ``view(request, owner)`` only on a cache miss, with
+    ``request.portfolio`` loaded for the owner, and should render through
+    ``render_public_page``.
+    """
+
+    def decorator(view):
+        @replica_reads
+        @require_safe
+        @wraps(view)
+        def wrapper(request, username):
+            owner_id, etag, key, page = _lookup_page(username, name)
+            if page is None:
+                with fresh_reads(owner_id):
+                    owner = User.objects.filter(pk=owner_id).first()
+                    if owner is None:
+                        raise Http404('No public portfolio for this user')
+
+                    request.portfolio = PortfolioLoader(request, user=owner)
+                    response = view(request, owner)
+                    if response.status_code != 200:
+                        return response
+
+                    latest = content_last_modified(owner_id)
+                page = _cache_page(response, latest)
+                get_portfolio_cache().set(key, page, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+
+            return _page_response(request, etag, page)
+
+        return wrapper
+
+    return decorator
+
+
+def apublic_page(name):
+    """Async public_page: the decorated view is a coroutine function"""
+
+    def decorator(view):
+        @replica_reads
+        @require_safe
+        @wraps(view)
+        async def wrapper(request, username):
+            owner_id, etag, key, page = await alookup_page(username, name)
+            if page is None:
+                with await afresh_reads(owner_id):
+                    owner = await User.objects.filter(pk=owner_id).afirst()
+                    if owner is None:
+                        raise Http404('No public portfolio for this user')
+
+                    request.portfolio = PortfolioLoader(request, user=owner)
+                    response = await view(request, owner)
+                    if response.status_code != 200:
+                        return response
+
+                    latest = await acontent_last_modified(owner_id)
+                page = _cache_page(response, latest)
+                await get_portfolio_cache().aset(key, page, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+
+            return _page_response(request, etag, page)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,113 @@
+"""
+Core App Database Routers
+Send the reads of read-only views to replicas, everything else to the primary
+
+Replica aliases come from DB_REPLICAS (see settings). Reads go to a
+replica only while a view marked with ``replica_reads`` /
+``ReplicaReadMixin`` handles a GET, and never:
+
+- inside a transaction, or for sessions and auth (login must see itself);
+- for a client that wrote within REPLICA_PIN_SECONDS: a write sets a
+  cookie that pins the client to the primary until replicas caught up,
+  so CRUD views stay read-your-writes consistent;
+- inside ``use_primary()``, used to build shared cache entries right after
+  a content change (core.cache), so a lagging replica cannot cache stale
+  content under the new version.
+
+Without replicas every query goes to ``default`` as before.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Apps whose rows must be read back right after they are written
+PRIMARY_ONLY_APPS = {'auth', 'sessions'}
+
+
+@dataclass
+class RoutingState:
+    """Replica routing for the current request"""
+
+    replica_reads: bool = False
+    wrote: bool = False
+
+
+_state = ContextVar('replica_routing', default=None)
+_force_primary = ContextVar('replica_force_primary', default=False)
+
+
+def begin_request():
+    """Start tracking a request; returns a token for ``end_request``"""
+    return _state.set(RoutingState())
+
+
+def end_request(token):
+    """Stop tracking; returns the request's RoutingState"""
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+def allow_replica_reads():
+    """Let the rest of the current request read from replicas"""
+    state = _state.get()
+    if state is not None:
+        state.replica_reads = True
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block, whatever the view allows"""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def replica_reads(view):
+    """Mark a function view as read-only: its GET queries may go to a replica"""
+    view.replica_reads = True
+    return view
+
+
+class ReplicaReadMixin:
+    """Class-based view counterpart of ``replica_reads``"""
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return replica_reads(super().as_view(**initkwargs))
+
+
+class PrimaryReplicaRouter:
+    """Route reads to a random replica when the request allows it"""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or not state.replica_reads
+            or _force_primary.get()
+            or not settings.REPLICA_DATABASES
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.REPLICA_DATABASES)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # replicas hold the same rows
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.REPLICA_DATABASES
@@ -0,0 +1,243 @@
+"""
+Full-Text Search
+One inverted index over projects, services, skills and certifications
+
+Each searchable object is mirrored into a SearchDocument row from model
+signals (and explicitly after bulk writes). The database maintains the
+index from that table: FTS5 on SQLite, a generated tsvector column with a
+GIN index on PostgreSQL (see migration core/0006). Results are ranked with
+bm25() / ts_rank(). Other databases fall back to unindexed icontains.
+"""
+
+import re
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+from .models import SearchDocument
+
+MAX_QUERY_TERMS = 8
+
+
+def _project_document(project):
+    return {
+        'title': project.title,
+        'body': ' '.join(filter(None, [
+            project.short_description, project.description,
+            project.technologies, project.github_language,
+        ])),
+        'url': reverse('project_detail', kwargs={'slug': project.slug}),
+    }
+
+
+def _service_document(service):
+    return {
+        'title': service.title,
+        'body': ' '.join(filter(None, [
+            service.short_description, service.description, service.features,
+        ])),
+        'url': reverse('service_detail', kwargs={'slug': service.slug}),
+    }
+
+
+def _skill_document(skill):
+    return {
+        'title': skill.name,
+        'body': ' '.join(filter(None, [skill.get_category_display(), skill.description])),
+        'url': reverse('skills') + f'#skill-{skill.pk}',
+    }
+
+
+def _certification_document(certification):
+    return {
+        'title': certification.name,
+        'body': ' '.join(filter(None, [
+            certification.issuing_organization, certification.credential_id,
+            certification.description,
+        ])),
+        'url': reverse('skills') + f'#certification-{certification.pk}',
+    }
+
+
+# kind -> (model label, document builder)
+SEARCH_MODELS = {
+    'project': ('core.Project', _project_document),
+    'service': ('services.Service', _service_document),
+    'skill': ('education.Skill', _skill_document),
+    'certification': ('education.Certification', _certification_document),
+}
+
+KIND_BY_LABEL = {label: kind for kind, (label, _) in SEARCH_MODELS.items()}
+
+
+def kind_for_model(model):
+    return KIND_BY_LABEL.get(model._meta.label)
+
+
+def _filter_tokens(user_id, is_active):
+    # "u<id>" marks the owner, "a<id>" the owner's active content. Keeping
+    # the state per owner keeps every filter token's posting list short.
+    if not user_id:
+        return ''
+    return f'u{user_id} a{user_id}' if is_active else f'u{user_id}'
+
+
+def build_document(kind, instance):
+    """Unsaved SearchDocument for a model instance"""
+    _, build = SEARCH_MODELS[kind]
+    return SearchDocument(
+        kind=kind,
+        object_id=instance.pk,
+        user_id=instance.user_id,
+        is_active=instance.is_active,
+        filters=_filter_tokens(instance.user_id, instance.is_active),
+        **build(instance),
+    )
+
+
+def index_objects(instances):
+    """Upsert the search documents for instances of one searchable model"""
+    instances = list(instances)
+    if not instances:
+        return
+    kind = kind_for_model(type(instances[0]))
+    SearchDocument.objects.bulk_create(
+        [build_document(kind, instance) for instance in instances],
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=['user', 'title', 'body', 'url', 'is_active', 'filters', 'updated_at'],
+    )
+
+
+def reindex_queryset(queryset, batch_size=1000):
+    """Re-index every object in a queryset (e.g. after queryset.update())"""
+    batch = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+        batch.append(instance)
+        if len(batch) == batch_size:
+            index_objects(batch)
+            batch = []
+    index_objects(batch)
+
+
+def remove_object(instance):
+    SearchDocument.objects.filter(kind=kind_for_model(type(instance)), object_id=instance.pk).delete()
+
+
+def rebuild_index():
+    """Recreate every search document from the source tables"""
+    SearchDocument.objects.all().delete()
+    for label, _ in SEARCH_MODELS.values():
+        reindex_queryset(apps.get_model(label).objects.order_by('pk'))
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO core_searchindex(core_searchindex) VALUES ('optimize')")
+
+
+def query_terms(text):
+    """Lower-cased word tokens of a user query, capped at MAX_QUERY_TERMS"""
+    return re.findall(r'\w+', text.lower())[:MAX_QUERY_TERMS]
+
+
+def _match_sql(terms, user_id=None, active_only=False):
+    """
+    SQL selecting matching document ids with a rank (lower is better).
+
+    ``active_only`` requires ``user_id``. Returns ``(sql, params)`` or None
+    when the database has no index.
+    """
+    if connection.vendor == 'sqlite':
+        # Terms are ANDed; only the last one is a prefix (search-as-you-type)
+        text = ' '.join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+        match = f'{{title body}} : ({text.strip()})'
+        if user_id is not None:
+            token = 'a' if active_only else 'u'
+            match = f'filters : "{token}{int(user_id)}" AND {match}'
+        sql = (
+            'SELECT rowid AS id, bm25(core_searchindex, 10.0, 1.0, 0.0) AS rank '
+            'FROM core_searchindex WHERE core_searchindex MATCH %s'
+        )
+        return sql, [match]
+
+    if connection.vendor == 'postgresql':
+        tsquery = ' & '.join(terms[:-1] + [f'{terms[-1]}:*'])
+        sql = (
+            'SELECT id, -ts_rank(search_vector, to_tsquery(\'english\', %s)) AS rank '
+            'FROM core_searchdocument WHERE search_vector @@ to_tsquery(\'english\', %s)'
+        )
+        params = [tsquery, tsquery]
+        if user_id is not None:
+            sql += ' AND user_id = %s'
+            params.append(user_id)
+        if active_only:
+            sql += ' AND is_active'
+        return sql, params
+
+    return None
+
+
+def search(text, user=None, kinds=None, limit=20):
+    """
+    Ranked SearchDocuments matching ``text``.
+
+    With ``user`` only that user's active content is searched.
+    """
+    terms = query_terms(text)
+    if not terms:
+        return []
+
+    user_id = user.pk if user is not None else None
+    match = _match_sql(terms, user_id=user_id, active_only=user is not None)
+
+    if match is None:
+        queryset = SearchDocument.objects.all()
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(body__icontains=term))
+        if user is not None:
+            queryset = queryset.filter(user=user, is_active=True)
+        if kinds:
+            queryset = queryset.filter(kind__in=kinds)
+        return list(queryset.order_by('-updated_at')[:limit])
+
+    sql, params = match
+    kind_sql = ''
+    if kinds:
+        kind_sql = ' AND d.kind IN (' + ', '.join(['%s'] * len(kinds)) + ')'
+        params = params + list(kinds)
+    return list(SearchDocument.objects.raw(
+        f'SELECT d.* FROM ({sql}) AS m JOIN core_searchdocument d ON d.id = m.id '
+        f'WHERE 1 = 1{kind_sql} ORDER BY m.rank LIMIT %s',
+        params + [limit],
+    ))
+
+
+def matching_object_ids(model, text):
+    """Subquery expression of ``model`` primary keys matching ``text`` (for .filter(pk__in=...))"""
+    terms = query_terms(text)
+    match = _match_sql(terms) if terms else None
+    if match is None:
+        return None
+    sql, params = match
+    return RawSQL(
+        f'SELECT d.object_id FROM ({sql}) AS m JOIN core_searchdocument d ON d.id = m.id '
+        'WHERE d.kind = %s',
+        params + [kind_for_model(model)],
+    )
+
+
+class SearchIndexAdminMixin:
+    """
+    ModelAdmin mixin that adds ranked search-index matches to the changelist search.
+
+    The admin's own ``search_fields`` lookup still runs as well, since the
+    index does not hold fields such as the owner's username.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        object_ids = matching_object_ids(self.model, search_term) if search_term.strip() else None
+        if object_ids is None:
+            return results, may_have_duplicates
+        return results | queryset.filter(pk__in=object_ids), may_have_duplicates
@@ -0,0 +1,23 @@
+"""
+Core App Shortcuts
+Async counterparts of django.shortcuts for the ASGI views (see ASYNC_VIEWS)
+"""
+
+from asgiref.sync import sync_to_async
+from django.shortcuts import render
+
+# Templates may still reach the ORM (lazy relations, {% responsive_image %}),
+# which is not allowed on the event loop: render in the request's sync thread
+arender = sync_to_async(render)
+
+
+async def aget_user(request):
+    """
+    The request's user (or AnonymousUser) through the async session API.
+
+    Also stored as ``request.user``, so rendering does not look the user up
+    a second time.
+    """
+    user = await request.auser()
+    request.user = user
+    return user
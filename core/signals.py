@@ -1,12 +1,21 @@
 """
 Core App Signals
 Automatically create user profile on user registration
+and invalidate cached portfolio snapshots when content changes
 """
 
-from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Profile
+from accounts.models import UserProfile
+from .models import Profile, Project, SocialLink, Testimonial
+from .cache import bump_content_version
+from .db import configure_connection
+from .public import forget_public_owner
+from .images import IMAGE_FIELDS, enqueue_images
+from .search import SEARCH_MODELS, index_objects, remove_object
+from .technologies import sync_technologies
 
 
 @receiver(post_save, sender=User)
@@ -32,3 +41,80 @@ def save_user_profile(sender, instance, **kwargs):
             profile.full_name = instance.get_full_name()
         profile.save()
 
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=SocialLink)
+@receiver(post_delete, sender=SocialLink)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+def invalidate_portfolio_snapshot(sender, instance, **kwargs):
+    """Drop the owner's cached portfolio snapshot"""
+    bump_content_version(instance.user_id)
+
+
+@receiver(pre_save, sender=User)
+def remember_previous_username(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored username, so a rename also forgets the old public URL"""
+    if instance.pk is None or (update_fields is not None and 'username' not in update_fields):
+        return
+    instance._previous_username = (
+        User.objects.filter(pk=instance.pk).values_list('username', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_public_owner(sender, instance, update_fields=None, **kwargs):
+    """Re-resolve public portfolio URLs after a username or visibility change"""
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return  # every login saves the user; nothing public changed
+
+    user = instance if sender is User else instance.user
+    forget_public_owner(user.username)
+    previous = getattr(user, '_previous_username', None)
+    if previous and previous != user.username:
+        forget_public_owner(previous)
+    bump_content_version(user.pk)
+
+
+@receiver(post_save, sender=Project)
+def sync_project_technologies(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Mirror Project.technologies into the normalized technology links"""
+    if raw or (update_fields is not None and 'technologies' not in update_fields):
+        return
+    sync_technologies([instance])
+
+
+def update_search_index(sender, instance, raw=False, **kwargs):
+    """Mirror a saved object into its search document"""
+    if not raw:
+        index_objects([instance])
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    """Drop a deleted object's search document"""
+    remove_object(instance)
+
+
+for kind, (label, _) in SEARCH_MODELS.items():
+    post_save.connect(update_search_index, sender=label, dispatch_uid=f'search_index_save_{kind}')
+    post_delete.connect(remove_from_search_index, sender=label, dispatch_uid=f'search_index_delete_{kind}')
+
+
+def queue_image_variants(sender, instance, raw=False, **kwargs):
+    """Queue newly uploaded images for the image worker"""
+    if not raw:
+        enqueue_images(instance)
+
+
+for label in IMAGE_FIELDS:
+    post_save.connect(queue_image_variants, sender=label, dispatch_uid=f'image_variants_{label}')
+
+
+connection_created.connect(configure_connection, dispatch_uid='database_tuning')
@@ -0,0 +1,62 @@
+"""
+Unique Slug Allocation
+Shared by Project, Service and generated usernames
+
+Instead of probing ``base``, ``base-1``, ``base-2``... with one query each,
+all colliding values are fetched with a single ``startswith`` query and the
+first free suffix is chosen in memory.
+"""
+
+from django.db import IntegrityError, transaction
+from django.utils.text import slugify
+
+
+def next_free_value(base, taken, separator='-'):
+    """Return the first of ``base``, ``base<sep>1``, ``base<sep>2``... not in ``taken``"""
+    value = base
+    counter = 1
+    while value in taken:
+        value = f"{base}{separator}{counter}"
+        counter += 1
+    return value
+
+
+def allocate_unique_value(queryset, field, base, separator='-'):
+    """Pick a value for ``field`` that is unused within ``queryset`` (one query)"""
+    taken = set(
+        queryset.filter(**{f'{field}__startswith': base}).values_list(field, flat=True)
+    )
+    return next_free_value(base, taken, separator)
+
+
+class UniqueSlugMixin:
+    """
+    Model mixin that fills a blank ``slug`` from ``slug_source_field``.
+
+    Slugs are unique within ``slug_scope_fields`` (matching the model's
+    unique_together). If a concurrent insert takes the same slug first, the
+    IntegrityError is caught and a fresh slug is allocated.
+    """
+
+    slug_source_field = 'title'
+    slug_scope_fields = ('user',)
+    slug_save_attempts = 5
+
+    def _slug_queryset(self):
+        scope = {name: getattr(self, name) for name in self.slug_scope_fields}
+        return type(self)._default_manager.filter(**scope).exclude(pk=self.pk)
+
+    def save(self, *args, **kwargs):
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        base_slug = slugify(getattr(self, self.slug_source_field))
+        for attempt in range(self.slug_save_attempts):
+            self.slug = allocate_unique_value(self._slug_queryset(), 'slug', base_slug)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                self.slug = ''
+                if attempt == self.slug_save_attempts - 1:
+                    raise
@@ -0,0 +1,151 @@
+"""
+Content-Addressed Media Storage
+Uploads are stored once per distinct content and named after their SHA-256
+
+An upload to ``projects/logo.png`` is streamed to a temporary file while
+hashing, published once as ``.cas/blobs/ab/cd/<sha256>`` and exposed as
+``projects/ab/cd/<sha256>.png``. That name is a hard link to the blob
+(a reflink, or a plain copy as a last resort, where the filesystem cannot
+link), so re-uploading the same logo or resume costs no extra space and
+every media URL names its content, which makes it safe to cache forever.
+
+The filesystem link count is the blob's reference count; ``manage.py
+gc_media`` removes names no row references and blobs nothing links to.
+"""
+
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+CAS_DIR = '.cas'
+BLOB_DIR = f'{CAS_DIR}/blobs'
+TMP_DIR = f'{CAS_DIR}/tmp'
+
+# Linux FICLONE ioctl: copy-on-write clone (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+CONTENT_ADDRESSED_NAME = re.compile(r'(?:^|/)[0-9a-f]{2}/[0-9a-f]{2}/(?P<hash>[0-9a-f]{64})(?:\.\w+)?$')
+
+
+def content_hash_from_name(name):
+    """SHA-256 a content-addressed name refers to, or None"""
+    match = CONTENT_ADDRESSED_NAME.search(name)
+    return match['hash'] if match else None
+
+
+def variant_source_hash(name):
+    """Hash prefix of the source image a variant name was rendered from, or None"""
+    # Image variants are named after the hash of their source (core.images)
+    match = re.fullmatch(
+        re.escape(settings.IMAGE_VARIANT_DIR) + r'/[0-9a-f]{2}/(?P<hash>[0-9a-f]{24})-\d+\.\w+', name
+    )
+    return match['hash'] if match else None
+
+
+def is_immutable_media(name):
+    """Whether the bytes behind ``name`` can never change (hashed names)"""
+    return bool(content_hash_from_name(name) or variant_source_hash(name))
+
+
+def link_or_copy(source, destination):
+    """
+    Make ``destination`` share ``source``'s data.
+
+    Tries a hard link, then a reflink, then falls back to copying. Returns
+    the method used.
+    """
+    try:
+        os.link(source, destination)
+        return 'link'
+    except FileExistsError:
+        return 'exists'
+    except OSError:
+        pass  # cross-device, or links unsupported
+
+    if fcntl is not None:
+        try:
+            with open(source, 'rb') as src, open(destination, 'xb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return 'reflink'
+        except FileExistsError:
+            return 'exists'
+        except OSError:
+            if os.path.exists(destination):
+                os.unlink(destination)
+
+    shutil.copyfile(source, destination)
+    return 'copy'
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that deduplicates uploads by SHA-256"""
+
+    def blob_path(self, digest):
+        return self.path(f'{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}')
+
+    def _spool(self, content):
+        """Write ``content`` to a temporary file next to the blobs; returns (path, sha256)"""
+        tmp_dir = self.path(TMP_DIR)
+        os.makedirs(tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return tmp_path, digest.hexdigest()
+
+    def _save(self, name, content):
+        if is_immutable_media(name):
+            return super()._save(name, content)
+
+        tmp_path, digest = self._spool(content)
+        directory, filename = posixpath.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        name = posixpath.join(directory, digest[:2], digest[2:4], digest + extension)
+        path = self.path(name)
+
+        try:
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            blob = self.blob_path(digest)
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if not os.path.exists(blob):
+                os.replace(tmp_path, blob)  # atomic: readers never see a partial blob
+            if not os.path.exists(path):
+                try:
+                    link_or_copy(blob, path)
+                except FileNotFoundError:
+                    # gc_media removed the blob between the checks: publish ours
+                    os.replace(tmp_path, blob)
+                    link_or_copy(blob, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return name
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen by content in _save(); an existing file
+        # under that name is the same content and is simply reused
+        if is_immutable_media(name):
+            return super().get_available_name(name, max_length)
+        return name
+
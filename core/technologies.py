@@ -0,0 +1,127 @@
+"""
+Core App Technologies
+Normalized technology tags for projects
+
+``Project.technologies`` stays the editable comma separated field (forms,
+GitHub sync). Every write is mirrored into Technology / ProjectTechnology
+rows, so listing projects by technology is an indexed join instead of a
+LIKE scan, and the tag cloud is a single GROUP BY.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from .cache import get_user_bundle
+from .models import Project, ProjectTechnology, Technology, technology_slug
+
+# Technology.name / Technology.slug column sizes
+NAME_LENGTH = 100
+SLUG_LENGTH = 120
+
+
+def _wanted_links(projects):
+    """Map project ids to {slug: position} and slugs to a display name"""
+    wanted, names = {}, {}
+    for project in projects:
+        links = {}
+        for name in project.get_technologies_list():
+            slug = technology_slug(name)[:SLUG_LENGTH]
+            if slug and slug not in links:
+                links[slug] = len(links)
+                names.setdefault(slug, name[:NAME_LENGTH])
+        wanted[project.pk] = links
+    return wanted, names
+
+
+def _technology_ids(names):
+    """Slug -> Technology id, creating missing technologies"""
+    ids = dict(Technology.objects.filter(slug__in=names).values_list('slug', 'pk'))
+    missing = [Technology(name=name, slug=slug) for slug, name in names.items() if slug not in ids]
+    if missing:
+        # Another writer may create the same slug concurrently
+        Technology.objects.bulk_create(missing, ignore_conflicts=True)
+        ids.update(
+            Technology.objects.filter(slug__in=[t.slug for t in missing]).values_list('slug', 'pk')
+        )
+    return ids
+
+
+def sync_technologies(projects):
+    """
+    Rewrite the technology links of ``projects`` from their text field.
+
+    Runs a constant number of queries however many projects are passed, and
+    only touches links that actually changed.
+    """
+    projects = [project for project in projects if project.pk]
+    if not projects:
+        return
+
+    wanted, names = _wanted_links(projects)
+
+    with transaction.atomic():
+        technology_ids = _technology_ids(names) if names else {}
+
+        current = defaultdict(dict)
+        for link_id, project_id, technology_id, position in ProjectTechnology.objects.filter(
+            project_id__in=wanted
+        ).values_list('pk', 'project_id', 'technology_id', 'position'):
+            current[project_id][technology_id] = (link_id, position)
+
+        to_create, to_update, to_delete = [], [], []
+        for project_id, links in wanted.items():
+            desired = {technology_ids[slug]: position for slug, position in links.items()}
+            existing = current.get(project_id, {})
+            for technology_id, (link_id, position) in existing.items():
+                if technology_id not in desired:
+                    to_delete.append(link_id)
+                elif desired[technology_id] != position:
+                    to_update.append(ProjectTechnology(pk=link_id, position=desired[technology_id]))
+            to_create.extend(
+                ProjectTechnology(project_id=project_id, technology_id=technology_id, position=position)
+                for technology_id, position in desired.items()
+                if technology_id not in existing
+            )
+
+        if to_delete:
+            ProjectTechnology.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            ProjectTechnology.objects.bulk_update(to_update, ['position'])
+        if to_create:
+            ProjectTechnology.objects.bulk_create(to_create)
+
+
+def rebuild_technologies(batch_size=1000):
+    """Re-sync every project and drop technologies no project uses"""
+    batch, synced = [], 0
+    for project in Project.objects.only('pk', 'technologies').order_by('pk').iterator(chunk_size=batch_size):
+        batch.append(project)
+        if len(batch) == batch_size:
+            sync_technologies(batch)
+            synced += len(batch)
+            batch = []
+    sync_technologies(batch)
+    synced += len(batch)
+    removed, _ = Technology.objects.filter(project_links__isnull=True).delete()
+    return synced, removed
+
+
+def filter_by_technology(queryset, slug):
+    """Narrow a Project queryset to projects tagged with the technology ``slug``"""
+    return queryset.filter(technology_links__technology__slug=slug)
+
+
+def build_technology_cloud(user):
+    """Technologies of a user's active projects with project counts, most used first"""
+    return list(
+        ProjectTechnology.objects.filter(project__user=user, project__is_active=True)
+        .values(slug=F('technology__slug'), name=F('technology__name'))
+        .annotate(count=Count('project'))
+        .order_by('-count', 'name')
+    )
+
+
+def get_technology_cloud(user):
+    """Return the cached tag cloud for a user"""
+    return get_user_bundle(user, 'technology_cloud', build_technology_cloud)
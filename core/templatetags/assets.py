@@ -0,0 +1,33 @@
+"""
+Core App Template Tags
+{% asset_styles %} and {% asset_scripts %} link the bundles from build_assets
+
+    {% load assets %}
+    <head>... {% asset_styles %} ...</head>
+    <body>... {% asset_scripts %}</body>
+
+With ASSET_BUNDLES_ENABLED and a build on disk, the critical CSS is
+inlined and the bundles are linked without blocking the first paint;
+otherwise the source files of ASSET_BUNDLES are linked one by one. Icons
+and fonts come from their CDNs until the build self-hosts them.
+"""
+
+from django import template
+from django.conf import settings
+from core.assets import load_manifest
+
+register = template.Library()
+
+
+def _manifest():
+    return load_manifest() if settings.ASSET_BUNDLES_ENABLED else None
+
+
+@register.inclusion_tag('core/_asset_styles.html')
+def asset_styles():
+    return {'assets': _manifest(), 'sources': settings.ASSET_BUNDLES['css']}
+
+
+@register.inclusion_tag('core/_asset_scripts.html')
+def asset_scripts():
+    return {'assets': _manifest(), 'sources': settings.ASSET_BUNDLES['js']}
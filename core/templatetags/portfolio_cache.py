@@ -0,0 +1,89 @@
+"""
+Core App Template Tags
+{% portfolio_cache %} caches a rendered fragment per portfolio owner
+
+    {% load portfolio_cache %}
+    {% portfolio_cache 'testimonials' request.portfolio.user %}
+        ...
+    {% endportfolio_cache %}
+
+Like {% cache %}, but the key embeds the owner's content version (see
+core.cache), so any change to the owner's content re-renders every
+fragment at once and nothing needs a timeout to become fresh. Further
+arguments vary the key (viewer, active page, ...). The key also holds a
+digest of the fragment's template source, so a deploy that edits the
+fragment never serves the old markup.
+"""
+
+import hashlib
+
+from django import template
+from django.conf import settings
+from django.template import Node, TemplateSyntaxError
+from core.cache import SNAPSHOT_SCHEMA, _bundle_key, get_content_version, get_portfolio_cache
+
+register = template.Library()
+
+
+def _source_digest(nodelist):
+    digest = hashlib.md5(usedforsecurity=False)
+    for node in nodelist.get_nodes_by_type(Node):
+        token = getattr(node, 'token', None)
+        if token is not None:
+            digest.update(token.contents.encode())
+    return digest.hexdigest()[:12]
+
+
+class PortfolioCacheNode(Node):
+    def __init__(self, nodelist, name, owner, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.owner = owner
+        self.vary_on = vary_on
+        self.digest = _source_digest(nodelist)
+
+    def cache_key(self, context):
+        owner = self.owner.resolve(context)
+        owner_id = getattr(owner, 'pk', owner)  # a user, a user id or None
+        vary = '|'.join(str(value.resolve(context)) for value in self.vary_on)
+        fragment = 'fragment:{}:{}:{}'.format(
+            self.name.resolve(context), self.digest,
+            hashlib.md5(vary.encode(), usedforsecurity=False).hexdigest()[:12],
+        )
+        if owner_id is None:
+            # Nobody's portfolio (anonymous visitors): site-wide content only
+            return f'portfolio:site:{fragment}:s{SNAPSHOT_SCHEMA}'
+
+        # One version lookup per owner and render
+        versions = context.render_context.setdefault(self, {})
+        if owner_id not in versions:
+            versions[owner_id] = get_content_version(owner_id)
+        return _bundle_key(owner_id, fragment, versions[owner_id])
+
+    def render(self, context):
+        if not settings.FRAGMENT_CACHE_ENABLED:
+            return self.nodelist.render(context)
+
+        cache = get_portfolio_cache()
+        key = self.cache_key(context)
+        html = cache.get(key)
+        if html is None:
+            html = self.nodelist.render(context)
+            cache.set(key, html, timeout=settings.PORTFOLIO_CACHE_TIMEOUT)
+        return html
+
+
+@register.tag('portfolio_cache')
+def do_portfolio_cache(parser, token):
+    """{% portfolio_cache name owner [vary_on ...] %} ... {% endportfolio_cache %}"""
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and an owner")
+    nodelist = parser.parse(('endportfolio_cache',))
+    parser.delete_first_token()
+    return PortfolioCacheNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        parser.compile_filter(bits[2]),
+        [parser.compile_filter(bit) for bit in bits[3:]],
+    )
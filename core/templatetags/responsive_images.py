@@ -0,0 +1,63 @@
+"""
+Core App Template Tags
+{% responsive_image %} renders an ImageField with srcset variants
+
+    {% load responsive_images %}
+    {% responsive_image project.featured_image alt=project.title sizes="(max-width: 576px) 100vw, 33vw" class="project-image" %}
+"""
+
+from django import template
+from django.core.files.storage import default_storage
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from core.images import get_image_asset
+
+register = template.Library()
+
+
+def _srcset(variants, fmt):
+    return ', '.join(
+        f'{default_storage.url(v["name"])} {v["width"]}w' for v in variants if v['format'] == fmt
+    )
+
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', loading='lazy', **attrs):
+    """
+    A <picture> with WebP and JPEG/PNG srcsets for a processed image.
+
+    Until the image worker has processed the upload, the original is
+    rendered as a plain <img>. Extra keyword arguments become attributes
+    of the <img> (e.g. class="...").
+    """
+    if not image:
+        return ''
+
+    asset = get_image_asset(image.name)
+    if asset is None:
+        return format_html('<img{}>', flatatt({'src': image.url, 'alt': alt, 'loading': loading, **attrs}))
+
+    variants = asset['variants']
+    fallback = next(v['format'] for v in variants if v['format'] != 'webp')
+    largest = max((v for v in variants if v['format'] == fallback), key=lambda v: v['width'])
+    style = f'background-color: {asset["placeholder_color"]}'
+    if attrs.get('style'):
+        style = f'{attrs.pop("style")}; {style}'
+
+    img = flatatt({
+        'src': default_storage.url(largest['name']),
+        'srcset': _srcset(variants, fallback),
+        'sizes': sizes,
+        'width': asset['width'],
+        'height': asset['height'],
+        'alt': alt,
+        'loading': loading,
+        'decoding': 'async',
+        'data-blurhash': asset['blurhash'],
+        'style': style,
+        **attrs,
+    })
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}"><img{}></picture>',
+        _srcset(variants, 'webp'), sizes, img,
+    )
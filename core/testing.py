@@ -0,0 +1,105 @@
+"""
+Core App Test Helpers
+Per-page query budget and query plan assertions shared by the app test suites
+"""
+
+import re
+from contextlib import contextmanager
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+# Tests render real templates; the manifest storage needs collectstatic first
+TEST_STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class QueryBudgetTestCase(TestCase):
+    """
+    TestCase that enforces query budgets per page.
+
+    Unlike assertNumQueries, a budget is an upper bound, so pages may get
+    cheaper without breaking tests but can never silently get more expensive.
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, budget):
+        """Fail if the wrapped block runs more than ``budget`` queries"""
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = '\n'.join(
+                f'{i}. {query["sql"]}'
+                for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f'{executed} queries executed, budget is {budget}:\n{queries}')
+
+    def assertPageWithinBudget(self, url, budget, status_code=200):
+        """GET ``url`` and fail if it exceeds ``budget`` queries"""
+        with self.assertQueryBudget(budget):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status_code)
+        return response
+
+
+# Plan lines that mean "no usable index" for the page's filter or ordering
+SQLITE_BAD_PLAN = re.compile(r'^SCAN |USE TEMP B-TREE')
+POSTGRESQL_BAD_PLAN = re.compile(r'(^|->\s+)(Seq Scan|Sort)\b', re.MULTILINE)
+
+
+def explain(sql):
+    """Return the query plan for ``sql`` as a list of lines"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+        if connection.vendor == 'postgresql':
+            # Tiny test tables would otherwise always be scanned and sorted
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_sort = off')
+            cursor.execute(f'EXPLAIN {sql}')
+            return [row[0] for row in cursor.fetchall()]
+    raise NotImplementedError(f'No query plan support for {connection.vendor}')
+
+
+def bad_plan_lines(plan):
+    """Return the plan lines showing a sequential scan or an explicit sort"""
+    if connection.vendor == 'sqlite':
+        return [line for line in plan if SQLITE_BAD_PLAN.search(line)]
+    return [line for line in plan if POSTGRESQL_BAD_PLAN.search(line)]
+
+
+class QueryPlanTestCase(QueryBudgetTestCase):
+    """
+    TestCase that runs EXPLAIN on every SELECT a page executes.
+
+    A page fails if any query needs a full table scan or a temporary sort,
+    i.e. if a filter/ordering is not served by an index.
+    """
+
+    def assertPageUsesIndexes(self, url, status_code=200):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status_code)
+
+        failures = []
+        for query in context.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            plan = explain(sql)
+            if bad_plan_lines(plan):
+                failures.append(f'{sql}\n    ' + '\n    '.join(plan))
+
+        if failures:
+            self.fail(f'{url} has unindexed queries:\n' + '\n'.join(failures))
+        return response
@@ -1,3 +1,1123 @@
-from django.test import TestCase
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, IntegrityError, connection, router
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import path, re_path, reverse
+from django.utils import timezone
+from core import slugs, views as core_views
+from core.assets import Markup, build_icon_css, critical_css, minify_css
+from core.cache import bump_content_version, fresh_reads, get_content_version
+from core.context_processors import navigation
+from core.github_scheduler import GitHubSyncScheduler
+from core.github_utils import GitHubAPI, TokenBucket
+from core.image_worker import ImageWorker
+from core.media import serve_media
+from core.media_gc import collect_garbage
+from core.middleware import PRIMARY_PIN_COOKIE, ReplicaRoutingMiddleware
+from core.models import (
+    GitHubSyncCursor, ImageAsset, Profile, Project, ProjectTechnology, SearchDocument, SocialLink, Technology,
+    Testimonial,
+)
+from core.routers import allow_replica_reads, begin_request, end_request, replica_reads, use_primary
+from core.search import search
+from core.storage import ContentAddressedStorage
+from core.technologies import build_technology_cloud, rebuild_technologies
+from core.testing import TEST_STORAGES, QueryBudgetTestCase, QueryPlanTestCase
+from education import views as education_views
+from education.models import Skill
+from PIL import Image
+from resumeproject import urls as project_urls
+from resumeproject.urls import PUBLIC_USERNAME
+from services import views as services_views
+
+
+class PortfolioPageQueryBudgetTests(QueryBudgetTestCase):
+    """Per-page query budgets (session + user lookups count towards each budget)"""
+
+    # Cold portfolio cache: session, user and one query per portfolio object
+    HOME_BUDGET_COLD = 6
+    # Warm portfolio cache: only the session and user lookups
+    HOME_BUDGET_WARM = 2
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        Project.objects.create(
+            user=self.user, title='Site', description='Portfolio site',
+            technologies='Python, Django', is_featured=True,
+        )
+        SocialLink.objects.create(user=self.user, platform='github', url='https://github.com/jane')
+        Testimonial.objects.create(user=self.user, name='Bob', position='CTO', testimonial='Great')
+        self.client.force_login(self.user)
+
+    def test_home_page_loads_portfolio_once_per_request(self):
+        self.assertPageWithinBudget(reverse('home'), self.HOME_BUDGET_COLD)
+
+    def test_home_page_warm_cache(self):
+        self.client.get(reverse('home'))
+        self.assertPageWithinBudget(reverse('home'), self.HOME_BUDGET_WARM)
+
+    def test_about_page_warm_cache(self):
+        self.client.get(reverse('home'))
+        self.assertPageWithinBudget(reverse('about'), self.HOME_BUDGET_WARM)
+
+    def test_home_page_anonymous(self):
+        self.client.logout()
+        self.assertPageWithinBudget(reverse('home'), 0)
+
+    def test_snapshot_invalidated_on_change(self):
+        self.client.get(reverse('home'))
+        SocialLink.objects.create(user=self.user, platform='linkedin', url='https://linkedin.com/in/jane')
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'fa-linkedin')
+
+
+class PublicPortfolioPageTests(QueryBudgetTestCase):
+    """Anonymous /u/<username>/ pages are served from the full-page cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        Project.objects.create(
+            user=self.user, title='Site', description='Portfolio site',
+            technologies='Python, Django', is_featured=True,
+        )
+        self.url = reverse('public_home', kwargs={'username': 'jane'})
+
+    def test_cached_page_and_revalidation_skip_the_database(self):
+        first = self.client.get(self.url)
+        self.assertContains(first, 'Site')
+        self.assertContains(first, 'href="/u/jane/skills/"')
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+
+        self.assertPageWithinBudget(self.url, 0)
+        with self.assertQueryBudget(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        with self.assertQueryBudget(0):
+            response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_content_change_changes_etag(self):
+        first = self.client.get(self.url)
+        Project.objects.create(user=self.user, title='Blog', description='x', is_featured=True)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Blog')
+
+    def test_deletes_and_bulk_updates_move_last_modified(self):
+        first = self.client.get(self.url)
+        later = timezone.now() + timedelta(hours=1)
+        with mock.patch('core.cache.timezone.now', return_value=later):
+            Project.objects.get(title='Site').delete()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Portfolio site')
+
+        Project.objects.create(user=self.user, title='Blog', description='x')
+        second = self.client.get(self.url)
+        with mock.patch('core.cache.timezone.now', return_value=later + timedelta(hours=1)):
+            bump_content_version(self.user.pk)  # as after queryset.update()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=second['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_private_and_unknown_profiles_404(self):
+        self.client.get(self.url)
+        self.user.user_profile.is_profile_public = False
+        self.user.user_profile.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        missing = reverse('public_home', kwargs={'username': 'nobody'})
+        self.assertEqual(self.client.get(missing).status_code, 404)
+
+    def test_owner_actions_are_not_shown_or_cached(self):
+        skill = Skill.objects.create(user=self.user, name='Django', category='backend', proficiency=90)
+        skill_edit = reverse('skill_edit', args=[skill.pk])
+        project_create = reverse('project_create')
+
+        # The owner's own pages share fragments with the public ones
+        self.client.force_login(self.user)
+        self.assertContains(self.client.get(reverse('skills')), skill_edit)
+        self.assertContains(self.client.get(reverse('home')), project_create)
+        self.client.logout()
+
+        response = self.client.get(reverse('public_skills', kwargs={'username': 'jane'}))
+        self.assertContains(response, 'Django')
+        self.assertNotContains(response, skill_edit)
+        self.assertNotContains(response, reverse('skill_create'))
+        response = self.client.get(self.url)
+        self.assertContains(response, 'Site')
+        self.assertNotContains(response, project_create)
+
+    def test_renamed_user_frees_the_old_url(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.user.username = 'janet'
+        self.user.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertContains(self.client.get(reverse('public_home', kwargs={'username': 'janet'})), 'Site')
+
+    def test_signed_in_visitor_gets_the_shared_page(self):
+        viewer = User.objects.create_user('bob', 'bob@example.com', 'pass12345')
+        self.client.force_login(viewer)
+        for name in ('public_home', 'public_about', 'public_skills', 'public_services'):
+            response = self.client.get(reverse(name, kwargs={'username': 'jane'}))
+            self.assertEqual(response.status_code, 200)
+            self.assertNotContains(response, 'bob')
+
+
+class AsyncUrls:
+    """ROOT_URLCONF with the ASYNC_VIEWS views, as resumeproject.asgi serves them"""
+
+    urlpatterns = [
+        path('', core_views.ahome_page, name='home'),
+        path('about/', core_views.aabout_page, name='about'),
+        path('skills/', education_views.askills_pro, name='skills'),
+        path('services/', services_views.aservices_pro, name='services'),
+        re_path(PUBLIC_USERNAME + r'$', core_views.apublic_home, name='public_home'),
+        re_path(PUBLIC_USERNAME + r'skills/$', education_views.apublic_skills, name='public_skills'),
+    ] + project_urls.urlpatterns
+
+
+@override_settings(STORAGES=TEST_STORAGES, ROOT_URLCONF=AsyncUrls)
+class AsyncViewTests(TestCase):
+    """The async views serve the same pages, and share the public page cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        Project.objects.create(user=self.user, title='Site', description='x', is_featured=True)
+        Skill.objects.create(user=self.user, name='Django', category='backend', proficiency=90)
+
+    async def test_signed_in_pages(self):
+        await self.async_client.aforce_login(self.user)
+        for name, text in (('home', 'Site'), ('about', 'jane'), ('skills', 'Django'), ('services', 'Services')):
+            response = await self.async_client.get(reverse(name))
+            self.assertTrue(iscoroutinefunction(response.resolver_match.func), name)
+            self.assertContains(response, text)
+
+    async def test_public_pages_and_revalidation(self):
+        url = reverse('public_home', kwargs={'username': 'jane'})
+        first = await self.async_client.get(url)
+        self.assertContains(first, 'Site')
+
+        # Cached by the async view, served as is by the sync one
+        with override_settings(ROOT_URLCONF='resumeproject.urls'):
+            response = await sync_to_async(self.client.get)(url)
+        self.assertEqual(response.content, first.content)
+        self.assertEqual(response['ETag'], first['ETag'])
+
+        response = await self.async_client.get(url, headers={'If-None-Match': first['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+        response = await self.async_client.get(reverse('public_skills', kwargs={'username': 'jane'}))
+        self.assertContains(response, 'Django')
+        response = await self.async_client.get(reverse('public_home', kwargs={'username': 'nobody'}))
+        self.assertEqual(response.status_code, 404)
+
+
+class SearchIndexTests(QueryBudgetTestCase):
+    """The full-text index follows model changes and ranks title matches first"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        self.other = User.objects.create_user('bob', 'bob@example.com', 'pass12345')
+        self.api = Project.objects.create(
+            user=self.user, title='Payments API', description='Billing service in Django',
+            technologies='Python, PostgreSQL',
+        )
+        self.site = Project.objects.create(
+            user=self.user, title='Portfolio', description='Built with the Django payments toolkit',
+        )
+        Project.objects.create(user=self.other, title='Payments dashboard', description='React')
+        Skill.objects.create(user=self.user, name='Django', category='backend', proficiency=90)
+
+    def titles(self, text, user=None, **kwargs):
+        return [doc.title for doc in search(text, user=user or self.user, **kwargs)]
+
+    def test_ranked_prefix_search_scoped_to_user(self):
+        self.assertEqual(self.titles('payment'), ['Payments API', 'Portfolio'])
+        self.assertEqual(self.titles('djang', kinds=['skill']), ['Django'])
+        self.assertEqual(self.titles('payments django'), ['Payments API', 'Portfolio'])
+        self.assertEqual(self.titles(''), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.site.title = 'Ledger'
+        self.site.is_active = False
+        self.site.save()
+        self.assertEqual(self.titles('ledger'), [])  # inactive content is hidden
+        self.assertEqual(search('ledger')[0].title, 'Ledger')
+
+        self.api.delete()
+        self.assertEqual(self.titles('payments'), [])
+
+    def test_search_page(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('search'), {'q': 'payments'})
+        self.assertEqual([doc.title for doc in response.context['results']], ['Payments API', 'Portfolio'])
+        self.assertContains(response, reverse('project_detail', kwargs={'slug': self.api.slug}))
+
+    def test_admin_search_uses_index(self):
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'pass12345')
+        self.client.force_login(admin_user)
+        response = self.client.get(reverse('admin:core_project_changelist'), {'q': 'payments'})
+        self.assertEqual(response.context['cl'].result_count, 3)
+        # Fields outside the index (owner, repository name) still match
+        response = self.client.get(reverse('admin:core_project_changelist'), {'q': 'bob'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+
+    def test_rebuild_command(self):
+        SearchDocument.objects.all().delete()
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        self.assertEqual(self.titles('payments'), ['Payments API', 'Portfolio'])
+
+
+class AdminActionTests(TestCase):
+    """Bulk admin actions invalidate caches and the index for the rows they changed"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        self.project = Project.objects.create(user=self.user, title='Ledger', description='x', is_active=False)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pass12345'))
+
+    def act(self, action, query):
+        return self.client.post(
+            reverse('admin:core_project_changelist') + query,
+            {'action': action, '_selected_action': [self.project.pk]},
+        )
+
+    def test_actions_on_a_changelist_filtered_by_the_changed_field(self):
+        version = get_content_version(self.user.pk)
+        self.act('make_featured', '?is_featured__exact=0')
+        self.assertTrue(Project.objects.get(pk=self.project.pk).is_featured)
+        self.assertGreater(get_content_version(self.user.pk), version)
+
+        version = get_content_version(self.user.pk)
+        self.act('activate_projects', '?is_active__exact=0')
+        self.assertGreater(get_content_version(self.user.pk), version)
+        self.assertEqual([doc.title for doc in search('ledger', user=self.user)], ['Ledger'])
+
+
+class UniqueSlugTests(TestCase):
+    """Slugs get the first free numeric suffix within their scope, from one query"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+
+    def project(self, title='Site', user=None, **kwargs):
+        return Project.objects.create(user=user or self.user, title=title, description='x', **kwargs)
+
+    def test_collisions_get_the_first_free_suffix(self):
+        self.assertEqual([self.project().slug for _ in range(3)], ['site', 'site-1', 'site-2'])
+
+        self.project('Blog', slug='blog')
+        self.project('Blog', slug='blog-1')
+        self.project('Blog', slug='blog-10')
+        with self.assertNumQueries(1):
+            value = slugs.allocate_unique_value(Project.objects.filter(user=self.user), 'slug', 'blog')
+        self.assertEqual(value, 'blog-2')
+        self.assertEqual(slugs.next_free_value('base', {'base', 'base-1', 'base-10'}), 'base-2')
+        self.assertEqual(slugs.next_free_value('jane', {'jane'}, separator=''), 'jane1')
+
+    def test_slugs_are_scoped_per_user(self):
+        self.project()
+        other = User.objects.create_user('bob', 'bob@example.com', 'pass12345')
+        self.assertEqual(self.project(user=other).slug, 'site')
+
+    def test_concurrent_insert_retries_with_a_fresh_slug(self):
+        self.project()
+        allocate = slugs.allocate_unique_value
+        taken = iter(['site'])  # as if another request took it after the lookup
+
+        def allocate_once_taken(*args, **kwargs):
+            return next(taken, None) or allocate(*args, **kwargs)
+
+        with mock.patch('core.slugs.allocate_unique_value', side_effect=allocate_once_taken) as patched:
+            project = self.project()
+        self.assertEqual(project.slug, 'site-1')
+        self.assertEqual(patched.call_count, 2)
+
+        with mock.patch('core.slugs.allocate_unique_value', return_value='site'):
+            with self.assertRaises(IntegrityError):
+                self.project()
+
+
+class TechnologyTagTests(QueryBudgetTestCase):
+    """Project.technologies is mirrored into normalized, shared technology rows"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        self.api = Project.objects.create(
+            user=self.user, title='API', description='x', technologies='Python, Django, python, C++, C#',
+        )
+        self.site = Project.objects.create(
+            user=self.user, title='Site', description='x', technologies='django, React',
+        )
+
+    def tags(self, project):
+        return list(project.technology_links.values_list('technology__slug', flat=True))
+
+    def test_links_follow_the_text_field(self):
+        self.assertEqual(self.tags(self.api), ['python', 'django', 'c-plus-plus', 'c-sharp'])
+        self.assertEqual(Technology.objects.get(slug='django').name, 'Django')
+
+        self.api.technologies = 'Django, Go'
+        self.api.save()
+        self.assertEqual(self.tags(self.api), ['django', 'go'])
+        self.assertEqual(Technology.objects.filter(slug='django').count(), 1)
+
+    def test_parsed_list_is_cached_per_value(self):
+        first = self.site.get_technologies_list()
+        self.assertEqual(first, ('django', 'React'))
+        self.assertIs(self.site.get_technologies_list(), first)
+        self.site.technologies = 'Vue.js'
+        self.assertEqual(self.site.get_technologies_list(), ('Vue.js',))
+
+    def test_cloud_and_filter(self):
+        Project.objects.create(user=self.user, title='Old', description='x', technologies='Django', is_active=False)
+        with self.assertNumQueries(1):
+            cloud = build_technology_cloud(self.user)
+        self.assertEqual(cloud[0], {'slug': 'django', 'name': 'Django', 'count': 2})
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('projects'), {'tech': 'react'})
+        self.assertEqual(list(response.context['projects']), [self.site])
+        self.assertContains(response, '?tech=c-sharp')
+
+    def test_rebuild(self):
+        ProjectTechnology.objects.all().delete()
+        Technology.objects.create(name='Unused', slug='unused')
+        self.assertEqual(rebuild_technologies(), (2, 1))
+        self.assertEqual(self.tags(self.site), ['django', 'react'])
+
+
+def make_jpeg(size=(800, 600), color=(200, 80, 40)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+class ImagePipelineTests(TestCase):
+    """Uploads are queued, rendered to hashed variants once, and served with srcset"""
+
+    def setUp(self):
+        cache.clear()
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        self.worker = ImageWorker(log=lambda message: None)
+
+    def upload(self, name='bob.jpg', data=None):
+        return Testimonial.objects.create(
+            user=self.user, name='Bob', position='CTO', testimonial='Great',
+            avatar=SimpleUploadedFile(name, data or make_jpeg(), content_type='image/jpeg'),
+        )
+
+    def render(self, testimonial):
+        return Template(
+            '{% load responsive_images %}{% responsive_image t.avatar alt=t.name sizes="60px" class="avatar" %}'
+        ).render(Context({'t': testimonial}))
+
+    def test_variants_are_rendered_once_per_content(self):
+        first = self.upload()
+        asset = ImageAsset.objects.get(source=first.avatar.name)
+        self.assertEqual(asset.status, 'pending')
+        self.assertIn(f'src="{first.avatar.url}"', self.render(first))
+
+        self.assertEqual(self.worker.run_once(), (1, 0, 0))
+        asset.refresh_from_db()
+        self.assertEqual((asset.status, asset.width, asset.height), ('ready', 800, 600))
+        self.assertEqual(
+            sorted({(v['format'], v['width']) for v in asset.variants}),
+            [(fmt, w) for fmt in ('jpg', 'webp') for w in (64, 160, 320, 640, 800)],
+        )
+        for variant in asset.variants:
+            self.assertTrue(default_storage.exists(variant['name']))
+            self.assertIn(asset.content_hash[:24], variant['name'])
+        self.assertEqual(len(asset.blurhash), 28)  # 4x3 components
+        self.assertEqual(asset.placeholder_color[0], '#')
+
+        html = self.render(first)
+        self.assertIn('<source type="image/webp"', html)
+        self.assertIn('-64.webp 64w', html)
+        self.assertIn('class="avatar"', html)
+        self.assertIn(f'data-blurhash="{asset.blurhash}"', html)
+
+        # Same bytes under another name (here: another extension, as the
+        # storage names files by content) reuse the finished variants
+        second = self.upload('copy.jpeg')
+        self.assertEqual(self.worker.run_once(), (0, 1, 0))
+        self.assertEqual(ImageAsset.objects.get(source=second.avatar.name).variants, asset.variants)
+
+        # Unchanged content is not decoded again
+        ImageAsset.objects.filter(pk=asset.pk).update(status='pending')
+        self.assertEqual(self.worker.run_once(), (0, 1, 0))
+
+        # Re-saving without a new upload does not queue anything
+        first.save()
+        self.assertEqual(ImageAsset.objects.count(), 2)
+
+    def test_gc_removes_variants_of_replaced_images(self):
+        testimonial = self.upload()
+        self.worker.run_once()
+        old = ImageAsset.objects.get(source=testimonial.avatar.name)
+
+        testimonial.avatar = SimpleUploadedFile('new.jpg', make_jpeg(color=(10, 120, 200)))
+        testimonial.save()
+        self.worker.run_once()
+        new = ImageAsset.objects.get(source=testimonial.avatar.name)
+
+        stats = collect_garbage(default_storage, grace=0, dry_run=True, log=lambda message: None)
+        self.assertEqual(stats.assets_removed, 1)
+        self.assertEqual(stats.files_removed, 1 + len(old.variants))
+        self.assertTrue(ImageAsset.objects.filter(pk=old.pk).exists())
+
+        collect_garbage(default_storage, grace=0, log=lambda message: None)
+        self.assertEqual(list(ImageAsset.objects.all()), [new])
+        for variant in old.variants:
+            self.assertFalse(default_storage.exists(variant['name']))
+        for variant in new.variants:
+            self.assertTrue(default_storage.exists(variant['name']))
+
+    def test_unreadable_upload_fails_after_max_attempts(self):
+        testimonial = self.upload('broken.jpg', b'not an image')
+        worker = ImageWorker(max_attempts=2, log=lambda message: None)
+        self.assertEqual(worker.run_once(), (0, 0, 1))
+        # Backing off: not retried in the same run or the next poll
+        asset = ImageAsset.objects.get(source=testimonial.avatar.name)
+        self.assertEqual((asset.status, asset.attempts), ('pending', 1))
+        self.assertGreater(asset.next_attempt_at, timezone.now())
+        self.assertEqual(worker.run_once(), (0, 0, 0))
+
+        ImageAsset.objects.filter(pk=asset.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(worker.run_once(), (0, 0, 1))
+        asset = ImageAsset.objects.get(source=testimonial.avatar.name)
+        self.assertEqual((asset.status, asset.attempts), ('failed', 2))
+        self.assertIn(f'src="{testimonial.avatar.url}"', self.render(testimonial))
+
+
+class ContentAddressedStorageTests(TestCase):
+    """Uploads are stored once per content and garbage collected when unreferenced"""
+
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        self.storage = ContentAddressedStorage(location=self.media)
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.storage.save('projects/logo.png', ContentFile(b'logo', name='logo.png'))
+        again = self.storage.save('projects/logo-2.png', ContentFile(b'logo', name='logo-2.png'))
+        other = self.storage.save('testimonials/bob.PNG', ContentFile(b'logo', name='bob.PNG'))
+
+        self.assertEqual(first, again)
+        self.assertRegex(first, r'^projects/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.png$')
+        self.assertEqual(other, 'testimonials/' + first.split('/', 1)[1])
+        blob = self.storage.blob_path(first.rsplit('/', 1)[1][:-4])
+        self.assertTrue(os.path.samefile(blob, self.storage.path(other)))
+        self.assertEqual(os.stat(blob).st_nlink, 3)
+
+    def test_gc_removes_unreferenced_files_and_blobs(self):
+        kept = self.storage.save('projects/a.png', ContentFile(b'kept', name='a.png'))
+        orphan = self.storage.save('projects/b.png', ContentFile(b'orphan', name='b.png'))
+        Project.objects.create(title='Site', description='x', featured_image=kept)
+
+        stats = collect_garbage(self.storage, grace=0, dry_run=True, log=lambda message: None)
+        self.assertEqual((stats.files_removed, stats.blobs_removed), (1, 1))
+        self.assertTrue(self.storage.exists(orphan))
+
+        stats = collect_garbage(self.storage, grace=0, log=lambda message: None)
+        self.assertEqual((stats.files_removed, stats.blobs_removed), (1, 1))
+        self.assertFalse(self.storage.exists(orphan))
+        self.assertTrue(self.storage.exists(kept))
+        self.assertEqual(len(os.listdir(self.storage.path('.cas/blobs'))), 1)
+
+        # Within the grace period nothing is touched
+        self.storage.save('projects/c.png', ContentFile(b'new', name='c.png'))
+        stats = collect_garbage(self.storage, grace=3600, log=lambda message: None)
+        self.assertEqual((stats.files_removed, stats.blobs_removed), (0, 0))
+
+    def test_gc_keeps_recent_reupload_of_old_content(self):
+        first = self.storage.save('projects/a.png', ContentFile(b'logo', name='a.png'))
+        blob = self.storage.blob_path(first.rsplit('/', 1)[1][:-4])
+        old = time.time() - 7200
+        os.utime(blob, (old, old))
+
+        # Not yet referenced by a saved model: only the grace period protects it
+        again = self.storage.save('testimonials/a.png', ContentFile(b'logo', name='a.png'))
+        self.assertEqual(os.stat(self.storage.path(again)).st_mtime, old)
+
+        stats = collect_garbage(self.storage, grace=3600, log=lambda message: None)
+        self.assertEqual((stats.files_removed, stats.blobs_removed), (0, 0))
+        self.assertTrue(self.storage.exists(again))
+
+    def test_hashed_media_is_served_immutable(self):
+        cache.clear()
+        name = self.storage.save('projects/a.png', ContentFile(b'data', name='a.png'))
+        with open(os.path.join(self.media, 'plain.txt'), 'w') as f:
+            f.write('x')
+        Project.objects.create(title='Site', description='x', featured_image=name, thumbnail='plain.txt')
+
+        request = RequestFactory().get('/media/' + name)
+        response = serve_media(request, name, document_root=self.media)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+
+        response = serve_media(request, 'plain.txt', document_root=self.media)
+        self.assertEqual(response['Cache-Control'], 'no-cache, public')
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class MediaServingTests(TestCase):
+    """Uploads are served with ranges and validators, and only to those allowed to see them"""
+
+    def setUp(self):
+        cache.clear()
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.owner = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        self.data = bytes(range(256)) * 40
+        self.name = ContentAddressedStorage(location=self.media).save(
+            'resumes/cv.pdf', ContentFile(self.data, name='cv.pdf')
+        )
+        Profile.objects.filter(user=self.owner).update(resume=self.name)
+        self.url = '/media/' + self.name
+
+    def make_private(self):
+        profile = self.owner.user_profile
+        profile.is_profile_public = False
+        profile.save()
+
+    def test_full_download_and_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.data)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Length'], str(len(self.data)))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('public', response['Cache-Control'])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_byte_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(self.data)}')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(b''.join(response.streaming_content), self.data[100:200])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-10')
+        self.assertEqual(b''.join(response.streaming_content), self.data[-10:])
+
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.data)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.data)}')
+
+        # A stale If-Range sends the whole (changed) file instead
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_private_profile_uploads_are_hidden(self):
+        self.make_private()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+
+        staff = User.objects.create_user('admin', 'admin@example.com', 'pass12345', is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_unreferenced_and_outside_files_are_not_served(self):
+        with open(os.path.join(self.media, 'orphan.pdf'), 'wb') as f:
+            f.write(b'x')
+        self.assertEqual(self.client.get('/media/orphan.pdf').status_code, 404)
+        self.assertEqual(self.client.get('/media/../manage.py').status_code, 404)
+
+    @override_settings(MEDIA_ACCEL_MODE='nginx', MEDIA_ACCEL_PREFIX='/protected-media/')
+    def test_accel_redirect_offload(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/' + self.name)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class DatabaseProfileTests(TestCase):
+    """SQLite connections are tuned on connect and the main pages can be benchmarked"""
+
+    def test_sqlite_pragmas_are_applied(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 5000)
+
+    def test_benchmark_views(self):
+        User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        out = io.StringIO()
+        call_command('benchmark_views', requests=3, warmup=0, pages='home,public_home', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('Database: '))
+        self.assertRegex(out.getvalue(), r'public_home\s+[\d.]+\s+[\d.]+\s+[\d.]+\s+0\n')
+
+
+@override_settings(REPLICA_DATABASES=['replica1'], REPLICA_PIN_SECONDS=10)
+class ReplicaRoutingTests(SimpleTestCase):
+    """Read-only views read from replicas unless the client just wrote"""
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, view, method='get', cookies=None):
+        """Run ``view`` through the middleware; returns (response, alias its reads used)"""
+        seen = {}
+
+        def get_response(request):
+            middleware.process_view(request, view, (), {})
+            seen['db'] = router.db_for_read(Project)
+            return view(request)
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        request = getattr(RequestFactory(), method)('/')
+        request.COOKIES.update(cookies or {})
+        return middleware(request), seen['db']
+
+    def test_marked_views_read_from_replicas(self):
+        read_only = replica_reads(lambda request: HttpResponse())
+        self.assertEqual(self.get(read_only)[1], 'replica1')
+        self.assertEqual(self.get(read_only, method='post')[1], 'default')
+        self.assertEqual(self.get(lambda request: HttpResponse())[1], 'default')
+
+        # Outside a request, inside use_primary() and for auth: the primary
+        self.assertEqual(router.db_for_read(Project), 'default')
+        token = begin_request()
+        allow_replica_reads()
+        self.assertEqual(router.db_for_read(User), 'default')
+        with use_primary():
+            self.assertEqual(router.db_for_read(Project), 'default')
+        self.assertEqual(router.db_for_read(Project), 'replica1')
+        end_request(token)
+
+    def test_writers_are_pinned_to_the_primary(self):
+        def write(request):
+            router.db_for_write(Project)
+            return HttpResponse()
+
+        response, _ = self.get(write, method='post')
+        cookie = response.cookies[PRIMARY_PIN_COOKIE]
+        self.assertEqual(cookie['max-age'], 10)
+
+        read_only = replica_reads(lambda request: HttpResponse())
+        self.assertEqual(self.get(read_only, cookies={PRIMARY_PIN_COOKIE: '1'})[1], 'default')
+
+    def test_cache_entries_are_built_from_the_primary_after_a_change(self):
+        token = begin_request()
+        allow_replica_reads()
+        with fresh_reads(7):
+            self.assertEqual(router.db_for_read(Project), 'replica1')
+        bump_content_version(7)
+        with fresh_reads(7):
+            self.assertEqual(router.db_for_read(Project), 'default')
+        end_request(token)
+
+
+class NavigationTests(SimpleTestCase):
+    """The navbar section comes from whole path segments"""
+
+    def section(self, path):
+        return navigation(RequestFactory().get(path))['nav_section']
+
+    def test_sections(self):
+        self.assertEqual(self.section('/'), 'home')
+        self.assertEqual(self.section('/projects/'), 'projects')
+        self.assertEqual(self.section('/skills/skill/3/edit/'), 'skills')
+        self.assertEqual(self.section('/u/jane/about/'), 'about')
+        self.assertEqual(self.section('/search/'), '')
+
+    def test_usernames_are_not_sections(self):
+        self.assertEqual(self.section('/u/aboutme/'), 'home')
+        self.assertEqual(self.section('/u/skillsguy/'), 'home')
+        self.assertEqual(self.section('/u/skillsguy/services/'), 'services')
+
+
+@override_settings(FRAGMENT_CACHE_ENABLED=True)
+class FragmentCacheTests(SimpleTestCase):
+    """{% portfolio_cache %} fragments live until the owner's content changes"""
+
+    template = Template(
+        '{% load portfolio_cache %}'
+        '{% portfolio_cache "card" owner page %}{{ value }}{% endportfolio_cache %}'
+    )
+
+    def setUp(self):
+        cache.clear()
+
+    def render(self, value, owner=7, page=1):
+        return self.template.render(Context({'value': value, 'owner': owner, 'page': page}))
+
+    def test_fragment_is_cached_per_content_version(self):
+        self.assertEqual(self.render('first'), 'first')
+        self.assertEqual(self.render('second'), 'first')
+        self.assertEqual(self.render('second', page=2), 'second')
+        self.assertEqual(self.render('second', owner=8), 'second')
+
+        bump_content_version(7)
+        self.assertEqual(self.render('third'), 'third')
+
+        with override_settings(FRAGMENT_CACHE_ENABLED=False):
+            self.assertEqual(self.render('fourth'), 'fourth')
+
+    def test_anonymous_fragments_are_site_wide(self):
+        self.assertEqual(self.render('first', owner=None), 'first')
+        self.assertEqual(self.render('second', owner=None), 'first')
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class AssetPipelineTests(TestCase):
+    """build_assets bundles CSS/JS, extracts critical CSS and subsets icons"""
+
+    def setUp(self):
+        self.build = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.build)
+        settings_override = override_settings(ASSET_BUILD_DIR=Path(self.build))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_minify_css(self):
+        css = '/*! licence */\n/* note */\na > b ,\n.c {\n  content: "a  ;  b";\n  color: red;\n}\n'
+        self.assertEqual(minify_css(css), '/*! licence */a>b,.c{content:"a  ;  b";color:red}')
+
+    def test_critical_css_keeps_rules_the_markup_can_match(self):
+        markup = Markup.from_templates(['<nav class="navbar {% if x %}dark{% endif %} {{ y }}"><a id="top">'])
+        css = (
+            '.navbar{a:1}.card{a:2}.navbar .dark,.navbar .card{a:3}a:hover{a:4}#top:not(.x){a:5}'
+            '@media (min-width:992px){.navbar{a:6}.card{a:7}}@font-face{src:url(x.woff2)}.dark{background:url(x.png)}'
+        )
+        self.assertEqual(
+            critical_css(css, markup),
+            '.navbar{a:1}.navbar .dark{a:3}a:hover{a:4}#top:not(.x){a:5}@media (min-width:992px){.navbar{a:6}}',
+        )
+
+    @mock.patch('core.assets.font_subset', None)
+    def test_icons_are_cut_down_to_the_used_ones(self):
+        webfonts = Path(self.build) / 'webfonts'
+        webfonts.mkdir()
+        (webfonts / 'fa-solid-900.woff2').write_bytes(b'font')
+        (Path(self.build) / 'fonts').mkdir()
+        css = (
+            '/*! FA */.fa{display:inline-block}'
+            '@font-face{font-family:"FA";src:url(../webfonts/fa-solid-900.woff2) format("woff2"),url(../webfonts/fa-solid-900.ttf)}'
+            '.fa-user:before{content:"\\f007"}.fa-code:before,.fa-laptop-code:before{content:"\\f121"}'
+        )
+        icons = build_icon_css(css, {'fa-code', 'user'}, webfonts, Path(self.build) / 'fonts')
+        self.assertEqual(icons, (
+            '/*! FA */.fa{display:inline-block}'
+            '@font-face{font-family:"FA";src:url(fonts/fa-solid-900.woff2) format("woff2")}'
+            '.fa-user:before{content:"\\f007"}.fa-code:before{content:"\\f121"}'
+        ))
+        self.assertTrue((Path(self.build) / 'fonts' / 'fa-solid-900.woff2').exists())
+
+        # Without the webfonts the CDN stays in use
+        self.assertIsNone(build_icon_css(css, set(), Path(self.build) / 'missing', Path(self.build) / 'fonts'))
+
+    def test_pages_link_the_bundles_once_built(self):
+        template = Template('{% load assets %}{% asset_styles %}{% asset_scripts %}')
+        with override_settings(ASSET_BUNDLES_ENABLED=True):
+            html = template.render(Context())
+            self.assertIn('/static/core/css/bootstrap', html)  # not built yet: the sources
+
+            call_command('build_assets', stdout=io.StringIO())
+            html = template.render(Context())
+        self.assertNotIn('/static/core/css/bootstrap', html)
+        self.assertIn('<style>:root,[data-bs-theme=light]{', html)
+        self.assertIn('<link rel="preload" href="/static/bundles/site.css" as="style"', html)
+        self.assertIn('<script src="/static/bundles/site.js" defer></script>', html)
+        self.assertIn('cdnjs.cloudflare.com', html)  # no webfonts in assets/ here
+
+        site_js = (Path(self.build) / 'site.js').read_text()
+        self.assertLess(site_js.index('Popper'), site_js.index('Bootstrap v5'))
+        self.assertNotIn('sourceMappingURL', site_js)
+
+
+class PortfolioQueryPlanTests(QueryPlanTestCase):
+    """Per-user listing queries must be served by the composite indexes"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        for i in range(3):
+            Project.objects.create(
+                user=self.user, title=f'Site {i}', description='Portfolio site',
+                technologies='Python', is_featured=bool(i % 2),
+            )
+            Testimonial.objects.create(user=self.user, name=f'Bob {i}', position='CTO', testimonial='Great')
+        SocialLink.objects.create(user=self.user, platform='github', url='https://github.com/jane')
+        self.client.force_login(self.user)
+
+    def test_home_page(self):
+        self.assertPageUsesIndexes(reverse('home'))
+
+    def test_projects_list(self):
+        # The tag cloud sorts by count (a temp B-tree by nature) and is cached
+        # per content version, so plans are checked with it already cached
+        self.client.get(reverse('projects'))
+        self.assertPageUsesIndexes(reverse('projects'))
+
+    def test_projects_by_technology(self):
+        self.client.get(reverse('projects'))
+        self.assertPageUsesIndexes(reverse('projects') + '?tech=python')
+
+    def test_project_detail(self):
+        project = Project.objects.filter(user=self.user).first()
+        self.assertPageUsesIndexes(reverse('project_detail', kwargs={'slug': project.slug}))
+
+
+class FakeClock:
+    """Stands in for the ``time`` module; sleeping just advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return 1_700_000_000 + self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(SimpleTestCase):
+    """The shared GitHub rate limiter paces requests and follows GitHub's headers"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('core.github_utils.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+        # Refill is capped at the capacity
+        self.clock.now += 60
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5, 0.5])
+
+    def test_release_returns_a_token(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+        bucket.release()
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.release()
+        bucket.release()
+        self.assertEqual(bucket.tokens, 1)
+
+    def test_headers_lower_the_estimate_and_block_until_reset(self):
+        bucket = TokenBucket(rate=1, capacity=50)
+        bucket.update_from_headers({})
+        self.assertEqual(bucket.tokens, 50)
+        bucket.update_from_headers({'X-RateLimit-Remaining': '3'})
+        self.assertEqual(bucket.tokens, 3)
+        bucket.update_from_headers({'X-RateLimit-Remaining': '10'})
+        self.assertEqual(bucket.tokens, 3)  # never raised above the local count
+
+        reset = int(self.clock.time()) + 30
+        bucket.update_from_headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)})
+        bucket.acquire()
+        self.assertEqual(sum(self.clock.sleeps), 30)
+
+
+class StubGitHubHandler(BaseHTTPRequestHandler):
+    """Serves two pages of repositories plus details/languages with ETags"""
+
+    REPOS = [
+        {'name': f'repo-{i}', 'html_url': f'https://github.com/jane/repo-{i}',
+         'stargazers_count': i, 'forks_count': 0, 'language': 'Python',
+         'updated_at': '2024-01-01T00:00:00Z', 'pushed_at': '2024-01-01T00:00:00Z'}
+        for i in range(3)
+    ]
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        link = None
+        if path == '/users/jane/repos':
+            page = 2 if 'page=2' in query else 1
+            body = self.REPOS[:2] if page == 1 else self.REPOS[2:]
+            if page == 1:
+                link = f'<http://{self.headers["Host"]}/users/jane/repos?page=2>; rel="next"'
+        elif path.endswith('/languages'):
+            body = {'Python': 100}
+        else:
+            name = path.rsplit('/', 1)[-1]
+            body = next(repo for repo in self.REPOS if repo['name'] == name)
+
+        etag = f'"{path}?{query}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        if link:
+            self.send_header('Link', link)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class GitHubSyncTests(TestCase):
+    """GitHub sync against a local stub server"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubGitHubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def make_api(self):
+        return GitHubAPI(username='jane', token='', base_url=self.base_url, max_workers=4)
+
+    def test_follows_pagination(self):
+        api = self.make_api()
+        projects = api.sync_all_repos()
+        self.assertEqual(len(projects), 3)
+        # 2 listing pages + details and languages for 3 repos
+        self.assertEqual(api.stats.requests_made, 8)
+        self.assertEqual(api.stats.not_modified, 0)
+
+    def test_second_run_is_conditional(self):
+        self.make_api().sync_all_repos()
+        api = self.make_api()
+        projects = api.sync_all_repos()
+        self.assertEqual(len(projects), 3)
+        # Only the listing pages are re-requested, and both come back 304
+        self.assertEqual(api.stats.requests_made, 2)
+        self.assertEqual(api.stats.not_modified, 2)
+        self.assertEqual(api.stats.skipped, 6)
+
+    def test_not_modified_responses_do_not_use_the_quota(self):
+        self.make_api().sync_all_repos()
+        bucket = TokenBucket(rate=1e-9, capacity=10)
+        api = GitHubAPI(username='jane', token='', base_url=self.base_url, rate_limiter=bucket)
+        api.sync_all_repos()
+        self.assertEqual(api.stats.not_modified, 2)
+        self.assertAlmostEqual(bucket.tokens, 10)
+
+    def test_workers_needs_all_users(self):
+        with self.assertRaises(CommandError):
+            call_command('sync_github', '--workers', '2', stdout=io.StringIO())
+
+    def test_batch_sync_only_writes_changed_rows(self):
+        self.make_api().sync_all_repos()
+        Project.objects.filter(github_repo_name='repo-1').update(github_stars=99)
+
+        api = self.make_api()
+        with self.assertNumQueries(6):
+            # response cache, project diff, transaction savepoint pair,
+            # bulk_update and the search index upsert
+            api.sync_all_repos()
+        self.assertEqual((api.stats.created, api.stats.updated), (0, 1))
+        self.assertEqual(Project.objects.get(github_repo_name='repo-1').github_stars, 1)
+
+    def test_batch_sync_allocates_unique_slugs(self):
+        Project.objects.create(title='Repo 0', description='x', technologies='x')
+        self.make_api().sync_all_repos()
+        slugs = sorted(Project.objects.values_list('slug', flat=True))
+        self.assertEqual(slugs, ['repo-0', 'repo-0-1', 'repo-1', 'repo-2'])
+
+    def test_scheduler_attributes_projects_to_users(self):
+        jane = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        jane.user_profile.github_username = 'jane'
+        jane.user_profile.save()
+        User.objects.create_user('bob', 'bob@example.com', 'pass12345')  # no GitHub username
+
+        with override_settings(GITHUB_API_URL=self.base_url):
+            scheduler = GitHubSyncScheduler(workers=1, log=lambda message: None)
+            cursors = scheduler.run_once()
+            self.assertEqual(scheduler.run_once(), [])  # not due again yet
+
+        self.assertEqual([cursor.user for cursor in cursors], [jane])
+        self.assertEqual(Project.objects.filter(user=jane).count(), 3)
+        cursor = GitHubSyncCursor.objects.get(user=jane)
+        self.assertEqual((cursor.repos_synced, cursor.last_error), (3, ''))
+
+    def test_scheduler_failure_for_one_user_does_not_stop_the_rest(self):
+        for username in ('bob', 'jane'):
+            user = User.objects.create_user(username, f'{username}@example.com', 'pass12345')
+            user.user_profile.github_username = username
+            user.user_profile.save()
+        save = GitHubSyncCursor.save
+
+        def failing_save(cursor, *args, **kwargs):
+            if cursor.github_username == 'bob':
+                raise DatabaseError('database is locked')
+            return save(cursor, *args, **kwargs)
+
+        messages = []
+        with override_settings(GITHUB_API_URL=self.base_url), \
+                mock.patch.object(GitHubSyncCursor, 'save', autospec=True, side_effect=failing_save):
+            cursors = GitHubSyncScheduler(workers=1, log=messages.append).run_once()
+
+        self.assertEqual([cursor.github_username for cursor in cursors], ['jane'])
+        self.assertEqual(Project.objects.filter(user__username='jane').count(), 3)
+        self.assertIn('Sync of bob failed: database is locked', messages)
+        self.assertTrue(messages[-1].startswith('Synced 2 user(s), 1 failed'))
@@ -2,16 +2,20 @@
 Core App URLs
 """
 
+from django.conf import settings
 from django.urls import path
 from . import views
 from .views import ProjectCreateView, ProjectUpdateView, ProjectDeleteView, ProjectListView, ProjectDetailView
 
 urlpatterns = [
     # Homepage
-    path('', views.home_page, name='home'),
+    path('', views.ahome_page if settings.ASYNC_VIEWS else views.home_page, name='home'),
 
     # About
-    path('about/', views.about_page, name='about'),
+    path('about/', views.aabout_page if settings.ASYNC_VIEWS else views.about_page, name='about'),
+
+    # Search
+    path('search/', views.search_page, name='search'),
 
     # Profile
     path('profile/edit/', views.ProfileUpdateView.as_view(), name='profile_edit'),
@@ -8,47 +8,56 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.conf import settings
-from .models import Profile, Project, SocialLink, Testimonial
+from .models import Profile, Project, SearchDocument
 from .forms import ProjectForm, ProfileForm
+from .public import apublic_page, arender_public_page, public_page, render_public_page
+from .routers import ReplicaReadMixin, replica_reads
+from .search import search
+from .shortcuts import arender
+from .technologies import filter_by_technology, get_technology_cloud
+
+
+def _home_context(portfolio):
+    return {
+        'profile': portfolio.profile,
+        'featured_projects': portfolio.featured_projects,
+        'social_links': portfolio.social_links,
+        'testimonials': portfolio.testimonials,
+        'site_name': settings.SITE_NAME,
+        'site_tagline': settings.SITE_TAGLINE,
+        'home': 'active',
+    }
 
 
+@replica_reads
 def home_page(request):
     """Homepage view with featured content"""
 
-    # Get profile based on whether user is authenticated
-    if request.user.is_authenticated:
-        profile = Profile.objects.filter(user=request.user, is_active=True).first()
-        # Get user's featured projects
-        featured_projects = Project.objects.filter(
-            user=request.user,
-            is_active=True,
-            is_featured=True
-        )[:6]
-        # Get user's social links
-        social_links = SocialLink.objects.filter(user=request.user, is_active=True)
-        # Get user's testimonials
-        testimonials = Testimonial.objects.filter(user=request.user, is_active=True)[:3]
-    else:
-        # For non-authenticated users, show nothing or default content
-        profile = None
-        featured_projects = []
-        social_links = []
-        testimonials = []
+    # Loaded once per request and shared with the context processors
+    # (see core.middleware); empty for non-authenticated users
+    return render(request, 'core/core.html', _home_context(request.portfolio))
 
-    context = {
-        'profile': profile,
-        'featured_projects': featured_projects,
-        'social_links': social_links,
-        'testimonials': testimonials,
-        'site_name': settings.SITE_NAME,
-        'site_tagline': settings.SITE_TAGLINE,
-        'home': 'active',
-    }
 
-    return render(request, 'core/core.html', context)
+@replica_reads
+async def ahome_page(request):
+    """Async home_page (ASYNC_VIEWS)"""
+    return await arender(request, 'core/core.html', _home_context(await request.portfolio.aload()))
+
+
+@public_page('home')
+def public_home(request, owner):
+    """Public homepage for /u/<username>/"""
+    return render_public_page(request, 'core/core.html', _home_context(request.portfolio))
+
 
+@apublic_page('home')
+async def apublic_home(request, owner):
+    """Async public_home (ASYNC_VIEWS)"""
+    portfolio = await request.portfolio.aload()
+    return await arender_public_page(request, 'core/core.html', _home_context(portfolio))
 
-class ProjectListView(LoginRequiredMixin, ListView):
+
+class ProjectListView(ReplicaReadMixin, LoginRequiredMixin, ListView):
     """List all user's projects"""
     model = Project
     template_name = 'core/projects_list.html'
@@ -56,10 +65,20 @@ class ProjectListView(LoginRequiredMixin, ListView):
     paginate_by = 9
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user, is_active=True)
+        queryset = Project.objects.filter(user=self.request.user, is_active=True)
+        tech = self.request.GET.get('tech')
+        if tech:
+            queryset = filter_by_technology(queryset, tech)
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['technologies'] = get_technology_cloud(self.request.user)
+        context['active_technology'] = self.request.GET.get('tech', '')
+        return context
 
 
-class ProjectDetailView(LoginRequiredMixin, DetailView):
+class ProjectDetailView(ReplicaReadMixin, LoginRequiredMixin, DetailView):
     """Project detail view"""
     model = Project
     template_name = 'core/project_detail.html'
@@ -69,22 +88,79 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
         return Project.objects.filter(user=self.request.user, is_active=True)
 
 
+@replica_reads
 def about_page(request):
     """About page view"""
 
-    if request.user.is_authenticated:
-        profile = Profile.objects.filter(user=request.user, is_active=True).first()
-    else:
-        profile = None
-
     context = {
-        'profile': profile,
+        'profile': request.portfolio.profile,
         'about': 'active',
     }
 
     return render(request, 'core/about.html', context)
 
 
+@replica_reads
+async def aabout_page(request):
+    """Async about_page (ASYNC_VIEWS)"""
+
+    portfolio = await request.portfolio.aload()
+    context = {
+        'profile': portfolio.profile,
+        'about': 'active',
+    }
+
+    return await arender(request, 'core/about.html', context)
+
+
+@public_page('about')
+def public_about(request, owner):
+    """Public about page for /u/<username>/about/"""
+
+    context = {
+        'profile': request.portfolio.profile,
+        'about': 'active',
+    }
+
+    return render_public_page(request, 'core/about.html', context)
+
+
+@apublic_page('about')
+async def apublic_about(request, owner):
+    """Async public_about (ASYNC_VIEWS)"""
+
+    portfolio = await request.portfolio.aload()
+    context = {
+        'profile': portfolio.profile,
+        'about': 'active',
+    }
+
+    return await arender_public_page(request, 'core/about.html', context)
+
+
+@replica_reads
+def search_page(request):
+    """Ranked search across the user's projects, services, skills and certifications"""
+
+    query = request.GET.get('q', '').strip()
+    kind = request.GET.get('kind', '')
+    kinds = [kind] if kind in dict(SearchDocument.KIND_CHOICES) else None
+
+    results = []
+    if query and request.user.is_authenticated:
+        results = search(query, user=request.user, kinds=kinds)
+
+    context = {
+        'query': query,
+        'kind': kind,
+        'kinds': SearchDocument.KIND_CHOICES,
+        'results': results,
+        'search': 'active',
+    }
+
+    return render(request, 'core/search.html', context)
+
+
 # ==============================================================================
 # PROJECT CRUD VIEWS
 # ==============================================================================
@@ -4,11 +4,12 @@ Education App Admin Configuration
 
 from django.contrib import admin
 from django.utils.html import format_html
+from core.search import SearchIndexAdminMixin
 from .models import Skill, Education, Certification
 
 
 @admin.register(Skill)
-class SkillAdmin(admin.ModelAdmin):
+class SkillAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
     """Admin interface for Skills"""
 
     list_display = [
@@ -143,7 +144,7 @@ class EducationAdmin(admin.ModelAdmin):
 
 
 @admin.register(Certification)
-class CertificationAdmin(admin.ModelAdmin):
+class CertificationAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
     """Admin interface for Certifications"""
 
     list_display = [
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0002_certification_user_education_user_skill_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'order', '-issue_date'], name='certification_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'order', '-start_date'], name='education_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'order', 'category', '-proficiency'], name='skill_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'category', 'order', '-proficiency'], name='skill_user_category_idx'),
+        ),
+    ]
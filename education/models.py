@@ -21,6 +21,17 @@ class Skill(models.Model):
         ('other', 'Other'),
     ]
 
+    # FontAwesome icon shown in each category header
+    CATEGORY_ICONS = {
+        'frontend': 'fab fa-html5',
+        'backend': 'fas fa-server',
+        'database': 'fas fa-database',
+        'devops': 'fas fa-cogs',
+        'design': 'fas fa-palette',
+        'soft': 'fas fa-users',
+        'other': 'fas fa-star',
+    }
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='skills', null=True, blank=True)
 
     name = models.CharField(max_length=100, help_text="Skill name")
@@ -67,10 +78,46 @@ class Skill(models.Model):
         verbose_name = "Skill"
         verbose_name_plural = "Skills"
         ordering = ['order', 'category', '-proficiency']
+        indexes = [
+            models.Index(
+                fields=['user', 'order', 'category', '-proficiency'],
+                condition=models.Q(is_active=True),
+                name='skill_user_active_idx',
+            ),
+            models.Index(
+                fields=['user', 'category', 'order', '-proficiency'],
+                condition=models.Q(is_active=True),
+                name='skill_user_category_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.proficiency}%) - {self.user.username}"
 
+    @classmethod
+    def group_by_category(cls, skills):
+        """
+        Group already-ordered skills into [{'key', 'label', 'icon', 'skills'}, ...]
+
+        Groups follow the order of SKILL_CATEGORIES and empty categories are
+        left out; skills keep their order within each group.
+        """
+        labels = dict(cls.SKILL_CATEGORIES)
+        grouped = {key: [] for key in labels}
+        for skill in skills:
+            grouped.setdefault(skill.category, []).append(skill)
+
+        return [
+            {
+                'key': key,
+                'label': labels.get(key, key.title()),
+                'icon': cls.CATEGORY_ICONS.get(key, 'fas fa-star'),
+                'skills': category_skills,
+            }
+            for key, category_skills in grouped.items()
+            if category_skills
+        ]
+
     def get_proficiency_label(self):
         """Return proficiency level as label"""
         if self.proficiency >= 90:
@@ -147,6 +194,13 @@ class Education(models.Model):
         verbose_name = "Education"
         verbose_name_plural = "Education"
         ordering = ['order', '-start_date']
+        indexes = [
+            models.Index(
+                fields=['user', 'order', '-start_date'],
+                condition=models.Q(is_active=True),
+                name='education_user_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_degree_display()} in {self.field_of_study} - {self.institution} ({self.user.username})"
@@ -201,6 +255,13 @@ class Certification(models.Model):
         verbose_name = "Certification"
         verbose_name_plural = "Certifications"
         ordering = ['order', '-issue_date']
+        indexes = [
+            models.Index(
+                fields=['user', 'order', '-issue_date'],
+                condition=models.Q(is_active=True),
+                name='certification_user_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.issuing_organization} ({self.user.username})"
@@ -0,0 +1,20 @@
+"""
+Education App Signals
+Invalidate cached portfolio bundles when skills, education or certifications change
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.cache import bump_content_version
+from .models import Skill, Education, Certification
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+@receiver(post_save, sender=Certification)
+@receiver(post_delete, sender=Certification)
+def invalidate_portfolio_bundles(sender, instance, **kwargs):
+    """Drop the owner's cached portfolio bundles"""
+    bump_content_version(instance.user_id)
@@ -1,3 +1,39 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from core.testing import QueryPlanTestCase
+from education.models import Certification, Education, Skill
+
+
+class SkillsQueryPlanTests(QueryPlanTestCase):
+    """Skills page queries must be served by the composite indexes"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        for category, _ in Skill.SKILL_CATEGORIES:
+            Skill.objects.create(user=self.user, name=category.title(), category=category, proficiency=80)
+        Education.objects.create(
+            user=self.user, institution='MIT', degree='bachelors',
+            field_of_study='CS', start_date=date(2015, 9, 1),
+        )
+        Certification.objects.create(
+            user=self.user, name='AWS', issuing_organization='Amazon', issue_date=date(2020, 1, 1),
+        )
+        self.client.force_login(self.user)
+
+    def test_skills_page(self):
+        self.assertPageUsesIndexes(reverse('skills'))
+
+    def test_skills_page_query_budget(self):
+        self.client.get(reverse('home'))  # warm the navbar's portfolio snapshot
+
+        # session + user + skills, education and certifications
+        response = self.assertPageWithinBudget(reverse('skills'), 5)
+        labels = [group['label'] for group in response.context['skill_groups']]
+        self.assertEqual(labels, [label for _, label in Skill.SKILL_CATEGORIES])
+
+        # Warm cache: only the session and user lookups
+        self.assertPageWithinBudget(reverse('skills'), 2)
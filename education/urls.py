@@ -2,6 +2,7 @@
 Education App URLs
 """
 
+from django.conf import settings
 from django.urls import path
 from . import views
 from .views import SkillCreateView, SkillUpdateView, SkillDeleteView,EducationCreateView, EducationUpdateView, EducationDeleteView,CertificationCreateView, CertificationUpdateView, CertificationDeleteView
@@ -10,7 +11,7 @@ from .views import SkillCreateView, SkillUpdateView, SkillDeleteView,EducationCr
 
 urlpatterns = [
     # Skills List
-    path('', views.skills_pro, name='skills'),
+    path('', views.askills_pro if settings.ASYNC_VIEWS else views.skills_pro, name='skills'),
     path('list/', views.SkillsListView.as_view(), name='skills_list'),
 
     # Skills CRUD
@@ -2,67 +2,97 @@
 Education App Views
 """
 
+import asyncio
+
 from django.shortcuts import render
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.urls import reverse_lazy
+from core.cache import aget_user_bundle, alist, get_user_bundle
+from core.public import apublic_page, arender_public_page, public_page, render_public_page
+from core.routers import ReplicaReadMixin, replica_reads
+from core.shortcuts import aget_user, arender
 from .models import Skill, Education, Certification
 from .forms import SkillForm, EducationForm, CertificationForm
 
 
-def skills_pro(request):
-    """Skills page view"""
+def _skills_querysets(user):
+    return (
+        Skill.objects.filter(user=user, is_active=True),
+        Education.objects.filter(user=user, is_active=True),
+        Certification.objects.filter(user=user, is_active=True),
+    )
 
-    if request.user.is_authenticated:
-        # Get user's skills by category
-        skills = Skill.objects.filter(user=request.user, is_active=True)
-
-        # Group skills by category
-        frontend_skills = skills.filter(category='frontend')
-        backend_skills = skills.filter(category='backend')
-        database_skills = skills.filter(category='database')
-        devops_skills = skills.filter(category='devops')
-        design_skills = skills.filter(category='design')
-        soft_skills = skills.filter(category='soft')
-        other_skills = skills.filter(category='other')
-
-        # Get user's education
-        education = Education.objects.filter(user=request.user, is_active=True)
-
-        # Get user's certifications
-        certifications = Certification.objects.filter(user=request.user, is_active=True)
-    else:
-        skills = []
-        frontend_skills = []
-        backend_skills = []
-        database_skills = []
-        devops_skills = []
-        design_skills = []
-        soft_skills = []
-        other_skills = []
-        education = []
-        certifications = []
-
-    context = {
+
+def _skills_page(skills, education, certifications):
+    return {
         'skills': skills,
-        'frontend_skills': frontend_skills,
-        'backend_skills': backend_skills,
-        'database_skills': database_skills,
-        'devops_skills': devops_skills,
-        'design_skills': design_skills,
-        'soft_skills': soft_skills,
-        'other_skills': other_skills,
+        'skill_groups': Skill.group_by_category(skills),
         'education': education,
         'certifications': certifications,
+    }
+
+
+def _skills_context(page):
+    return {
+        **page,
         'p': 'Skills & Education',
         'skills_active': 'active',
     }
 
-    return render(request, 'skills/skills.html', context)
+
+def build_skills_page(user):
+    """Load the skills page data: one query each for skills, education and certifications"""
+    return _skills_page(*(list(queryset) for queryset in _skills_querysets(user)))
+
+
+async def abuild_skills_page(user):
+    """Async build_skills_page: the three queries are issued together"""
+    return _skills_page(*await asyncio.gather(*(alist(queryset) for queryset in _skills_querysets(user))))
+
+
+@replica_reads
+def skills_pro(request):
+    """Skills page view"""
+
+    if request.user.is_authenticated:
+        # Cached per user and invalidated on any content change (see core.cache)
+        page = get_user_bundle(request.user, 'skills', build_skills_page)
+    else:
+        page = _skills_page([], [], [])
+
+    return render(request, 'skills/skills.html', _skills_context(page))
+
+
+@replica_reads
+async def askills_pro(request):
+    """Async skills_pro (ASYNC_VIEWS)"""
+
+    user = await aget_user(request)
+    if user.is_authenticated:
+        page = await aget_user_bundle(user, 'skills', abuild_skills_page)
+    else:
+        page = _skills_page([], [], [])
+
+    return await arender(request, 'skills/skills.html', _skills_context(page))
+
+
+@public_page('skills')
+def public_skills(request, owner):
+    """Public skills page for /u/<username>/skills/"""
+    page = get_user_bundle(owner, 'skills', build_skills_page)
+    return render_public_page(request, 'skills/skills.html', _skills_context(page))
+
+
+@apublic_page('skills')
+async def apublic_skills(request, owner):
+    """Async public_skills (ASYNC_VIEWS)"""
+    page = await aget_user_bundle(owner, 'skills', abuild_skills_page)
+    return await arender_public_page(request, 'skills/skills.html', _skills_context(page))
 
 
-class SkillsListView(LoginRequiredMixin, ListView):
+class SkillsListView(ReplicaReadMixin, LoginRequiredMixin, ListView):
     """Alternative class-based view for skills"""
     model = Skill
     template_name = 'skills/skills_list.html'
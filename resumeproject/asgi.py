@@ -12,5 +12,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resumeproject.settings")
+# Serve the public read paths with their async views
+os.environ.setdefault("ASYNC_VIEWS", "True")
+# Async views run the ORM in a thread per request, so persistent connections
+# would pile up; put PgBouncer in front of PostgreSQL instead
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
 
 application = get_asgi_application()
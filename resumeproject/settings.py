@@ -86,12 +86,14 @@ if DEBUG:
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # Static files for production
+    "core.middleware.AsyncWhiteNoiseMiddleware",  # Static files for production (WhiteNoise)
+    "core.middleware.ReplicaRoutingMiddleware",  # Read replicas (before sessions)
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.PortfolioMiddleware",  # request.portfolio (after auth)
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -107,12 +109,21 @@ if DEBUG:
 
 ROOT_URLCONF = "resumeproject.urls"
 
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [TEMPLATES_DIR],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Production compiles each template once per process; development
+            # re-reads templates so edits show up without a restart
+            "loaders": TEMPLATE_LOADERS if DEBUG else [
+                ("django.template.loaders.cached.Loader", TEMPLATE_LOADERS),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -120,22 +131,85 @@ TEMPLATES = [
                 "django.contrib.messages.context_processors.messages",
                 "core.context_processors.site_settings",
                 "core.context_processors.profile_context",
+                "core.context_processors.navigation",
             ],
         },
     },
 ]
 
+# {% portfolio_cache %} fragments (navbar, project grids, testimonials)
+FRAGMENT_CACHE_ENABLED = config('FRAGMENT_CACHE_ENABLED', default=True, cast=bool)
+
 WSGI_APPLICATION = "resumeproject.wsgi.application"
+ASGI_APPLICATION = "resumeproject.asgi.application"
+# Route the public read paths to their async views; resumeproject.asgi turns
+# this on (under WSGI every async view would start its own event loop)
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
 
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DB_ENGINE selects the profile (see core.db): 'sqlite' for a single server,
+# 'postgresql' for everything else
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+# Seconds a connection is reused across requests (0 closes it after each request)
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=600, cast=int)
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": config('DB_NAME', default='portfolio'),
+            "USER": config('DB_USER', default='portfolio'),
+            "PASSWORD": config('DB_PASSWORD', default=''),
+            "HOST": config('DB_HOST', default='localhost'),
+            "PORT": config('DB_PORT', default='5432'),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            # Ping a reused connection first: a restarted server means a reconnect, not a 500
+            "CONN_HEALTH_CHECKS": True,
+            # PgBouncer in transaction mode cannot keep .iterator()'s server-side cursors open
+            "DISABLE_SERVER_SIDE_CURSORS": config('DB_PGBOUNCER', default=False, cast=bool),
+            "OPTIONS": {
+                "connect_timeout": config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+                "application_name": "portfolio",
+            },
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": config('DB_NAME', default=str(BASE_DIR / "db.sqlite3")),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+        }
     }
+
+# Read replicas: comma-separated hosts (PostgreSQL) or database files (SQLite),
+# used by views marked read-only (see core.routers)
+DB_REPLICAS = config('DB_REPLICAS', default='', cast=Csv())
+for number, replica in enumerate(DB_REPLICAS, start=1):
+    DATABASES[f"replica{number}"] = {
+        **DATABASES["default"],
+        "HOST" if DB_ENGINE == 'postgresql' else "NAME": replica,
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+# After a write, the writer (and new cache entries) read from the primary this
+# long; keep it above the worst replication lag
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=10, cast=int)
+
+# Applied to every new SQLite connection (core.db)
+SQLITE_PRAGMAS = {
+    'journal_mode': config('SQLITE_JOURNAL_MODE', default='WAL'),
+    'synchronous': config('SQLITE_SYNCHRONOUS', default='NORMAL'),
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+    # Milliseconds to wait for a lock before "database is locked"
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+    # Negative: KiB of page cache per connection
+    'cache_size': -config('SQLITE_CACHE_KB', default=20000, cast=int),
+    'temp_store': 'MEMORY',
 }
 
 
@@ -178,10 +252,42 @@ STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [STATIC_DIR] if STATIC_DIR.exists() else []
 
+# Front-end bundles built by `manage.py build_assets` (see core.assets)
+ASSETS_DIR = BASE_DIR / 'assets'
+# Build output, served as static/bundles/ by the app directories finder (not in git)
+ASSET_BUILD_DIR = BASE_DIR / 'core' / 'static' / 'bundles'
+# Pages link the bundles instead of the source files (run build_assets first)
+ASSET_BUNDLES_ENABLED = config('ASSET_BUNDLES_ENABLED', default=not DEBUG, cast=bool)
+# Bundle sources, in load order (Popper must precede Bootstrap)
+ASSET_BUNDLES = {
+    'css': [
+        'core/css/bootstrap.css',
+        'core/css/style.css',
+        'core/css/layout.css',
+    ],
+    'js': [
+        'core/javascript/pooper.js',
+        'core/javascript/bootstrap.js',
+        'core/javascript/jqeury.js',
+        'core/javascript/core.js',
+    ],
+}
+# Templates rendered above the fold on every page: their CSS rules are inlined
+ASSET_CRITICAL_TEMPLATES = ['core/base.html', 'core/_navbar.html']
+# Self-hosted web fonts, read from assets/fonts/ (Google Fonts stay in use until present)
+ASSET_FONTS = [
+    {'family': 'Inter', 'weight': '300 700', 'file': 'Inter-Variable.woff2'},
+    {'family': 'Satisfy', 'weight': '400', 'file': 'Satisfy-Regular.woff2'},
+]
+# Keep only the FontAwesome icons templates, code and icon_class fields use;
+# icons typed into icon_class after a build need another build_assets
+ASSET_SUBSET_ICONS = config('ASSET_SUBSET_ICONS', default=True, cast=bool)
+
 # WhiteNoise configuration for production
 STORAGES = {
+    # Uploads are deduplicated and named by SHA-256 (see core.storage)
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "core.storage.ContentAddressedStorage",
     },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -191,6 +297,31 @@ STORAGES = {
 # Media files (user uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Hashed media names never change their bytes (see core.media)
+MEDIA_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+# gc_media keeps unreferenced files younger than this; their row may not be committed yet
+MEDIA_GC_GRACE = config('MEDIA_GC_GRACE', default=24 * 60 * 60, cast=int)
+# Who may see an upload is cached this long per file (see core.media)
+MEDIA_ACCESS_CACHE_TIMEOUT = config('MEDIA_ACCESS_CACHE_TIMEOUT', default=5 * 60, cast=int)
+# Hand media downloads to the web server after the access check:
+# '' streams from Django, 'nginx' sends X-Accel-Redirect, 'sendfile' sends X-Sendfile
+MEDIA_ACCEL_MODE = config('MEDIA_ACCEL_MODE', default='')
+# nginx internal location aliasing MEDIA_ROOT (MEDIA_ACCEL_MODE=nginx)
+MEDIA_ACCEL_PREFIX = config('MEDIA_ACCEL_PREFIX', default='/protected-media/')
+
+# Responsive image variants (see core.images / manage.py process_images)
+IMAGE_VARIANT_WIDTHS = (64, 160, 320, 640, 1280)
+IMAGE_VARIANT_DIR = 'variants'
+IMAGE_WEBP_QUALITY = config('IMAGE_WEBP_QUALITY', default=80, cast=int)
+IMAGE_JPEG_QUALITY = config('IMAGE_JPEG_QUALITY', default=82, cast=int)
+IMAGE_WORKER_BATCH_SIZE = config('IMAGE_WORKER_BATCH_SIZE', default=20, cast=int)
+IMAGE_WORKER_MAX_ATTEMPTS = config('IMAGE_WORKER_MAX_ATTEMPTS', default=3, cast=int)
+IMAGE_WORKER_RETRY_DELAY = config('IMAGE_WORKER_RETRY_DELAY', default=60, cast=int)
+IMAGE_WORKER_MAX_RETRY_DELAY = config('IMAGE_WORKER_MAX_RETRY_DELAY', default=60 * 60, cast=int)
+# Rows stuck in "processing" this long (crashed worker) are picked up again
+IMAGE_WORKER_LEASE = config('IMAGE_WORKER_LEASE', default=10 * 60, cast=int)
+# Unprocessed images are re-checked this often by the template tag
+IMAGE_PENDING_CACHE_TIMEOUT = config('IMAGE_PENDING_CACHE_TIMEOUT', default=60, cast=int)
 
 # ==============================================================================
 # EMAIL CONFIGURATION
@@ -205,6 +336,65 @@ EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default=EMAIL_HOST_USER)
 ADMIN_EMAIL = config('ADMIN_EMAIL', default='admin@example.com')
 
+# Outbound mail queue (see contact.mail_worker / manage.py run_mail_worker)
+MAIL_OUTBOX_BATCH_SIZE = config('MAIL_OUTBOX_BATCH_SIZE', default=50, cast=int)
+MAIL_OUTBOX_MAX_ATTEMPTS = config('MAIL_OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+MAIL_OUTBOX_RETRY_DELAY = config('MAIL_OUTBOX_RETRY_DELAY', default=60, cast=int)
+MAIL_OUTBOX_MAX_RETRY_DELAY = config('MAIL_OUTBOX_MAX_RETRY_DELAY', default=60 * 60, cast=int)
+# Rows stuck in "sending" this long (crashed worker) are picked up again
+MAIL_OUTBOX_LEASE = config('MAIL_OUTBOX_LEASE', default=10 * 60, cast=int)
+
+# Sliding-window limits for public POSTs (see contact.ratelimit):
+# route -> {scope: (max requests, window seconds)}. Scopes are the client IP
+# and the submitted email address.
+RATE_LIMIT_CACHE_ALIAS = 'default'
+# Reverse proxies in front of the app; the client IP is then read from
+# X-Forwarded-For that many entries from the right (0: use REMOTE_ADDR)
+RATE_LIMIT_TRUSTED_PROXIES = config('RATE_LIMIT_TRUSTED_PROXIES', default=0, cast=int)
+RATE_LIMITS = {
+    'contact': {
+        'ip': (config('RATE_LIMIT_CONTACT_IP', default=5, cast=int), 10 * 60),
+        'email': (config('RATE_LIMIT_CONTACT_EMAIL', default=3, cast=int), 60 * 60),
+    },
+    'newsletter': {
+        'ip': (config('RATE_LIMIT_NEWSLETTER_IP', default=10, cast=int), 60 * 60),
+        'email': (config('RATE_LIMIT_NEWSLETTER_EMAIL', default=3, cast=int), 60 * 60),
+    },
+}
+
+# Newsletter dispatch (see contact.newsletter / manage.py send_newsletter)
+NEWSLETTER_CHUNK_SIZE = config('NEWSLETTER_CHUNK_SIZE', default=2000, cast=int)
+NEWSLETTER_BATCH_SIZE = config('NEWSLETTER_BATCH_SIZE', default=100, cast=int)
+NEWSLETTER_RATE = config('NEWSLETTER_RATE', default=0, cast=float)  # messages/s, 0 = unlimited
+
+# ==============================================================================
+# CACHING
+# ==============================================================================
+
+# Local memory by default (tests, single process). In production point this at
+# a shared backend, e.g. CACHE_BACKEND=django_redis.cache.RedisCache with
+# CACHE_LOCATION=redis://127.0.0.1:6379/1, or
+# CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache with
+# CACHE_LOCATION=/var/tmp/portfolio_cache
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='portfolio'),
+    },
+}
+
+# Per-user portfolio snapshots (see core.cache)
+PORTFOLIO_CACHE_ALIAS = 'default'
+PORTFOLIO_CACHE_TIMEOUT = config('PORTFOLIO_CACHE_TIMEOUT', default=60 * 60, cast=int)
+
+# Public /u/<username>/ pages (see core.public). Browsers revalidate after
+# PUBLIC_PAGE_MAX_AGE seconds; unchanged pages are answered with a 304.
+PUBLIC_PAGE_MAX_AGE = config('PUBLIC_PAGE_MAX_AGE', default=0, cast=int)
+PUBLIC_OWNER_CACHE_TIMEOUT = config('PUBLIC_OWNER_CACHE_TIMEOUT', default=60 * 60, cast=int)
+
+# Rows fetched per database round trip by streaming exports (see core.exports)
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
 # ==============================================================================
 # THIRD-PARTY APP SETTINGS
 # ==============================================================================
@@ -236,6 +426,7 @@ SILENCED_SYSTEM_CHECKS = ['security.W019']
 
 GITHUB_USERNAME = config('GITHUB_USERNAME', default='')
 GITHUB_TOKEN = config('GITHUB_TOKEN', default='')
+GITHUB_API_URL = config('GITHUB_API_URL', default='https://api.github.com')  # override for a local stub server
 
 # ==============================================================================
 # SITE CONFIGURATION
@@ -4,10 +4,35 @@ URL configuration for resumeproject project.
 The `urlpatterns` list routes URLs to views. For more information please see:
     https://docs.djangoproject.com/en/5.0/topics/http/urls/
 """
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from core import views as core_views
+from core.media import serve_media
+from education import views as education_views
+from services import views as services_views
+
+# Usernames as allowed by Django's UnicodeUsernameValidator
+PUBLIC_USERNAME = r'^u/(?P<username>[\w.@+-]+)/'
+
+# Async variants for ASGI deployments (ASYNC_VIEWS)
+if settings.ASYNC_VIEWS:
+    public_views = {
+        'home': core_views.apublic_home,
+        'about': core_views.apublic_about,
+        'skills': education_views.apublic_skills,
+        'services': services_views.apublic_services,
+    }
+else:
+    public_views = {
+        'home': core_views.public_home,
+        'about': core_views.public_about,
+        'skills': education_views.public_skills,
+        'services': services_views.public_services,
+    }
 
 urlpatterns = [
     # Admin
@@ -23,11 +48,22 @@ urlpatterns = [
     path('services/', include('services.urls')),
     path('skills/', include('education.urls')),
     path('contact/', include('contact.urls')),
+
+    # Public portfolio pages (full-page cached, see core.public)
+    re_path(PUBLIC_USERNAME + r'$', public_views['home'], name='public_home'),
+    re_path(PUBLIC_USERNAME + r'about/$', public_views['about'], name='public_about'),
+    re_path(PUBLIC_USERNAME + r'skills/$', public_views['skills'], name='public_skills'),
+    re_path(PUBLIC_USERNAME + r'services/$', public_views['services'], name='public_services'),
 ]
 
-# Serve media files in development
+# Uploaded files, with per-user access checks (see core.media)
+if settings.MEDIA_URL.startswith('/'):
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.+)$' % re.escape(settings.MEDIA_URL.lstrip('/')), serve_media, name='media'),
+    ]
+
+# Serve static files in development
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
     # Debug toolbar
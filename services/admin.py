@@ -4,11 +4,14 @@ Services App Admin Configuration
 
 from django.contrib import admin
 from django.utils.html import format_html
+from core.cache import update_and_invalidate
+from core.exports import ExportActionsMixin
+from core.search import SearchIndexAdminMixin
 from .models import Service, ServiceInquiry
 
 
 @admin.register(Service)
-class ServiceAdmin(admin.ModelAdmin):
+class ServiceAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
     """Admin interface for Services"""
 
     list_display = [
@@ -68,19 +71,19 @@ class ServiceAdmin(admin.ModelAdmin):
 
     def make_featured(self, request, queryset):
         """Mark services as featured"""
-        updated = queryset.update(is_featured=True)
-        self.message_user(request, f'{updated} service(s) marked as featured.')
+        pks = update_and_invalidate(queryset, is_featured=True)
+        self.message_user(request, f'{len(pks)} service(s) marked as featured.')
     make_featured.short_description = 'Mark as featured'
 
     def remove_featured(self, request, queryset):
         """Remove featured status"""
-        updated = queryset.update(is_featured=False)
-        self.message_user(request, f'{updated} service(s) removed from featured.')
+        pks = update_and_invalidate(queryset, is_featured=False)
+        self.message_user(request, f'{len(pks)} service(s) removed from featured.')
     remove_featured.short_description = 'Remove featured status'
 
 
 @admin.register(ServiceInquiry)
-class ServiceInquiryAdmin(admin.ModelAdmin):
+class ServiceInquiryAdmin(ExportActionsMixin, admin.ModelAdmin):
     """Admin interface for Service Inquiries"""
 
     list_display = [
@@ -108,6 +111,11 @@ class ServiceInquiryAdmin(admin.ModelAdmin):
         }),
     )
 
+    export_fields = [
+        'id', 'created_at', 'service_id', 'name', 'email', 'phone', 'company',
+        'subject', 'message', 'budget', 'timeline', 'status',
+    ]
+
     actions = ['mark_as_contacted', 'mark_as_in_progress', 'mark_as_completed']
 
     def status_badge(self, obj):
@@ -3,7 +3,7 @@ Services App Forms
 """
 
 from django import forms
-from services.models import Service
+from services.models import Service, parse_features
 
 
 class ServiceForm(forms.ModelForm):
@@ -99,12 +99,7 @@ class ServiceForm(forms.ModelForm):
         return slug
 
     def clean_features(self):
-        """Clean and format features"""
+        """Clean and format features as one per line (parsed into features_list on save)"""
         features = self.cleaned_data.get('features', '')
-        if features:
-            # Split by newlines and remove empty lines
-            features_list = [f.strip() for f in features.split('\n') if f.strip()]
-            # Join back with newlines
-            return '\n'.join(features_list)
-        return features
+        return '\n'.join(parse_features(features))
 
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.6 on 2026-10-16 23:51
+
+from django.db import migrations, models
+
+
+def backfill_rendered_fields(apps, schema_editor):
+    """Parse features and format prices for existing services"""
+    Service = apps.get_model('services', 'Service')
+    services = list(Service.objects.only('features', 'price_starting', 'price_currency', 'pricing_model'))
+    for service in services:
+        text = service.features or ''
+        separator = '\n' if '\n' in text else ','
+        service.features_list = [f.strip() for f in text.split(separator) if f.strip()]
+        if service.price_starting:
+            label = f"{service.price_currency} {service.price_starting:,.2f}"
+            if service.pricing_model:
+                label += f" {service.pricing_model}"
+        else:
+            label = "Contact for pricing"
+        service.price_label = label
+    Service.objects.bulk_update(services, ['features_list', 'price_label'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0003_user_active_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='features_list',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='price_label',
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.RunPython(backfill_rendered_fields, migrations.RunPython.noop),
+    ]
@@ -5,11 +5,29 @@ Handles services offered, pricing, and features
 
 from django.db import models
 from django.contrib.auth.models import User
-from django.utils.text import slugify
 from django.urls import reverse
+from core.slugs import UniqueSlugMixin
 
 
-class Service(models.Model):
+def parse_features(text):
+    """Split features text into a list (one per line, or comma separated)"""
+    if not text:
+        return []
+    separator = '\n' if '\n' in text else ','
+    return [f.strip() for f in text.split(separator) if f.strip()]
+
+
+def format_price(price, currency, pricing_model=''):
+    """Human readable starting price, e.g. USD 1,500.00 per project"""
+    if not price:
+        return "Contact for pricing"
+    price_str = f"{currency} {price:,.2f}"
+    if pricing_model:
+        price_str += f" {pricing_model}"
+    return price_str
+
+
+class Service(UniqueSlugMixin, models.Model):
     """Services offered"""
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='services', null=True, blank=True)
@@ -65,6 +83,11 @@ class Service(models.Model):
         help_text="Service features/highlights (one per line or comma-separated)"
     )
 
+    # Rendered forms of the fields above, computed on save so templates
+    # never re-parse features or re-format prices
+    features_list = models.JSONField(default=list, blank=True, editable=False)
+    price_label = models.CharField(max_length=150, blank=True, editable=False)
+
     # Delivery
     delivery_time = models.CharField(
         max_length=100,
@@ -92,41 +115,46 @@ class Service(models.Model):
         verbose_name_plural = "Services"
         ordering = ['order', 'title']
         unique_together = [['user', 'slug']]
+        indexes = [
+            models.Index(
+                fields=['user', 'order', 'title'],
+                condition=models.Q(is_active=True),
+                name='service_user_active_idx',
+            ),
+            models.Index(
+                fields=['user', 'order', 'title'],
+                condition=models.Q(is_active=True, is_featured=True),
+                name='service_user_featured_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.user.username})"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Service.objects.filter(user=self.user, slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        return super().save(*args, **kwargs)
-
     def get_absolute_url(self):
         return reverse('service_detail', kwargs={'slug': self.slug})
 
+    def save(self, *args, **kwargs):
+        self.features_list = parse_features(self.features)
+        self.price_label = format_price(self.price_starting, self.price_currency, self.pricing_model)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'features' in update_fields:
+                update_fields.add('features_list')
+            if update_fields & {'price_starting', 'price_currency', 'pricing_model'}:
+                update_fields.add('price_label')
+            kwargs['update_fields'] = update_fields
+        return super().save(*args, **kwargs)
+
     def get_features_list(self):
-        """Return features as a list"""
-        if not self.features:
-            return []
-        # Support both newline and comma separation
-        if '\n' in self.features:
-            return [f.strip() for f in self.features.split('\n') if f.strip()]
-        return [f.strip() for f in self.features.split(',') if f.strip()]
+        """Return features as a list (parsed on save)"""
+        return self.features_list
 
     def get_price_display(self):
-        """Return formatted price"""
-        if self.price_starting:
-            price_str = f"{self.price_currency} {self.price_starting:,.2f}"
-            if self.pricing_model:
-                price_str += f" {self.pricing_model}"
-            return price_str
-        return "Contact for pricing"
+        """Return formatted price (formatted on save)"""
+        return self.price_label or format_price(self.price_starting, self.price_currency, self.pricing_model)
 
 
 class ServiceInquiry(models.Model):
@@ -0,0 +1,16 @@
+"""
+Services App Signals
+Invalidate cached portfolio bundles when services change
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.cache import bump_content_version
+from .models import Service
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def invalidate_portfolio_bundles(sender, instance, **kwargs):
+    """Drop the owner's cached portfolio bundles"""
+    bump_content_version(instance.user_id)
@@ -1,3 +1,60 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+from core.testing import QueryPlanTestCase
+from services.forms import ServiceForm
+from services.models import Service
+
+
+class ServicesQueryPlanTests(QueryPlanTestCase):
+    """Services page queries must be served by the composite indexes"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+        for i in range(3):
+            Service.objects.create(
+                user=self.user, title=f'Service {i}', short_description='Short',
+                description='Long', is_featured=bool(i % 2),
+            )
+        self.client.force_login(self.user)
+
+    def test_services_page(self):
+        self.assertPageUsesIndexes(reverse('services'))
+
+    def test_service_detail(self):
+        service = Service.objects.filter(user=self.user).first()
+        self.assertPageUsesIndexes(reverse('service_detail', kwargs={'slug': service.slug}))
+
+
+class ServiceRenderedFieldsTests(TestCase):
+    """Features and price labels are computed once, on save"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('jane', 'jane@example.com', 'pass12345')
+
+    def test_save_parses_features_and_formats_price(self):
+        service = Service.objects.create(
+            user=self.user, title='Web', short_description='Short', description='Long',
+            features='Design, Build ,, Deploy', price_starting=Decimal('1500'), pricing_model='per project',
+        )
+        service.refresh_from_db()
+        self.assertEqual(service.features_list, ['Design', 'Build', 'Deploy'])
+        self.assertEqual(service.price_label, 'USD 1,500.00 per project')
+
+        service.features = 'Audit\nReport'
+        service.price_starting = None
+        service.save(update_fields=['features', 'price_starting'])
+        service.refresh_from_db()
+        self.assertEqual(service.get_features_list(), ['Audit', 'Report'])
+        self.assertEqual(service.get_price_display(), 'Contact for pricing')
 
-# Create your tests here.
+    def test_form_normalizes_features(self):
+        form = ServiceForm(data={
+            'title': 'Web', 'short_description': 'Short', 'description': 'Long',
+            'icon_class': 'fas fa-code', 'color': 'primary', 'price_currency': 'USD',
+            'features': 'Design, Build', 'order': 0,
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['features'], 'Design\nBuild')
@@ -2,13 +2,14 @@
 Services App URLs
 """
 
+from django.conf import settings
 from django.urls import path
 from . import views
 
 
 urlpatterns = [
     # Services List
-    path('', views.services_pro, name='services'),
+    path('', views.aservices_pro if settings.ASYNC_VIEWS else views.services_pro, name='services'),
     path('list/', views.ServiceListView.as_view(), name='services_list'),
 
     # Services CRUD (create/edit/delete MUST come before detail with slug)
@@ -7,31 +7,80 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, D
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.urls import reverse_lazy
+from core.cache import aget_user_bundle, alist, get_user_bundle
+from core.public import apublic_page, arender_public_page, public_page, render_public_page
+from core.routers import ReplicaReadMixin, replica_reads
+from core.shortcuts import aget_user, arender
 from .models import Service
 from .forms import ServiceForm
 
 
+def _services_page(services):
+    return {
+        'services': services,
+        'featured_services': [service for service in services if service.is_featured],
+    }
+
+
+def _services_context(page):
+    return {
+        **page,
+        'p': 'Services',
+        'services_active': 'active',
+    }
+
+
+def build_services_page(user):
+    """Load the services page data with one query"""
+    return _services_page(list(Service.objects.filter(user=user, is_active=True)))
+
+
+async def abuild_services_page(user):
+    """Async build_services_page"""
+    return _services_page(await alist(Service.objects.filter(user=user, is_active=True)))
+
+
+@replica_reads
 def services_pro(request):
     """Services page view"""
 
     if request.user.is_authenticated:
-        services = Service.objects.filter(user=request.user, is_active=True)
-        featured_services = services.filter(is_featured=True)
+        # Cached per user and invalidated on any content change (see core.cache)
+        page = get_user_bundle(request.user, 'services', build_services_page)
     else:
-        services = []
-        featured_services = []
+        page = _services_page([])
+
+    return render(request, 'serve/serve.html', _services_context(page))
+
+
+@replica_reads
+async def aservices_pro(request):
+    """Async services_pro (ASYNC_VIEWS)"""
+
+    user = await aget_user(request)
+    if user.is_authenticated:
+        page = await aget_user_bundle(user, 'services', abuild_services_page)
+    else:
+        page = _services_page([])
+
+    return await arender(request, 'serve/serve.html', _services_context(page))
+
+
+@public_page('services')
+def public_services(request, owner):
+    """Public services page for /u/<username>/services/"""
+    page = get_user_bundle(owner, 'services', build_services_page)
+    return render_public_page(request, 'serve/serve.html', _services_context(page))
 
-    context = {
-        'services': services,
-        'featured_services': featured_services,
-        'p': 'Services',
-        'services_active': 'active',
-    }
 
-    return render(request, 'serve/serve.html', context)
+@apublic_page('services')
+async def apublic_services(request, owner):
+    """Async public_services (ASYNC_VIEWS)"""
+    page = await aget_user_bundle(owner, 'services', abuild_services_page)
+    return await arender_public_page(request, 'serve/serve.html', _services_context(page))
 
 
-class ServiceListView(LoginRequiredMixin, ListView):
+class ServiceListView(ReplicaReadMixin, LoginRequiredMixin, ListView):
     """List all user's services"""
     model = Service
     template_name = 'serve/services_list.html'
@@ -41,7 +90,7 @@ class ServiceListView(LoginRequiredMixin, ListView):
         return Service.objects.filter(user=self.request.user, is_active=True)
 
 
-class ServiceDetailView(LoginRequiredMixin, DetailView):
+class ServiceDetailView(ReplicaReadMixin, LoginRequiredMixin, DetailView):
     """Service detail view"""
     model = Service
     template_name = 'serve/service_detail.html'